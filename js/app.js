@@ -1,9 +1,64 @@
-const { createApp, ref, computed, onMounted, watch, nextTick } = Vue;
-
-createApp({
+const { createApp, ref, shallowRef, computed, onMounted, watch, nextTick } = Vue;
+
+// ── Data Chunks ──
+// `build-data.py --split` turns js/data.js into a DATA_MANIFEST of content-hashed
+// chunks; the default build defines every dataset up front and nothing is fetched.
+const DATA_SPLIT = typeof DATA_MANIFEST !== "undefined";
+const INITIAL_LANG = localStorage.getItem("lang") || "en";
+const dataChunkLoads = {};
+
+function loadDataChunk(name) {
+  if (!DATA_SPLIT || !DATA_MANIFEST[name]) return Promise.resolve();
+  if (!dataChunkLoads[name]) {
+    dataChunkLoads[name] = new Promise((resolve, reject) => {
+      const script = document.createElement("script");
+      script.src = DATA_MANIFEST[name];
+      script.onload = resolve;
+      script.onerror = () => {
+        delete dataChunkLoads[name];
+        reject(new Error(`Failed to load data chunk: ${name}`));
+      };
+      document.head.appendChild(script);
+    });
+  }
+  return dataChunkLoads[name];
+}
+
+function loadTranslations(code) {
+  return loadDataChunk(DATA_SPLIT && DATA_MANIFEST["translations-" + code] ? "translations-" + code : "translations-en");
+}
+
+// A js/data.js served from an earlier deploy can list chunks that have since been removed.
+// Reload once to pick up the current manifest; if that fails too, say so instead of
+// leaving the page blank or a button silently doing nothing.
+function dataLoadFailed(error) {
+  console.error(error);
+  if (!sessionStorage.getItem("dataReloaded")) {
+    sessionStorage.setItem("dataReloaded", "1");
+    location.reload();
+    return;
+  }
+  sessionStorage.removeItem("dataReloaded");
+  if (document.querySelector(".load-error")) return;
+  document.getElementById("app").insertAdjacentHTML("beforebegin", '<p class="load-error">The site data could not be loaded. Please try again later.</p>');
+}
+
+// `build-data.py --format interned` writes each author and venue name once, in
+// PUBLICATION_STRINGS, and PUBLICATIONS refers to them by position. They are expanded
+// once before mounting; the "decode-publications" measure shows the cost in DevTools.
+function decodePublications(pubs) {
+  if (typeof PUBLICATION_STRINGS === "undefined") return [...pubs];
+  const start = performance.now();
+  const { authors, venues } = PUBLICATION_STRINGS;
+  const decoded = pubs.map(p => ({ ...p, authors: p.authors.map(i => authors[i]), venue: venues[p.venue] }));
+  performance.measure("decode-publications", { start });
+  return decoded;
+}
+
+const app = createApp({
   setup() {
     // ── Reactive State ──
-    const lang = ref(localStorage.getItem("lang") || "en");
+    const lang = ref(INITIAL_LANG);
     const theme = ref(localStorage.getItem("theme") || (window.matchMedia("(prefers-color-scheme:dark)").matches ? "dark" : "light"));
     const menuOpen = ref(false);
     const pubFilter = ref("all");
@@ -13,7 +68,14 @@ createApp({
     const showAllAwards = ref(false);
     const showAllMedia = ref(false);
     const showAllNews = ref(false);
-    const publications = ref([...PUBLICATIONS]);
+    const publications = ref(decodePublications(PUBLICATIONS));
+    const lazyDataLoaded = ref(0); // bumped when a lazily loaded data chunk arrives
+    const pubQuery = ref("");
+    const talkQuery = ref("");
+    const mediaQuery = ref("");
+    const searchIndex = shallowRef(null);
+    // Search relies on both indexes emitted by build-data.py
+    const searchAvailable = typeof SEARCH_INDEX_URL !== "undefined" && typeof PUBLICATION_INDEX !== "undefined";
 
     // ── View Routing (hash-based) ──
     const currentView = ref(window.location.hash === '#personal' ? 'personal' : 'portfolio');
@@ -118,7 +180,46 @@ createApp({
       return p.year * 12;
     }
 
+    // build-data.py precomputes every filter/sort order as PUBLICATION_INDEX, so a
+    // filter click is a lookup; the runtime sort below covers older data.js files.
+    function pubOrder(filter, sort) {
+      const orders = filter === "all" ? PUBLICATION_INDEX.order : PUBLICATION_INDEX.byType[filter];
+      return orders ? orders[sort === "oldest" ? "oldest" : "year"] : [];
+    }
+
+    const pubViews = {};
+    function indexedPubs(filter, sort) {
+      const key = filter + "|" + sort;
+      if (!pubViews[key]) {
+        pubViews[key] = pubOrder(filter, sort).map(i => publications.value[i]);
+      }
+      return pubViews[key];
+    }
+
+    // Positions in PUBLICATIONS, TALKS or MEDIA (`collection`) matching a search box,
+    // or null when not searching
+    function searchHits(query, collection) {
+      if (!searchIndex.value || !query.trim()) return null;
+      const result = SiteSearch.query(searchIndex.value, query);
+      return result && result[collection];
+    }
+    const pubHits = computed(() => searchHits(pubQuery.value, "publications"));
+    const talkHits = computed(() => searchHits(talkQuery.value, "talks"));
+    const mediaHits = computed(() => searchHits(mediaQuery.value, "media"));
+
+    // TALKS and MEDIA are in CSV order, like their postings in the search index
+    function matching(items, hits) {
+      return hits ? items.filter((_, i) => hits.has(i)) : items;
+    }
+
     const filteredPubs = computed(() => {
+      if (typeof PUBLICATION_INDEX !== "undefined") {
+        const hits = pubHits.value;
+        if (hits) {
+          return pubOrder(pubFilter.value, pubSort.value).filter(i => hits.has(i)).map(i => publications.value[i]);
+        }
+        return indexedPubs(pubFilter.value, pubSort.value);
+      }
       let pubs = publications.value;
       if (pubFilter.value !== "all") {
         pubs = pubs.filter(p => p.type === pubFilter.value);
@@ -140,19 +241,30 @@ createApp({
       return filteredPubs.value.slice(0, 5);
     });
 
-    const talks = computed(() => TALKS);
-    const displayedTalks = computed(() => showAllTalks.value ? talks.value : talks.value.slice(0, 3));
+    const talks = computed(() => {
+      lazyDataLoaded.value;
+      return typeof TALKS !== "undefined" ? TALKS : [];
+    });
+    const filteredTalks = computed(() => matching(talks.value, talkHits.value));
+    const displayedTalks = computed(() => showAllTalks.value ? filteredTalks.value : filteredTalks.value.slice(0, 3));
     const news = computed(() => t.value["news.items"] || []);
     const displayedNews = computed(() => showAllNews.value ? news.value : news.value.slice(0, 4));
     const awards = computed(() => t.value["awards.items"] || []);
     const displayedAwards = computed(() => showAllAwards.value ? awards.value : awards.value.slice(0, 3));
-    const media = computed(() => MEDIA);
-    const displayedMedia = computed(() => showAllMedia.value ? media.value : media.value.slice(0, 4));
+    const media = computed(() => {
+      lazyDataLoaded.value;
+      return typeof MEDIA !== "undefined" ? MEDIA : [];
+    });
+    const filteredMedia = computed(() => matching(media.value, mediaHits.value));
+    const displayedMedia = computed(() => showAllMedia.value ? filteredMedia.value : filteredMedia.value.slice(0, 4));
 
     // ── Methods ──
     function toggleLang() {
-      lang.value = lang.value === "en" ? "ja" : "en";
-      localStorage.setItem("lang", lang.value);
+      const next = lang.value === "en" ? "ja" : "en";
+      loadTranslations(next).then(() => {
+        lang.value = next;
+        localStorage.setItem("lang", next);
+      }, dataLoadFailed);
     }
 
     function toggleTheme() {
@@ -267,6 +379,11 @@ createApp({
       closeMenu();
     }
 
+    function loadSearchIndex() {
+      if (!searchAvailable || searchIndex.value) return;
+      SiteSearch.load(SEARCH_INDEX_URL).then(index => { searchIndex.value = index; });
+    }
+
     function setFilter(f) {
       pubFilter.value = f;
       showAllPubs.value = false;
@@ -315,7 +432,7 @@ createApp({
     }, { immediate: true });
 
     // Re-observe new elements after show-all toggles
-    watch([showAllPubs, showAllTalks, showAllAwards, showAllMedia, showAllNews, pubFilter, pubSort], () => {
+    watch([showAllPubs, showAllTalks, showAllAwards, showAllMedia, showAllNews, pubFilter, pubSort, pubQuery, talkQuery, mediaQuery, lazyDataLoaded], () => {
       nextTick(() => initScrollAnimations());
     });
 
@@ -347,19 +464,40 @@ createApp({
       sections.forEach(s => observer.observe(s));
     }
 
+    // ── Lazy Data ──
+    // Below-the-fold sections fetch their chunk shortly before they scroll into view
+    function initLazyData() {
+      if (!DATA_SPLIT) return;
+      const chunks = { talks: "talks", media: "media" };
+      const observer = new IntersectionObserver(entries => {
+        entries.forEach(entry => {
+          if (!entry.isIntersecting) return;
+          observer.unobserve(entry.target);
+          loadDataChunk(chunks[entry.target.id]).then(() => { lazyDataLoaded.value++; }, dataLoadFailed);
+        });
+      }, { rootMargin: "800px 0px" });
+      Object.keys(chunks).forEach(id => {
+        const el = document.getElementById(id);
+        if (el) observer.observe(el);
+      });
+    }
+
     // ── Lifecycle ──
     onMounted(() => {
+      document.getElementById("prerender")?.remove();
       initScrollAnimations();
       initActiveNav();
+      initLazyData();
       setTimeout(initScrollAnimations, 500);
       window.addEventListener('hashchange', onHashChange);
     });
 
     return {
       lang, theme, menuOpen, pubFilter, pubSort, showAllPubs, showAllTalks, showAllAwards, showAllMedia, showAllNews,
-      publications, greeting, currentView,
+      publications, greeting, currentView, pubQuery, talkQuery, mediaQuery, searchAvailable, loadSearchIndex,
       t, pt, langLabel, themeIcon,
-      filteredPubs, displayedPubs, talks, displayedTalks, news, displayedNews, awards, displayedAwards, media, displayedMedia,
+      filteredPubs, displayedPubs, talks, filteredTalks, displayedTalks, news, displayedNews, awards, displayedAwards,
+      media, filteredMedia, displayedMedia,
       toggleLang, toggleTheme, toggleMenu, closeMenu, scrollToTop, scrollToSection, setFilter, setSort,
       formatAuthors, talkTitle, talkDesc, talkType, talkYear, mediaTitle, pubDate, pubTypeLabel,
       calYear, calMonth, calMonthName, calDisplayDate, calDayHeaders, calDays, calCanGoPrev, calCanGoNext,
@@ -369,4 +507,16 @@ createApp({
       SPORT_TYPES, RACKETS,
     };
   }
-}).mount("#app");
+});
+
+Promise.all([loadDataChunk("core"), loadTranslations(INITIAL_LANG)]).then(() => {
+  sessionStorage.removeItem("dataReloaded");
+  app.mount("#app");
+}, dataLoadFailed);
+
+// ── Service Worker ──
+// sw.js is generated by build-data.py with a precache manifest of the current build.
+// Not registered on the local dev server, where files change without a rebuild.
+if ("serviceWorker" in navigator && !["localhost", "127.0.0.1"].includes(location.hostname)) {
+  window.addEventListener("load", () => navigator.serviceWorker.register("sw.js"));
+}
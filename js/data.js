@@ -180,6 +180,7 @@ const TRANSLATIONS = {
     "pub.title":"Publications","pub.subtitle":"Showing selected highlights only.","pub.showAll":"Show All Publications","pub.showLess":"Show Less","pub.scholarLink":"View on Google Scholar",
     "pub.filter.all":"All","pub.filter.conference":"Conference","pub.filter.journal":"Journal","pub.filter.workshop":"Workshop","pub.filter.preprint":"Preprint","pub.filter.domestic":"Domestic",
     "pub.sort":"Sort","pub.sort.year":"Newest","pub.sort.oldest":"Oldest",
+    "pub.search":"Search publications",
     // News
     "news.title":"News",
     "news.items":[
@@ -206,6 +207,7 @@ const TRANSLATIONS = {
     ],
     // Talks
     "talks.title":"Talks & Presentations",
+    "talks.search":"Search talks",
     "talks.invited":"Invited Talk","talks.award":"Award Talk","talks.presentation":"Presentation","talks.conference":"Conference","talks.workshop":"Workshop","talks.domestic":"Domestic",
     "talks.confTitle":"Conference Presentations","talks.confDesc":"Oral/poster presentations at top-tier international conferences worldwide.",
     "talks.wsDesc":"Workshop presentations at major computer vision and ML conferences.",
@@ -256,6 +258,7 @@ const TRANSLATIONS = {
     ],
     // Media
     "media.title":"Media Coverage","media.subtitle":"Research featured in 100+ media outlets. Selected highlights below.",
+    "media.search":"Search media coverage",
     "media.more":"And 100+ more media features including major tech outlets...",
     // Service
     "service.title":"Professional Service","service.reviewer":"Reviewer / Program Committee","service.details":"Details","service.note":"Including multiple years of service",
@@ -296,6 +299,7 @@ const TRANSLATIONS = {
     "pub.title":"論文・学会発表","pub.subtitle":"主要な業績のみ掲載しています。","pub.showAll":"全件を表示","pub.showLess":"折りたたむ","pub.scholarLink":"Google Scholarを見る",
     "pub.filter.all":"すべて","pub.filter.conference":"国際会議","pub.filter.journal":"ジャーナル","pub.filter.workshop":"ワークショップ","pub.filter.preprint":"プレプリント","pub.filter.domestic":"国内",
     "pub.sort":"並び順","pub.sort.year":"新しい順","pub.sort.oldest":"古い順",
+    "pub.search":"論文を検索",
     "news.title":"ニュース",
     "news.items":[
       {date:"2026年2月",text:'ホームページを開設しました。様々な分野の研究者やクリエイターの方々とのコラボレーション機会を探すことを目的としています。',isNew:true},
@@ -320,6 +324,7 @@ const TRANSLATIONS = {
       {date:"2016年11月",text:'Tableau Conference 2016 at Austin に参加しました。',isNew:false}
     ],
     "talks.title":"講演・登壇等",
+    "talks.search":"講演を検索",
     "talks.invited":"招待講演","talks.award":"受賞者講演","talks.presentation":"登壇","talks.conference":"学会発表","talks.workshop":"ワークショップ","talks.domestic":"国内",
     "talks.confTitle":"学会発表","talks.confDesc":"世界各地のトップ国際会議での口頭・ポスター発表。",
     "talks.wsDesc":"主要なコンピュータビジョン・機械学習カンファレンスでのワークショップ発表。",
@@ -365,6 +370,7 @@ const TRANSLATIONS = {
       {year:"2017年2月",title:"技能賞 — 日科技連データ解析コンペティション",desc:"2017年度データ解析コンペティション JIMA部会にて受賞。テーマ：ECサイトにおけるアンケートデータを考慮した購買行動分析モデルの提案。"}
     ],
     "media.title":"メディア掲載","media.subtitle":"研究成果が100件以上のメディアで取り上げられています。主な掲載先は以下の通りです。",
+    "media.search":"メディア掲載を検索",
     "media.more":"その他、主要テックメディア等100件以上に掲載...",
     "service.title":"学術活動","service.reviewer":"査読者 / プログラム委員","service.details":"詳細","service.note":"複数年の実績を含む",
     "projects.title":"その他活動",
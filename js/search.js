@@ -0,0 +1,116 @@
+// ===== Site Search =====
+// Queries the inverted index written by scripts/build-data.py (SEARCH_INDEX_URL).
+// Terms are sorted, so every query term is a binary-searched prefix range and
+// no title or author string is scanned at query time.
+
+const SiteSearch = (() => {
+  const CJK_CHARS = "\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff";
+  const WORD_RE = /[\p{L}\p{N}]+/gu;
+  const SCRIPT_RUN_RE = new RegExp(`[${CJK_CHARS}]+|[^${CJK_CHARS}]+`, "g");
+  const CJK_RE = new RegExp(`^[${CJK_CHARS}]`);
+
+  // Must stay in step with tokenize() in scripts/build-data.py
+  function tokenize(text) {
+    const tokens = [];
+    const words = text.normalize("NFKC").toLowerCase().match(WORD_RE) || [];
+    words.forEach(word => {
+      word.match(SCRIPT_RUN_RE).forEach(run => {
+        if (run.length === 1 || !CJK_RE.test(run)) {
+          tokens.push(run);
+        } else {
+          for (let i = 0; i < run.length - 1; i++) tokens.push(run.slice(i, i + 2));
+        }
+      });
+    });
+    return tokens;
+  }
+
+  function decode(deltas) {
+    const ids = new Array(deltas.length);
+    let previous = 0;
+    for (let i = 0; i < deltas.length; i++) {
+      previous += deltas[i];
+      ids[i] = previous;
+    }
+    return ids;
+  }
+
+  // First position in the sorted term list that is >= prefix
+  function lowerBound(terms, prefix) {
+    let lo = 0, hi = terms.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (terms[mid] < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  // Union of the postings of every term starting with `prefix`
+  function matchPrefix(index, prefix) {
+    const docs = new Set();
+    for (let i = lowerBound(index.terms, prefix); i < index.terms.length && index.terms[i].startsWith(prefix); i++) {
+      if (!index.decoded[i]) index.decoded[i] = decode(index.postings[i]);
+      index.decoded[i].forEach(doc => docs.add(doc));
+    }
+    return docs;
+  }
+
+  function prepare(index) {
+    index.decoded = new Array(index.terms.length);
+    const c = index.counts;
+    index.ranges = {
+      publications: [0, c.publications],
+      talks: [c.publications, c.publications + c.talks],
+      media: [c.publications + c.talks, c.publications + c.talks + c.media]
+    };
+    return index;
+  }
+
+  const loads = {};
+  function load(url) {
+    if (!loads[url]) {
+      loads[url] = fetch(url)
+        .then(res => {
+          if (!res.ok) throw new Error(`HTTP ${res.status}: ${url}`);
+          return res.json();
+        })
+        .then(prepare)
+        .catch(err => {
+          delete loads[url];
+          throw err;
+        });
+    }
+    return loads[url];
+  }
+
+  // Every query term must match (as a prefix). Returns Sets of positions in
+  // PUBLICATIONS, TALKS and MEDIA, or null for an empty query.
+  function query(index, text) {
+    const tokens = [...new Set(tokenize(text))];
+    if (!tokens.length) return null;
+
+    let docs = null;
+    for (const token of tokens) {
+      const matches = matchPrefix(index, token);
+      docs = docs ? new Set([...docs].filter(doc => matches.has(doc))) : matches;
+      if (!docs.size) break;
+    }
+
+    const result = { publications: new Set(), talks: new Set(), media: new Set() };
+    docs.forEach(doc => {
+      for (const name in index.ranges) {
+        const [start, end] = index.ranges[name];
+        if (doc >= start && doc < end) {
+          result[name].add(doc - start);
+          break;
+        }
+      }
+    });
+    return result;
+  }
+
+  return { tokenize, prepare, load, query };
+})();
+
+if (typeof module !== "undefined") module.exports = SiteSearch;
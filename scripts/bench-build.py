@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Benchmark scripts/build-data.py on synthetic CSVs of increasing size.
+
+Usage:
+    python scripts/bench-build.py                       # 100 and 10k rows per CSV
+    python scripts/bench-build.py --sizes 100,10k,100k,1m
+    python scripts/bench-build.py --format json         # benchmark the JSON.parse output
+    python scripts/bench-build.py --update-baseline     # record the results as the new baseline
+
+Every CSV that build-data.py reads is generated with the requested number of rows
+(seeded, so runs are comparable): multi-author publications, Japanese titles and
+descriptions, and fields full of quotes, commas and HTML attributes. Nothing is
+fetched; the build runs against a temporary directory, so the repository's own
+data/ and js/ are never touched.
+
+Phases timed per size (best of --repeat runs up to 10k rows, a single run above
+that; peak memory comes from a separate tracemalloc run so tracing does not skew
+the timings):
+    read              - csv.DictReader over every CSV (build-data.read_csv)
+    render:<section>  - the section builder over already-parsed rows
+    search            - building the search index
+    template          - filling OUTPUT_TEMPLATE from the rendered fragments
+    write             - streaming the rendered output to js/data.js atomically
+    build             - build-data.build() end to end with an empty cache
+
+Times are compared to scripts/bench-build-baseline.json after dividing by a
+calibration workload (the median of runs before and after the benchmark), so a
+baseline recorded on a faster or slower machine still applies. Sizes with a
+phase slower than the baseline allows are benchmarked once more, and the run
+exits with status 1 when a phase is still slower or uses more memory than the
+baseline allows.
+"""
+
+import argparse
+import csv
+import gc
+import importlib.util
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(SCRIPT_DIR, "bench-build-baseline.json")
+BASELINE_VERSION = 2
+
+SIZES = {"100": 100, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SIZES = "100,10k"
+
+TIME_TOLERANCE = 0.50    # default allowed slowdown relative to the calibrated baseline
+MEMORY_TOLERANCE = 0.10  # allowed growth of the peak allocation
+MIN_TIME_DELTA = 0.025   # seconds; smaller differences are scheduler noise
+CALIBRATION_ROWS = 8000  # ~0.1 s per calibration run
+CALIBRATION_RUNS = 15    # before and again after the benchmark; the median of both is used
+
+
+def load_build_data():
+    spec = importlib.util.spec_from_file_location("build_data", os.path.join(SCRIPT_DIR, "build-data.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ── Synthetic data ──
+
+WORDS = (
+    "learning representation fashion recommendation explainable graph neural attention "
+    "contrastive multimodal retrieval outfit compatibility diffusion transformer language "
+    "model merging task vectors robust fairness bias evaluation benchmark dataset scalable "
+    "efficient sparse user item embedding interpretable causal generative visual"
+).split()
+JA_WORDS = (
+    "ファッション 推薦 説明可能 機械学習 深層学習 画像認識 大規模言語モデル 評価 手法 "
+    "データセット 解釈 コーディネート 検索 生成 因果推論 公平性 頑健性 学会 講演 研究所"
+).split()
+NAMES = (
+    "Ryotaro Shimizu|Hiroki Naganuma|Kotaro Yoshida|Yuji Naraki|Takafumi Horie|Masayuki Goto|"
+    "Julian McAuley|Laura Gomezjurado Gonzalez|Ioannis Mitliagkas|Yu Wang|清水 良太郎|後藤 正幸|"
+    "中村 優|佐藤 花子|Jean-Pierre O'Neil|María José García"
+).split("|")
+VENUES = ("ICLR", "WWW", "IJCAI", "EMNLP", "CVPR", "RecSys", "KDD", "IEEE Access", "arXiv", "人工知能学会全国大会")
+PUB_TYPES = ("conference", "journal", "workshop", "preprint", "domestic")
+TALK_TYPES = ("invited", "presentation", "award")
+MEDIA_CATEGORIES = ("", "", "blog", "interview")
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def phrase(rng, words, lo, hi, sep=" "):
+    return sep.join(rng.choice(words) for _ in range(rng.randint(lo, hi)))
+
+
+def quoted_title(rng):
+    """An English title that needs CSV quoting about half the time."""
+    title = phrase(rng, WORDS, 4, 12).title()
+    roll = rng.random()
+    if roll < 0.2:
+        title = f'"{title}": {phrase(rng, WORDS, 2, 5)}'
+    elif roll < 0.4:
+        title = f"{title}, {phrase(rng, WORDS, 2, 5)}"
+    elif roll < 0.5:
+        title = f"{title} — {phrase(rng, JA_WORDS, 1, 3, '')}"
+    return title
+
+
+def month_year(rng, year):
+    return f"{rng.choice(MONTHS)} {year}"
+
+
+def publication_row(rng, i):
+    year = rng.randint(2015, 2026)
+    return {
+        "title": quoted_title(rng) if rng.random() < 0.9 else phrase(rng, JA_WORDS, 3, 8, "の"),
+        "authors": "|".join(rng.sample(NAMES, rng.randint(1, 12))),
+        "venue": rng.choice(VENUES),
+        "year": year,
+        "date": month_year(rng, year) if rng.random() < 0.8 else "",
+        "type": rng.choice(PUB_TYPES),
+        "citations": rng.choice((0, 0, 1, 3, 12, 57, 240)),
+        "paper_link": f"https://arxiv.org/abs/{year % 100:02d}{i % 10000:04d}.{i:05d}" if rng.random() < 0.7 else "",
+    }
+
+
+def talk_row(rng, i):
+    year = rng.randint(2015, 2026)
+    month = rng.randint(1, 12)
+    return {
+        "year": f"{MONTHS[month - 1]} {year}",
+        "yearJa": f"{year}年{month}月",
+        "type": rng.choice(TALK_TYPES),
+        "title": quoted_title(rng),
+        "titleJa": phrase(rng, JA_WORDS, 2, 6, ""),
+        "desc": f'"{quoted_title(rng)}" — Tokyo, Japan',
+        "descJa": f"「{phrase(rng, JA_WORDS, 3, 8, '')}」— 東京",
+        "link": f"https://example.com/talks/{i}" if rng.random() < 0.7 else "",
+        "image": f"pics/talk_{i % 50}.jpg" if rng.random() < 0.5 else "",
+    }
+
+
+def media_row(rng, i):
+    return {
+        "source": rng.choice(("ZOZO NEXT", "日経新聞", "ITmedia", "Forbes JAPAN")),
+        "title": quoted_title(rng),
+        "titleJa": phrase(rng, JA_WORDS, 3, 8, ""),
+        "url": f"https://example.com/media/{i}?ref=site&lang=ja",
+        "date": month_year(rng, rng.randint(2019, 2026)) if rng.random() < 0.9 else str(rng.randint(2019, 2026)),
+        "category": rng.choice(MEDIA_CATEGORIES),
+    }
+
+
+def award_row(rng, i, ja):
+    year = rng.randint(2015, 2026)
+    return {
+        "year": f"{year}年{rng.randint(1, 12)}月" if ja else month_year(rng, year),
+        "title": f"{phrase(rng, JA_WORDS, 2, 4, '')}賞" if ja else f"Best Paper Award, {rng.choice(VENUES)} {year}",
+        "desc": phrase(rng, JA_WORDS, 4, 10, "") if ja else f"Top {rng.randint(1, 10)} of {rng.randint(100, 5000):,} entries.",
+    }
+
+
+def news_row(rng, i, ja):
+    venue = rng.choice(VENUES)
+    link = f'<a href="https://example.com/news/{i}" target="_blank">{venue}</a>'
+    return {
+        "date": f"{rng.randint(2015, 2026)}年{rng.randint(1, 12)}月" if ja else month_year(rng, rng.randint(2015, 2026)),
+        "text": f"{link}に論文が採択されました。" if ja else f'Paper "{quoted_title(rng)}" accepted at {link}.',
+        "isNew": "true" if rng.random() < 0.1 else "false",
+    }
+
+
+GENERATORS = {
+    "publications.csv": publication_row,
+    "talks.csv": talk_row,
+    "media.csv": media_row,
+    "awards_en.csv": lambda rng, i: award_row(rng, i, ja=False),
+    "awards_ja.csv": lambda rng, i: award_row(rng, i, ja=True),
+    "news_en.csv": lambda rng, i: news_row(rng, i, ja=False),
+    "news_ja.csv": lambda rng, i: news_row(rng, i, ja=True),
+}
+
+
+def generate(data_dir, rows, seed=0):
+    """Write every CSV build-data.py reads with `rows` rows each."""
+    os.makedirs(data_dir, exist_ok=True)
+    for filename, make_row in GENERATORS.items():
+        rng = random.Random(f"{seed}:{filename}:{rows}")
+        with open(os.path.join(data_dir, filename), "w", encoding="utf-8", newline="") as f:
+            writer = None
+            for i in range(rows):
+                row = make_row(rng, i)
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+
+
+# ── Measurement ──
+
+def measure(fn, repeat):
+    """Return (best wall seconds, CPU seconds of that run, peak traced bytes, result)."""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        result = fn()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if best is None or wall < best[0]:
+            best = (wall, cpu)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best[0], best[1], peak, result
+
+
+def calibrate(runs=CALIBRATION_RUNS):
+    """Seconds per run of a fixed parse-and-escape workload, used to normalize timings across machines."""
+    rng = random.Random("calibration")
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([quoted_title(rng) for _ in range(6)] for _ in range(CALIBRATION_ROWS))
+    lines = buffer.getvalue().splitlines()
+
+    timings = []
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        for row in csv.reader(lines):
+            json.dumps(row, ensure_ascii=False).replace("\\", "\\\\")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_size(bd, size, fmt, repeat, log):
+    root = tempfile.mkdtemp(prefix=f"bench-build-{size}-")
+    try:
+        # Point build-data.py at the sandbox; every path it writes is a module global
+        bd.DATA_DIR = os.path.join(root, "data")
+        bd.OUTPUT = os.path.join(root, "js", "data.js")
+        bd.CACHE_DIR = os.path.join(root, ".build-cache")
+        bd.MANIFEST = os.path.join(bd.CACHE_DIR, "manifest.json")
+        bd.SPLIT_DIR = os.path.join(root, "js", "data")
+        bd.SEARCH_DIR = os.path.join(root, "js")
+        bd.IMAGE_MANIFEST = os.path.join(root, "pics", "variants", "manifest.json")
+        bd.ROOT_DIR = root
+        bd.INDEX_HTML = os.path.join(root, "index.html")
+        bd.SERVICE_WORKER = os.path.join(root, "sw.js")
+        for directory in (bd.CACHE_DIR, bd.SEARCH_DIR):
+            os.makedirs(directory, exist_ok=True)
+        shutil.copy(os.path.join(os.path.dirname(SCRIPT_DIR), "index.html"), bd.INDEX_HTML)
+
+        start = time.perf_counter()
+        generate(bd.DATA_DIR, SIZES[size])
+        input_bytes = sum(os.path.getsize(os.path.join(bd.DATA_DIR, name)) for name in GENERATORS)
+        log(f"  generated {len(GENERATORS)} CSVs x {SIZES[size]} rows "
+            f"({input_bytes / 1e6:.1f} MB) in {time.perf_counter() - start:.1f} s")
+
+        phases = {}
+
+        def record(phase, fn):
+            wall, cpu, peak, result = measure(fn, repeat)
+            phases[phase] = {"seconds": wall, "cpu_seconds": cpu, "peak_bytes": peak}
+            return result
+
+        rows = record("read", lambda: {filename: bd.read_csv(filename) for _, filename, _ in bd.SECTIONS})
+
+        fragment_paths = {}
+        for name, filename, builders in bd.SECTIONS:
+            chunks = record(f"render:{name}", lambda: list(builders[fmt](rows[filename])))
+            fragment_paths[name] = os.path.join(bd.CACHE_DIR, f"{name}.js")
+            bd.write_atomic(fragment_paths[name], chunks)
+            phases[f"render:{name}"]["output_bytes"] = os.path.getsize(fragment_paths[name])
+            del chunks
+
+        collections = [(name, rows[filename], fields) for name, filename, fields in bd.SEARCH_COLLECTIONS]
+        record("search", lambda: bd.build_search_index(collections))
+        del rows, collections
+
+        search_url = "js/search-index.0000000000.json"
+        record("template", lambda: sum(len(chunk) for chunk in bd.render_output(fragment_paths, search_url)))
+        output = list(bd.render_output(fragment_paths, search_url))
+        record("write", lambda: bd.write_atomic(bd.OUTPUT, output))
+        phases["write"]["output_bytes"] = os.path.getsize(bd.OUTPUT)
+        del output
+
+        args = bd.parse_args(["--force", "--format", fmt])
+        script_hash = bd.hash_file(os.path.join(SCRIPT_DIR, "build-data.py"))
+        record("build", lambda: bd.build(args, script_hash, {}, log=lambda *a: None))
+        return {"input_bytes": input_bytes, "phases": phases}
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+# ── Baseline comparison ──
+
+def load_baseline():
+    try:
+        with open(BASELINE, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return baseline if baseline.get("version") == BASELINE_VERSION else {}
+
+
+def save_baseline(results, calibration):
+    # Merge so that benchmarking one size does not drop the others
+    baseline = load_baseline()
+    runs = baseline.get("runs", {}) if baseline.get("calibration") else {}
+    scale = calibration / baseline["calibration"] if runs else 1.0
+    for run in runs.values():
+        for phase in run["phases"].values():
+            phase["seconds"] *= scale
+            phase["cpu_seconds"] *= scale
+    runs.update(results)
+    with open(BASELINE, "w", encoding="utf-8") as f:
+        json.dump({"version": BASELINE_VERSION, "calibration": calibration, "runs": runs}, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def compare(key, run, calibration, baseline, tolerance, log):
+    """Print the phase table for one run and return the list of regressions."""
+    base_run = baseline.get("runs", {}).get(key)
+    scale = calibration / baseline["calibration"] if base_run else 1.0
+    regressions = []
+    log(f"  {'phase':<22} {'wall ms':>10} {'cpu ms':>10} {'peak MB':>9} {'baseline ms':>12} {'change':>8}")
+    for phase, result in run["phases"].items():
+        line = (f"  {phase:<22} {result['seconds'] * 1000:>10.1f} {result['cpu_seconds'] * 1000:>10.1f} "
+                f"{result['peak_bytes'] / 1e6:>9.1f}")
+        base = base_run and base_run["phases"].get(phase)
+        if not base:
+            log(f"{line} {'-':>12} {'new':>8}")
+            continue
+
+        expected = base["seconds"] * scale
+        change = result["seconds"] / expected - 1 if expected else 0.0
+        log(f"{line} {expected * 1000:>12.1f} {change:>+8.0%}")
+        if change > tolerance and result["seconds"] - expected > MIN_TIME_DELTA:
+            regressions.append(f"{key} {phase}: {result['seconds'] * 1000:.1f} ms vs {expected * 1000:.1f} ms")
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + MEMORY_TOLERANCE) + 1e6:
+            regressions.append(f"{key} {phase}: peak {result['peak_bytes'] / 1e6:.1f} MB "
+                               f"vs {base['peak_bytes'] / 1e6:.1f} MB")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark build-data.py on synthetic CSVs")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"comma-separated rows per CSV, from {', '.join(SIZES)} (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("literal", "json", "interned"),
+        default="literal",
+        help="output format to benchmark (default: literal)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="timed runs per phase for sizes up to 10k rows; the fastest is reported (default: 5)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TIME_TOLERANCE,
+        help=f"fail when a phase is this much slower than the baseline (default: {TIME_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=f"store the results in {os.path.relpath(BASELINE)} instead of comparing",
+    )
+    args = parser.parse_args(argv)
+    args.sizes = args.sizes.split(",")
+    unknown = [size for size in args.sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(unknown)} (choose from {', '.join(SIZES)})")
+    return args
+
+
+def benchmark(bd, sizes, args):
+    """Benchmark each size and return (results by key, calibration seconds)."""
+    # Calibrating on both sides of the benchmark and taking the median keeps a burst of
+    # load or a clock change during either from skewing every comparison
+    samples = calibrate()
+    results = {}
+    for size in sizes:
+        key = f"{size}/{args.format}"
+        print(f"{key}")
+        # Larger sizes take long enough per phase that one run is stable
+        repeat = args.repeat if SIZES[size] <= 10_000 else 1
+        results[key] = bench_size(bd, size, args.format, repeat, print)
+    samples += calibrate()
+    calibration = statistics.median(samples)
+    print(f"\nCalibration workload: median {calibration * 1000:.1f} ms "
+          f"({min(samples) * 1000:.1f}-{max(samples) * 1000:.1f} ms over {len(samples)} runs)")
+    return results, calibration
+
+
+def compare_all(results, calibration, baseline, tolerance):
+    """Print the phase tables and return the regressions by key."""
+    regressions = {}
+    for key, run in results.items():
+        print(f"\n{key}")
+        found = compare(key, run, calibration, baseline, tolerance, print)
+        if found:
+            regressions[key] = found
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    bd = load_build_data()
+
+    results, calibration = benchmark(bd, args.sizes, args)
+    baseline = {} if args.update_baseline else load_baseline()
+    regressions = compare_all(results, calibration, baseline, args.tolerance)
+
+    # On a shared machine a slow phase is often a neighbour's burst of load, so only
+    # sizes that regress a second time, against a fresh calibration, fail the run
+    if regressions and not args.update_baseline:
+        print(f"\nRe-running {', '.join(regressions)} to rule out noise\n")
+        sizes = [size for size in args.sizes if f"{size}/{args.format}" in regressions]
+        results, calibration = benchmark(bd, sizes, args)
+        regressions = compare_all(results, calibration, baseline, args.tolerance)
+    regressions = [regression for found in regressions.values() for regression in found]
+
+    if args.update_baseline:
+        save_baseline(results, calibration)
+        print(f"\nBaseline written to {os.path.relpath(BASELINE)}")
+    elif regressions:
+        print("\nRegressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    else:
+        print("\nNo regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
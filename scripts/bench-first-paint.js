@@ -0,0 +1,124 @@
+#!/usr/bin/env node
+/**
+ * Estimates how much earlier the main content can paint with the lists that
+ * `build-data.py --prerender` writes into index.html. Offline and deterministic
+ * apart from the script evaluation time, so runs are comparable across commits.
+ * Run via: node scripts/bench-first-paint.js [index.html] [--rtt MS] [--kbps N] [--runs N]
+ *
+ * Without pre-rendering nothing is visible until index.html, the stylesheets, every
+ * blocking script and js/data.js's evaluation are done (the app is hidden by v-cloak
+ * until it mounts). With it, the lists paint once the stylesheets and the HTML up to
+ * the end of the prerender block have arrived. Times use a simple model: one round
+ * trip for the document, one for the subresources it references, plus gzipped bytes
+ * over the given bandwidth (default: Lighthouse's throttled mobile profile).
+ * Third-party resources (Vue, fonts, icons) cannot be measured offline and are
+ * excluded, so the figures without pre-rendering are a lower bound.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const zlib = require('zlib');
+
+const ROOT = path.join(__dirname, '..');
+const START = '<!-- prerender:start -->';
+const END = '<!-- prerender:end -->';
+
+function parseArgs(argv) {
+  const args = { file: path.join(ROOT, 'index.html'), rtt: 150, kbps: 1638.4, runs: 50 };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--rtt') {
+      args.rtt = parseFloat(argv[++i]);
+    } else if (argv[i] === '--kbps') {
+      args.kbps = parseFloat(argv[++i]);
+    } else if (argv[i] === '--runs') {
+      args.runs = parseInt(argv[++i], 10);
+    } else {
+      args.file = argv[i];
+    }
+  }
+  return args;
+}
+
+function gzipBytes(data) {
+  return zlib.gzipSync(data, { level: 9 }).length;
+}
+
+function median(values) {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length / 2)];
+}
+
+// Same-origin files matched by `pattern` (synchronous scripts or stylesheets), in document order
+function localResources(html, pattern) {
+  return [...html.matchAll(pattern)]
+    .map(m => m[1])
+    .filter(src => !/^https?:/.test(src))
+    .map(src => path.join(ROOT, src));
+}
+
+function gzipTotal(files) {
+  return files.reduce((sum, file) => sum + gzipBytes(fs.readFileSync(file)), 0);
+}
+
+// Parse + evaluate time of js/data.js, which must finish before the app can mount
+function evaluateMs(file, runs) {
+  const source = fs.readFileSync(file, 'utf-8').replace(/^(const|let)\s+/gm, 'var ');
+  const times = [];
+  for (let i = 0; i < runs; i++) {
+    const start = process.hrtime.bigint();
+    new vm.Script(`${source}\n//${i}`).runInNewContext({});
+    times.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  return median(times);
+}
+
+function transferMs(bytes, kbps) {
+  return bytes * 8 / kbps;
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const html = fs.readFileSync(args.file, 'utf-8');
+  const start = html.indexOf(START);
+  const end = html.indexOf(END);
+  if (start < 0 || end < 0) {
+    console.error(`${args.file} has no ${START} ... ${END} markers`);
+    process.exit(1);
+  }
+  const block = html.slice(start + START.length, end);
+  if (!block.trim()) {
+    console.error(`${args.file} has no pre-rendered content; run python scripts/build-data.py --prerender first`);
+    process.exit(1);
+  }
+  const plain = html.slice(0, start + START.length) + html.slice(end);
+  const scripts = localResources(html, /<script src="([^"]+)"><\/script>/g);
+  const styles = localResources(html, /<link rel="stylesheet" href="([^"]+)">/g);
+  const scriptBytes = gzipTotal(scripts);
+  const styleBytes = gzipTotal(styles);
+  const evalMs = evaluateMs(path.join(ROOT, 'js', 'data.js'), args.runs);
+
+  // Pre-rendered: the lists paint once the stylesheets and the HTML up to the end of the block have arrived
+  const prefixBytes = gzipBytes(html.slice(0, end + END.length));
+  const prerenderedBytes = prefixBytes + styleBytes;
+  const prerendered = 2 * args.rtt + transferMs(prerenderedBytes, args.kbps);
+  // Plain: the whole document, its stylesheets and scripts, then data.js evaluation
+  const plainHtmlBytes = gzipBytes(plain);
+  const baselineBytes = plainHtmlBytes + styleBytes + scriptBytes;
+  const baseline = 2 * args.rtt + transferMs(baselineBytes, args.kbps) + evalMs;
+
+  const elements = (block.match(/<[a-z][^>]*>/g) || []).length;
+  const items = ['news-item', 'pub-card', 'talk-item'].map(cls => `${(block.match(new RegExp(`class="${cls}"`, 'g')) || []).length} ${cls}`);
+
+  console.log(`${path.relative(process.cwd(), args.file)}`);
+  console.log(`  index.html: ${Buffer.byteLength(plain)} -> ${Buffer.byteLength(html)} bytes raw, ${plainHtmlBytes} -> ${gzipBytes(html)} bytes gzip`);
+  console.log(`  pre-rendered block: ${Buffer.byteLength(block)} bytes, ${elements} elements (${items.join(', ')})`);
+  console.log(`  stylesheets: ${styles.map(file => path.relative(ROOT, file)).join(', ')} (${styleBytes} bytes gzip)`);
+  console.log(`  blocking scripts: ${scripts.map(file => path.relative(ROOT, file)).join(', ')} (${scriptBytes} bytes gzip)`);
+  console.log(`  js/data.js parse + evaluate: median ${evalMs.toFixed(2)} ms`);
+  console.log(`  modelled first paint of the lists (${args.rtt} ms RTT, ${args.kbps} kbps):`);
+  console.log(`    without pre-rendering: ${baseline.toFixed(0)} ms (${baselineBytes} bytes gzip, + Vue from unpkg)`);
+  console.log(`    with pre-rendering:    ${prerendered.toFixed(0)} ms (${prerenderedBytes} bytes gzip)`);
+}
+
+main();
@@ -0,0 +1,94 @@
+#!/usr/bin/env node
+/**
+ * Measures how long V8 takes to parse and evaluate generated data files,
+ * e.g. to compare `build-data.py --format literal` against `--format json`,
+ * and, for `--format interned`, how long js/app.js takes to expand the
+ * author/venue references. Sizes are reported raw and gzipped.
+ * Run via: node scripts/bench-parse.js js/data.js [other-data.js ...] [--runs N]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const zlib = require('zlib');
+
+function parseArgs(argv) {
+  const files = [];
+  let runs = 200;
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--runs') {
+      runs = parseInt(argv[++i], 10);
+    } else {
+      files.push(argv[i]);
+    }
+  }
+  return { files, runs };
+}
+
+function median(values) {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length / 2)];
+}
+
+// Same as decodePublications() in js/app.js
+function decodePublications(pubs, { authors, venues }) {
+  return pubs.map(p => ({ ...p, authors: p.authors.map(i => authors[i]), venue: venues[p.venue] }));
+}
+
+// Parse + evaluate (and decode) time of one run of `source`
+function evaluate(source, i) {
+  // A unique suffix defeats V8's in-isolate compilation cache
+  const code = `${source}\n//${i}`;
+  const start = process.hrtime.bigint();
+  const script = new vm.Script(code);
+  const sandbox = {};
+  script.runInNewContext(sandbox);
+  // Object literals and JSON.parse payloads are fully built by evaluation, so nothing
+  // else is timed here (serializing the data would cost more for strings than for the
+  // integer references of --format interned)
+  const time = Number(process.hrtime.bigint() - start) / 1e6;
+  if (!sandbox.PUBLICATION_STRINGS) return { time, decode: null };
+  const decodeStart = process.hrtime.bigint();
+  decodePublications(sandbox.PUBLICATIONS, sandbox.PUBLICATION_STRINGS);
+  return { time, decode: Number(process.hrtime.bigint() - decodeStart) / 1e6 };
+}
+
+// Files take turns within each run, so load on the machine affects them all alike
+function bench(files, runs) {
+  const results = files.map(file => {
+    const raw = fs.readFileSync(file);
+    // Same rewrite as tests/run-tests.js so top-level consts land on the sandbox
+    const source = raw.toString('utf-8').replace(/^(const|let)\s+/gm, 'var ');
+    return { file, raw, source, times: [], decodeTimes: [] };
+  });
+  for (let i = 0; i < runs; i++) {
+    results.forEach(r => {
+      const { time, decode } = evaluate(r.source, i);
+      r.times.push(time);
+      if (decode !== null) r.decodeTimes.push(decode);
+    });
+  }
+  return results.map(r => ({
+    file: r.file,
+    bytes: r.raw.length,
+    gzip: zlib.gzipSync(r.raw, { level: 9 }).length,
+    median: median(r.times),
+    min: Math.min(...r.times),
+    decode: r.decodeTimes.length ? median(r.decodeTimes) : null
+  }));
+}
+
+function main() {
+  const { files, runs } = parseArgs(process.argv.slice(2));
+  if (!files.length) {
+    files.push(path.join(__dirname, '..', 'js', 'data.js'));
+  }
+
+  console.log(`Parse + evaluate, ${runs} runs each`);
+  bench(files, runs).forEach(r => {
+    const decode = r.decode === null ? '' : `, decode median ${r.decode.toFixed(3)} ms`;
+    console.log(`  ${r.file}: ${r.bytes} bytes (${r.gzip} gzip), median ${r.median.toFixed(3)} ms, min ${r.min.toFixed(3)} ms${decode}`);
+  });
+}
+
+main();
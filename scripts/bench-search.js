@@ -0,0 +1,65 @@
+#!/usr/bin/env node
+/**
+ * Reports size and query latency of search indexes written by build-data.py.
+ * Run via: node scripts/bench-search.js js/search-index.*.json [--runs N]
+ */
+
+const fs = require('fs');
+const zlib = require('zlib');
+const SiteSearch = require('../js/search.js');
+
+const QUERIES = ['recommend', 'shimizu', 'fashion', 'explainable ai', 'iclr 2025', 'e', 'ファッション', '推薦', '説明可能'];
+
+function parseArgs(argv) {
+  const files = [];
+  let runs = 50;
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--runs') {
+      runs = parseInt(argv[++i], 10);
+    } else {
+      files.push(argv[i]);
+    }
+  }
+  return { files, runs };
+}
+
+function median(values) {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length / 2)];
+}
+
+function time(fn) {
+  const start = process.hrtime.bigint();
+  const result = fn();
+  return [Number(process.hrtime.bigint() - start) / 1e6, result];
+}
+
+function bench(file, runs) {
+  const raw = fs.readFileSync(file);
+  const [parseMs, index] = time(() => SiteSearch.prepare(JSON.parse(raw)));
+  const docs = index.counts.publications + index.counts.talks + index.counts.media;
+  console.log(`${file}`);
+  console.log(`  ${docs} documents, ${index.terms.length} terms`);
+  console.log(`  size: ${raw.length} bytes raw, ${zlib.gzipSync(raw, { level: 9 }).length} bytes gzip`);
+  console.log(`  load: ${parseMs.toFixed(2)} ms JSON.parse`);
+
+  QUERIES.forEach(q => {
+    // The first query pays for decoding the postings it touches
+    const [coldMs, result] = time(() => SiteSearch.query(index, q));
+    const warm = [];
+    for (let i = 0; i < runs; i++) warm.push(time(() => SiteSearch.query(index, q))[0]);
+    const hits = result ? result.publications.size + result.talks.size + result.media.size : 0;
+    console.log(`  "${q}": ${hits} hits, cold ${coldMs.toFixed(3)} ms, warm median ${median(warm).toFixed(3)} ms`);
+  });
+}
+
+function main() {
+  const { files, runs } = parseArgs(process.argv.slice(2));
+  if (!files.length) {
+    console.error('Usage: node scripts/bench-search.js <search-index.json> [...] [--runs N]');
+    process.exit(1);
+  }
+  files.forEach(file => bench(file, runs));
+}
+
+main();
@@ -3,7 +3,18 @@
 Build js/data.js from CSV source files in data/ directory.
 
 Usage:
-    python scripts/build-data.py
+    python scripts/build-data.py            # incremental build (reuses cached sections)
+    python scripts/build-data.py --force    # ignore the build cache and rebuild everything
+    python scripts/build-data.py --format json  # emit datasets as JSON.parse('...') payloads
+    python scripts/build-data.py --format interned  # JSON payloads, author/venue names as string-table refs
+    python scripts/build-data.py --split    # content-hashed chunks in js/data/, js/data.js = manifest
+    python scripts/build-data.py --watch [--serve [PORT]]  # rebuild on change, optionally serve + live reload
+    python scripts/build-data.py --force --profile [JSON] [--cprofile FILE]  # per-phase timing/memory report
+    python scripts/build-data.py --release  # minified output + .gz/.br siblings, per-section size budgets
+    python scripts/build-data.py --prerender  # also write static news/publications/talks HTML into index.html
+    python scripts/build-data.py --citations FILE  # merge this citation snapshot instead of data/citations.json
+    python scripts/build-data.py --data-dir DIR  # read the CSVs from DIR instead of data/ (e.g. tests/fixtures/data)
+    python scripts/build-data.py --sw-only  # only refresh sw.js revisions after editing precached files by hand
 
 CSV files read:
     data/publications.csv   - Publications (title, authors, venue, year, date, type, citations, paper_link)
@@ -13,29 +24,184 @@ CSV files read:
     data/awards_ja.csv      - Awards in Japanese (year, title, desc)
     data/news_en.csv        - News in English (date, text, isNew)
     data/news_ja.csv        - News in Japanese (date, text, isNew)
+    data/citations.json     - Optional citation snapshot from scripts/update-citations.js
 
 The script preserves all UI translation strings from a template embedded below.
 Only data-driven sections (publications, talks, media, awards, news) are built from CSV.
+
+Rendered sections are cached in .build-cache/, keyed by a hash of the source
+CSV and of this script. Unchanged sections are reused, and js/data.js is left
+untouched when the rendered output is identical to what is on disk.
+
+Citation counts in data/citations.json are merged into publications (the higher
+count wins), so a build never undoes scripts/update-citations.js.
+
+Talk images that scripts/build-images.py has converted (pics/variants/manifest.json)
+get their width/height and WebP/AVIF srcsets added to TALKS.
+
+With --prerender, the first news items, publications and talks are also rendered
+as static HTML into index.html, so they are visible before js/data.js has loaded.
+Once index.html holds a pre-rendered block, every build (including --watch) keeps
+it in step with the data.
+
+Every build also writes sw.js from scripts/sw.template.js, a service worker whose
+precache manifest lists index.html, its same-origin assets and the generated data
+by content hash.
+
+Sections are streamed row by row to a temporary file that is atomically renamed
+into place, so a failed build never leaves a truncated js/data.js behind.
 """
 
+import argparse
+import contextlib
 import csv
+import gzip
+import hashlib
+import html
+import itertools
 import json
 import os
+import re
+import stat
+import string
 import sys
+import tempfile
+import time
+import tracemalloc
+import unicodedata
+
+try:
+    import brotli
+except ImportError:  # optional: --release skips .br siblings without it
+    brotli = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(SCRIPT_DIR)
 DATA_DIR = os.path.join(ROOT_DIR, "data")
 OUTPUT = os.path.join(ROOT_DIR, "js", "data.js")
+CACHE_DIR = os.path.join(ROOT_DIR, ".build-cache")
+MANIFEST = os.path.join(CACHE_DIR, "manifest.json")
+MANIFEST_VERSION = 2
+CHUNK_SIZE = 1 << 16
+SPLIT_DIR = os.path.join(ROOT_DIR, "js", "data")
+CHUNK_HASH_LENGTH = 10
+IMAGE_MANIFEST = os.path.join(ROOT_DIR, "pics", "variants", "manifest.json")
 
 
 def read_csv(filename):
     path = os.path.join(DATA_DIR, filename)
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8", newline="") as f:
         reader = csv.DictReader(f)
         return list(reader)
 
 
+def iter_csv(filename):
+    """Yield CSV rows one at a time instead of materializing the whole file."""
+    path = os.path.join(DATA_DIR, filename)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def sha256(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def iter_file(path):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from iter(lambda: f.read(CHUNK_SIZE), "")
+
+
+def stream_to_temp(directory, prefix, chunks):
+    """Stream text chunks into a new temp file in `directory`; return (temp path, sha256)."""
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    h = hashlib.sha256()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                h.update(data)
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return tmp, h.hexdigest()
+
+
+def default_file_mode():
+    # mkstemp creates 0600 files; published files should get the usual umask-based mode
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_atomic(path, chunks, skip_unchanged=False):
+    """Stream text chunks to a temp file next to `path`, then rename it over `path`.
+
+    Returns False (and leaves `path` untouched) when `skip_unchanged` is set and
+    the streamed content is byte-identical to the existing file.
+    """
+    tmp, digest = stream_to_temp(os.path.dirname(path), f".{os.path.basename(path)}.", chunks)
+    try:
+        if os.path.exists(path):
+            if skip_unchanged and hash_file(path) == digest:
+                os.unlink(tmp)
+                return False
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        else:
+            mode = default_file_mode()
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def write_hashed(directory, stem, chunks, ext=".js"):
+    """Write chunks to `<stem>.<content hash><ext>` in `directory` and return the file name.
+
+    The name is derived from the content, so an existing file with that name is kept as is.
+    """
+    tmp, digest = stream_to_temp(directory, f".{stem}.", chunks)
+    name = f"{stem}.{digest[:CHUNK_HASH_LENGTH]}{ext}"
+    path = os.path.join(directory, name)
+    if os.path.exists(path):
+        os.unlink(tmp)
+    else:
+        os.chmod(tmp, default_file_mode())
+        os.replace(tmp, path)
+    return name
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def save_manifest(manifest):
+    write_atomic(MANIFEST, [json.dumps(manifest, ensure_ascii=False, indent=1)])
+
+
 def js_str(s):
     """Escape a string for JS output using double quotes."""
     if s is None:
@@ -52,17 +218,81 @@ def js_str_single(s):
     return f"'{s}'"
 
 
+# ── Publication indexes ──
+# js/app.js filters by type and sorts by date on every click; the builders record
+# what they need while streaming rows and emit the results as PUBLICATION_INDEX.
+
+MONTH_ORDER = {m: i for i, m in enumerate(["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])}
+
+
+def publication_sort_key(year, date):
+    """Month-level sort key, identical to pubSortKey() in js/app.js."""
+    parts = (date or "").split(" ")
+    if len(parts) == 2 and parts[0] in MONTH_ORDER:
+        return year * 12 + MONTH_ORDER[parts[0]]
+    return year * 12
+
+
+def index_entry(pub_type, year, date, citations):
+    return (pub_type, year, publication_sort_key(year, date), int(citations or 0))
+
+
+def build_publication_index(entries):
+    """Index arrays into PUBLICATIONS for every filter/sort combination, plus counts.
+
+    Sorts are stable, like Array.prototype.sort, so ties keep CSV order exactly
+    as they do when js/app.js sorts at runtime.
+    """
+    positions = range(len(entries))
+    oldest = sorted(positions, key=lambda i: entries[i][2])
+    newest = sorted(positions, key=lambda i: entries[i][2], reverse=True)
+
+    by_type = {}
+    by_year = {}
+    counts = {"all": len(entries)}
+    citations = {"all": 0}
+    for i, (pub_type, year, _, cited) in enumerate(entries):
+        by_year.setdefault(str(year), []).append(i)
+        counts[pub_type] = counts.get(pub_type, 0) + 1
+        citations[pub_type] = citations.get(pub_type, 0) + cited
+        citations["all"] += cited
+    for pub_type in counts:
+        if pub_type != "all":
+            by_type[pub_type] = {
+                "year": [i for i in newest if entries[i][0] == pub_type],
+                "oldest": [i for i in oldest if entries[i][0] == pub_type],
+            }
+
+    return {
+        "order": {"year": newest, "oldest": oldest},
+        "byType": by_type,
+        # Ascending, which is also the order JS gives integer-like keys
+        "byYear": dict(sorted(by_year.items())),
+        "counts": counts,
+        "citations": citations,
+    }
+
+
+def publication_index_js(entries):
+    return (
+        "\n\n// Filter/sort indexes into PUBLICATIONS, precomputed for js/app.js\n"
+        f"const PUBLICATION_INDEX = {to_json(build_publication_index(entries))};"
+    )
+
+
 def build_publications(rows):
-    lines = []
+    yield "const PUBLICATIONS = [\n"
     current_year = None
+    entries = []
     for row in rows:
         year = int(row["year"])
+        entries.append(index_entry(row["type"], year, row.get("date"), row["citations"]))
         if year != current_year:
             current_year = year
             if row["type"] == "preprint":
-                lines.append(f"  // ── Preprints (arXiv) ──")
+                yield f"  // ── Preprints (arXiv) ──\n"
             else:
-                lines.append(f"  // ── {year} ──")
+                yield f"  // ── {year} ──\n"
 
         authors = row["authors"].split("|")
         authors_js = "[" + ",".join(js_str(a) for a in authors) + "]"
@@ -84,13 +314,14 @@ def build_publications(rows):
         else:
             parts.append("links:{}")
 
-        lines.append("  { " + ", ".join(parts) + " },")
+        yield "  { " + ", ".join(parts) + " },\n"
 
-    return "const PUBLICATIONS = [\n" + "\n".join(lines) + "\n];"
+    yield "];"
+    yield publication_index_js(entries)
 
 
 def build_talks(rows):
-    lines = []
+    yield "const TALKS = [\n"
     for row in rows:
         parts = [
             f"year:{js_str(row['year'])}",
@@ -105,13 +336,19 @@ def build_talks(rows):
         parts.append(f"link:{js_str(link) if link else 'null'}")
         image = row.get("image", "").strip()
         parts.append(f"image:{js_str(image) if image else 'null'}")
-        lines.append("  { " + ", ".join(parts) + " },")
+        meta = row.get("_image")
+        if meta:
+            parts.append(f"imageWidth:{meta['width']}")
+            parts.append(f"imageHeight:{meta['height']}")
+            srcset = ", ".join(f"{fmt}:{js_str(value)}" for fmt, value in meta["srcset"].items())
+            parts.append(f"srcset:{{{srcset}}}")
+        yield "  { " + ", ".join(parts) + " },\n"
 
-    return "const TALKS = [\n" + "\n".join(lines) + "\n];"
+    yield "];"
 
 
 def build_media(rows):
-    lines = []
+    yield "const MEDIA = [\n"
     for row in rows:
         parts = [
             f"source:{js_str(row['source'])}",
@@ -123,30 +360,169 @@ def build_media(rows):
         cat = row.get("category", "").strip()
         if cat:
             parts.append(f"category:{js_str(cat)}")
-        lines.append("  { " + ", ".join(parts) + " },")
+        yield "  { " + ", ".join(parts) + " },\n"
 
-    return "const MEDIA = [\n" + "\n".join(lines) + "\n];"
+    yield "];"
 
 
 def build_awards(rows):
-    items = []
+    sep = ""
     for row in rows:
-        items.append(
-            f'      {{year:{js_str(row["year"])},title:{js_str(row["title"])},desc:{js_str(row["desc"])}}}'
-        )
-    return ",\n".join(items)
+        yield sep + f'      {{year:{js_str(row["year"])},title:{js_str(row["title"])},desc:{js_str(row["desc"])}}}'
+        sep = ",\n"
 
 
 def build_news(rows):
-    items = []
+    sep = ""
     for row in rows:
         is_new = row["isNew"].strip().lower() in ("true", "1", "yes")
-        text = row["text"].replace('"', '\\"')
         # Use single quotes for text to allow double-quoted HTML attributes
-        items.append(
-            f"      {{date:{js_str(row['date'])},text:'{row['text']}',isNew:{'true' if is_new else 'false'}}}"
-        )
-    return ",\n".join(items)
+        yield sep + f"      {{date:{js_str(row['date'])},text:{js_str_single(row['text'])},isNew:{'true' if is_new else 'false'}}}"
+        sep = ",\n"
+
+
+# ── JSON output format ──
+# Each dataset is encoded by the C json encoder and wrapped in JSON.parse('...'),
+# which JS engines parse considerably faster than an equivalent object literal.
+
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def to_json(value):
+    return JSON_ENCODER.encode(value)
+
+
+def js_single_quoted(s):
+    """Escape JSON text for embedding in a single-quoted JS string."""
+    return (
+        s.replace("\\", "\\\\")
+        .replace("'", "\\'")
+        .replace("\u2028", "\\u2028")
+        .replace("\u2029", "\\u2029")
+    )
+
+
+def publication_record(row):
+    record = {
+        "title": row["title"],
+        "authors": row["authors"].split("|"),
+        "venue": row["venue"],
+        "year": int(row["year"]),
+    }
+    if row.get("date"):
+        record["date"] = row["date"]
+    record["type"] = row["type"]
+    record["citations"] = int(row["citations"] or 0)
+    link = row.get("paper_link", "").strip()
+    record["links"] = {"paper": link} if link else {}
+    return record
+
+
+def talk_record(row):
+    record = {key: row[key] for key in ("year", "yearJa", "type", "title", "titleJa", "desc", "descJa")}
+    record["link"] = row.get("link", "").strip() or None
+    record["image"] = row.get("image", "").strip() or None
+    meta = row.get("_image")
+    if meta:
+        record["imageWidth"] = meta["width"]
+        record["imageHeight"] = meta["height"]
+        record["srcset"] = meta["srcset"]
+    return record
+
+
+def media_record(row):
+    record = {key: row[key] for key in ("source", "title", "titleJa", "url", "date")}
+    cat = row.get("category", "").strip()
+    if cat:
+        record["category"] = cat
+    return record
+
+
+def award_record(row):
+    return {"year": row["year"], "title": row["title"], "desc": row["desc"]}
+
+
+def news_record(row):
+    is_new = row["isNew"].strip().lower() in ("true", "1", "yes")
+    return {"date": row["date"], "text": row["text"], "isNew": is_new}
+
+
+def json_parse_array(name, records):
+    yield f"const {name} = JSON.parse('["
+    sep = ""
+    for record in records:
+        yield sep + js_single_quoted(to_json(record))
+        sep = ","
+    yield "]');"
+
+
+def json_items(records):
+    """Translation list items as JSON literals (valid JS) inside the TRANSLATIONS object."""
+    sep = ""
+    for record in records:
+        yield sep + "      " + to_json(record)
+        sep = ",\n"
+
+
+def build_publications_json(rows):
+    entries = []
+
+    def records():
+        for row in rows:
+            record = publication_record(row)
+            entries.append(index_entry(record["type"], record["year"], record.get("date"), record["citations"]))
+            yield record
+
+    yield from json_parse_array("PUBLICATIONS", records())
+    yield publication_index_js(entries)
+
+
+def build_talks_json(rows):
+    return json_parse_array("TALKS", map(talk_record, rows))
+
+
+def build_media_json(rows):
+    return json_parse_array("MEDIA", map(media_record, rows))
+
+
+def build_awards_json(rows):
+    return json_items(map(award_record, rows))
+
+
+def build_news_json(rows):
+    return json_items(map(news_record, rows))
+
+
+# ── Interned output format ──
+# The JSON format with every distinct author and venue name written once, in
+# PUBLICATION_STRINGS; publications refer to them by position and js/app.js
+# expands the references before mounting (decodePublications). The other
+# sections are identical to --format json.
+
+
+def intern(table, value):
+    """Position of `value` in `table` (a dict kept in first-seen order), adding it if new."""
+    return table.setdefault(value, len(table))
+
+
+def build_publications_interned(rows):
+    entries = []
+    authors = {}
+    venues = {}
+
+    def records():
+        for row in rows:
+            record = publication_record(row)
+            entries.append(index_entry(record["type"], record["year"], record.get("date"), record["citations"]))
+            record["authors"] = [intern(authors, a) for a in record["authors"]]
+            record["venue"] = intern(venues, record["venue"])
+            yield record
+
+    yield from json_parse_array("PUBLICATIONS", records())
+    strings = {"authors": list(authors), "venues": list(venues)}
+    yield "\n\n// Author and venue names, referenced by position from PUBLICATIONS\n"
+    yield f"const PUBLICATION_STRINGS = JSON.parse('{js_single_quoted(to_json(strings))}');"
+    yield publication_index_js(entries)
 
 
 # ── UI Translation Template ──
@@ -158,54 +534,60 @@ TRANSLATIONS_EN_TEMPLATE = """  en: {{
     "nav.about":"About","nav.publications":"Publications","nav.talks":"Talks","nav.experience":"Experience","nav.education":"Education","nav.teaching":"Teaching","nav.awards":"Awards","nav.media":"Media","nav.service":"Service","nav.projects":"Projects",
     // Hero
     "hero.greeting":"Hello, I'm",
-    "hero.affil1":"ZOZO Research (ZOZO, Inc.)",
-    "hero.affil2":"Visiting Researcher, Waseda University",
+    "hero.title":"Director, ZOZO Research",
+    "hero.affil2":"Visiting Research Fellow, Waseda University",
     "hero.affil3":"Part-time Lecturer, Sophia University",
+    "hero.affil4":"Ph.D. in Engineering",
     "hero.stat.pubs":"Publications","hero.stat.cit":"Citations",
     // About
     "about.title":"About",
-    "about.p1":"I am a machine learning researcher and engineer with a Ph.D. in Industrial Engineering and 8+ years of professional experience. I specialize in translating business objectives into practical AI solutions, with deep expertise in <strong>recommender systems</strong>, <strong>explainable AI</strong>, <strong>computer vision</strong>, and <strong>large language models</strong>. I am also passionate about education, serving as a Part-time Lecturer at Sophia University and a Visiting Research Fellow at Waseda University.",
-    "about.p2":"As Director at <a href='https://research.zozo.com/' target='_blank'>ZOZO Research</a>, I lead the ML R&amp;D group, driving service development and industry-academia research collaboration. Blessed with wonderful team members and collaborators, I have published 50+ papers at top-tier conferences including WWW, ICLR, IJCAI, EMNLP, and CVPR, and my work has been featured in 100+ media outlets.",
+    "about.p1":"I specialize in translating business objectives into practical AI solutions, with deep expertise in <strong>recommender systems</strong>, <strong>explainable AI</strong>, <strong>computer vision</strong>, <strong>large language models</strong>, and <strong>business data analytics &amp; visualization</strong>. I am particularly interested in <strong>explainable AI for interpreting AI decision-making</strong> and <strong>leveraging AI to make sense of ambiguous, open-ended problems where no single definitive answer exists</strong> (Data &times; AI &times; Ambiguity).",
+    "about.p2":"As Director at <a href='https://research.zozo.com/' target='_blank'>ZOZO Research</a>, I lead the ML R&amp;D group, driving service development and industry-academia research collaboration. Blessed with wonderful team members and collaborators, I have published numerous papers and my work has been featured in many media outlets.",
+    "about.p3":"I am also passionate about education and mentoring, serving as a Part-time Lecturer at <a href='https://www.sophia.ac.jp/en/' target='_blank'>Sophia University</a> and a Visiting Research Fellow at <a href='https://www.waseda.jp/top/en/' target='_blank'>Waseda University</a>.",
     "about.interests":"Research Interests",
     // Publications
     "pub.title":"Publications","pub.subtitle":"Showing selected highlights only.","pub.showAll":"Show All Publications","pub.showLess":"Show Less","pub.scholarLink":"View on Google Scholar",
     "pub.filter.all":"All","pub.filter.conference":"Conference","pub.filter.journal":"Journal","pub.filter.workshop":"Workshop","pub.filter.preprint":"Preprint","pub.filter.domestic":"Domestic",
     "pub.sort":"Sort","pub.sort.year":"Newest","pub.sort.oldest":"Oldest",
+    "pub.search":"Search publications",
     // News
     "news.title":"News",
     "news.items":[
 {news_en}
     ],
     // Talks
-    "talks.title":"Talks & Lectures",
-    "talks.invited":"Invited Talk","talks.conference":"Conference","talks.workshop":"Workshop","talks.domestic":"Domestic",
+    "talks.title":"Talks & Presentations",
+    "talks.search":"Search talks",
+    "talks.invited":"Invited Talk","talks.award":"Award Talk","talks.presentation":"Presentation","talks.conference":"Conference","talks.workshop":"Workshop","talks.domestic":"Domestic",
     "talks.confTitle":"Conference Presentations","talks.confDesc":"Oral/poster presentations at top-tier international conferences worldwide.",
     "talks.wsDesc":"Workshop presentations at major computer vision and ML conferences.",
     "talks.domesticDesc":"Presentations at Japanese domestic conferences. Best Research Award at JSAI 2023.",
     // Experience
     "exp.title":"Professional Experience",
-    "exp.zozo.dir":"Director, Deployment Department","exp.zozo.dir.d":"Leading the department responsible for deploying research outcomes into production systems at scale.",
-    "exp.zozo.sm":"Senior Manager / Lead Research Scientist","exp.zozo.sm.d":"Led 10+ member ML research team. Published at top conferences (WWW, ICLR, IJCAI, EMNLP). Received LINE Yahoo! Best Employee Award (top 3 of 27,000+).",
-    "exp.zozo.lead":"Lead Research Scientist","exp.zozo.lead.d":"Led research on fashion intelligence systems, recommender systems, and explainable AI. Won ZOZO Group Grand Prix (top 5 of 1,700+).",
-    "exp.zozo.rs":"Research Scientist",
-    "exp.ucsd":"UC San Diego","exp.ucsd.r":"Visiting Research Fellow, Computer Science Department","exp.ucsd.d":"Research at <a href='https://cseweb.ucsd.edu//~jmcauley/' target='_blank'>Julian McAuley Lab</a> on recommender systems and LLMs.",
-    "exp.sophia":"Sophia University","exp.sophia.r":"Part-time Lecturer, Faculty of Science and Technology","exp.sophia.d":"Teaching courses on data science and machine learning. Student evaluation score: 4.8/5.0.",
-    "exp.waseda.dsi":"Waseda University","exp.waseda.dsi.r":"Visiting Research Fellow, Data Science Institute","exp.waseda.dsi.d":"Research supervision and mentoring at <a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>Goto Lab</a>. 4 consecutive years of top graduate mentoring.",
-    "exp.dena":"DeNA Co., Ltd.","exp.dena.r":"Software Developer","exp.dena.d":"Full-stack development with Ruby, Python, Go, and cloud infrastructure (AWS/GCP).",
-    "exp.pksha":"PKSHA Technology","exp.pksha.r":"Machine Learning Engineering Intern","exp.pksha.d":"Machine learning engineering internship at a leading AI company.",
-    "exp.azest":"AZEST Inc.","exp.azest.r":"Data Science Intern","exp.azest.d":"Data analytics and business intelligence using Tableau, Power BI, and other tools.",
-    "exp.toreta":"Toreta Inc.","exp.toreta.r":"Software Development Intern","exp.toreta.d":"Full-stack software development at a restaurant tech startup.",
+    "exp.zozo.dir":"Director, Deployment Department","exp.zozo.dir.d":"Launched and leading a department dedicated to researching and developing AI technologies specialized for ZOZO's services and deploying them into production systems.",
+    "exp.zozo.sm":"Senior Manager / Lead Research Scientist","exp.zozo.sm.d":"Led a 10+ member ML research team. Published at top conferences (WWW, ICLR, IJCAI, EMNLP).",
+    "exp.zozo.lead":"Lead Research Scientist","exp.zozo.lead.d":"Led applied ML research on fashion intelligence, recommender systems, and explainable AI. Spearheaded collaborative research with universities and industry partners.",
+    "exp.zozo.rs":"Research Scientist","exp.zozo.rs.d":"Also engaged in data science and ML engineering for business applications, including building AutoML pipelines with Vertex AI and leading cross-company data utilization projects within the group.",
+    "exp.ucsd":"UC San Diego","exp.ucsd.r":"Visiting Research Fellow, Computer Science Department","exp.ucsd.d":"Research on recommender systems and large-scale model fine-tuning at <a href='https://cseweb.ucsd.edu//~jmcauley/' target='_blank'>Julian McAuley Lab</a>. Published multiple papers at international conferences.",
+    "exp.sophia":"Sophia University","exp.sophia.r":"Part-time Lecturer, Faculty of Science and Technology","exp.sophia.d":"Teaching data analysis, statistical modeling, machine learning, and Python programming. Student evaluation: 4.6 → 4.8 → 4.9/5.0.",
+    "exp.waseda.dsi":"Waseda University","exp.waseda.dsi.r":"Visiting Research Fellow, Data Science Institute","exp.waseda.dsi.d":"Research supervision and mentoring of undergraduate and graduate students at <a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>Goto Lab</a>.",
+    "exp.dena":"DeNA Co., Ltd.","exp.dena.r":"Software Developer","exp.dena.d":"Backend development (Java, GCP) for global mobile game titles supporting millions of users.",
+    "exp.pksha":"PKSHA Technology","exp.pksha.r":"Machine Learning Engineering Intern","exp.pksha.d":"Machine learning engineering internship.",
+    "exp.startree":"StarTree Inc.","exp.startree.r":"Analytics Team Leader","exp.startree.d":"Led analytics team using Python and Tableau to analyze HR data for various companies.",
+    "exp.azest":"AZEST Inc.","exp.azest.r":"Data Science Intern","exp.azest.d":"Data analytics and BI using Tableau and Power BI.",
+    "exp.toreta":"Toreta Inc.","exp.toreta.r":"Software Development Intern","exp.toreta.d":"Full-stack development internship at a restaurant tech startup.",
     // Education
     "edu.title":"Education",
-    "edu.phd":"Ph.D. in Engineering (Industrial & Management Systems Engineering)","edu.phd.h":["Supported through ZOZO Working Professional Doctoral Program","Advisor: <a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>Prof. Masayuki Goto</a>","Research: Recommender systems, explainable AI, fashion intelligence"],
-    "edu.ms":"Master of Engineering (Management Systems Engineering)","edu.ms.h":["Best Student Award (Top Graduate)","Advisor: <a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>Prof. Masayuki Goto</a>"],
+    "edu.waseda":"Waseda University","edu.waseda.hs":"Waseda University Senior High School",
+    "edu.phd":"Ph.D. in Engineering (Industrial & Management Systems Engineering)","edu.phd.h":["Early graduation","Inaugural recipient of the <a href='https://corp.zozo.com/news/20180914-5649/' target='_blank'>ZOZO Working Professional Doctoral Program</a>","Advisor: <a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>Prof. Masayuki Goto</a>","Research: Recommender systems, explainable AI, fashion intelligence"],
+    "edu.ms":"Master of Engineering (Management Systems Engineering)","edu.ms.h":["Best Student Award (Top Graduate)","Advisor: <a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>Prof. Masayuki Goto</a>","Research 1: Purchase behavior analysis model on EC sites considering questionnaire data","Research 2: Integrated analysis model for multi-function credit card usage history data","Collaborative research with ZOZO, Inc., Odakyu Electric Railway, and Japan Weather Association"],
     "edu.bs":"B.S. in Management Systems Engineering, School of Creative Science and Engineering",
-    "edu.hs":"Senior High School",
+    "edu.hs":"General Course","edu.hs.h":["<a href='https://www.waseda.jp/school/shs/campus/tennis/' target='_blank'>Tennis Club</a> (Currently serving as OB Association Assistant Secretary)"],
     // Teaching
     "teaching.title":"Teaching",
-    "teaching.sophia":"Sophia University — Part-time Lecturer","teaching.sophia.d":"Teaching courses on data science and machine learning at the Faculty of Science and Technology.",
-    "teaching.sophia.score":"/ 5.0 Average Student Evaluation Score","teaching.sophia.note":"Consistently rated among top-evaluated lecturers across 3 years of teaching.",
-    "teaching.waseda":"Waseda University — Visiting Research Fellow","teaching.waseda.d":"Research supervision and mentoring of undergraduate and graduate students.",
+    "teaching.sophia":"Sophia University — Part-time Lecturer","teaching.sophia.d":"Teaching university-wide general education courses on fundamental statistics, data analysis &amp; visualization, application of machine learning methods to business data, and the Python programming skills required for these.",
+    "teaching.sophia.score":"/ 5.0 Average Student Evaluation Score","teaching.sophia.note":"Student evaluation score: 4.6 → 4.8 → 4.9/5.0 (3-year trend).","teaching.sophia.contact":"Feel free to reach out with questions about the course or suggestions for improvement.",
+    "teaching.waseda":"Waseda University — Visiting Research Fellow","teaching.waseda.d":"Research supervision and mentoring of undergraduate and graduate students at the Data Science Institute.",
     "teaching.waseda.streak":"4 Years","teaching.waseda.label":"Consecutive Top Graduate Mentoring","teaching.waseda.note":"Students under my research supervision have graduated as top of their class for 4 consecutive years.",
     "teaching.studentMsg":"To all students I've had the pleasure of working with — whether through lectures, research mentoring, or <a href='https://ut-base.info/circles/122' target='_blank'>HAIT</a> mentoring — if you ever face challenges in your career or research, please don't hesitate to reach out. I'm always happy to support you, no matter how much time has passed. <strong>My door is always open.</strong>",
     // Awards
@@ -215,13 +597,14 @@ TRANSLATIONS_EN_TEMPLATE = """  en: {{
     ],
     // Media
     "media.title":"Media Coverage","media.subtitle":"Research featured in 100+ media outlets. Selected highlights below.",
+    "media.search":"Search media coverage",
     "media.more":"And 100+ more media features including major tech outlets...",
     // Service
-    "service.title":"Professional Service","service.reviewer":"Conference Reviewer / Program Committee","service.journal":"Journal Reviewer",
+    "service.title":"Professional Service","service.reviewer":"Reviewer / Program Committee","service.details":"Details","service.note":"Including multiple years of service",
     // Projects
     "projects.title":"Non-Research Projects",
-    "projects.tennis":"TaRO's CUP — Tennis Tournament & Community","projects.tennis.d":"Organizing tennis tournaments (TaRO's CUP, now in its 6th+ edition) and building a vibrant community for players of all levels. Partnering with sponsors like Paradiso and Bridgestone.",
-    "projects.nepal":"Nepal Japan Project","projects.nepal.d":"International volunteer project between Nepal and Japan (2015, 2016). Served as Project Leader in 2016, coordinating cross-cultural exchanges and community development initiatives.",
+    "projects.tennis":"TaRO's CUP — Tennis Tournament & Community","projects.tennis.d":"Organizing tennis tournaments (TaRO's CUP, now in its 6th+ edition) and building a vibrant community for players of all levels. Partnering with sponsors like Paradiso and Bridgestone Sports.",
+    "projects.nepal":"Nepal Japan Project","projects.nepal.d":"International project between Nepal and Japan (2015, 2016). Served as Project Leader in 2016, coordinating cross-cultural exchanges and community development initiatives.",
     "projects.wedding":"Wedding Real-Time Quiz App","projects.wedding.d":"Developed a real-time quiz application for friends' weddings, supporting 100+ concurrent WebSocket connections. Used at 3 wedding events.",
     "projects.apps":"Personal Apps & Web Development","projects.apps.d":"Chat application, tennis tournament SNS, TaRO&Company website, and more. Full-stack development across Python, Ruby, Go, Kotlin, Swift, and modern web technologies.",
     // Collaboration
@@ -230,9 +613,10 @@ TRANSLATIONS_EN_TEMPLATE = """  en: {{
     "awards.showAll":"Show All Awards","awards.showLess":"Show Less",
     "media.showAll":"Show All Media","media.showLess":"Show Less",
     "collab.title":"Let's Work Together","collab.subtitle":"I welcome speaking invitations, research collaborations, and event partnerships.",
-    "collab.research":"Research Collaboration","collab.research.d":"I am actively seeking research collaborators in recommender systems, explainable AI, computer vision, and LLMs. Let's push the boundaries of AI research together.",
-    "collab.speaking":"Speaking Invitations","collab.speaking.d":"I am actively accepting speaking invitations for conferences, workshops, seminars, and corporate events. Topics include AI/ML research, fashion tech, and industry-academia collaboration.",
+    "collab.research":"Research Collaboration","collab.research.d":"I am actively seeking research collaborators in AI, machine learning, and data mining. Let's do something exciting together.",
+    "collab.speaking":"Speaking Invitations","collab.speaking.d":"I am actively accepting speaking invitations for conferences, workshops, seminars, and events. Topics include AI/ML research, fashion tech, and industry-academia collaboration.",
     "collab.event":"Event & Conference Co-organizing","collab.event.d":"I am looking for partners to co-organize academic conferences, workshops, tech meetups, and industry events. Whether it's a new conference, a hackathon, or a cross-industry networking event — let's create something exciting together!",
+    "collab.mentoring":"Student Mentoring","collab.mentoring.d":"I welcome students who want mentoring in AI/ML research, career development, and more. Whether you're an undergraduate or graduate student — feel free to reach out.",
     "collab.contact":"Feel free to reach out via email or LinkedIn. I look forward to hearing from you!",
     "collab.email":"Contact Me",
     // Footer
@@ -242,59 +626,66 @@ TRANSLATIONS_EN_TEMPLATE = """  en: {{
 TRANSLATIONS_JA_TEMPLATE = """  ja: {{
     "nav.about":"概要","nav.publications":"論文","nav.talks":"講演","nav.experience":"職歴","nav.education":"学歴","nav.teaching":"教育","nav.awards":"受賞","nav.media":"メディア","nav.service":"学術活動","nav.projects":"プロジェクト",
     "hero.greeting":"はじめまして、",
-    "hero.affil1":"ZOZO研究所（株式会社ZOZO）",
-    "hero.affil2":"早稲田大学 客員研究員",
+    "hero.title":"ZOZO研究所 ディレクター",
+    "hero.affil2":"早稲田大学 招聘研究員",
     "hero.affil3":"上智大学 非常勤講師",
+    "hero.affil4":"博士（工学）",
     "hero.stat.pubs":"論文数","hero.stat.cit":"被引用数",
     "about.title":"概要",
-    "about.p1":"ビジネス目標を実用的なAIソリューションに変換することを専門とし、<strong>推薦システム</strong>、<strong>説明可能なAI</strong>、<strong>コンピュータビジョン</strong>、<strong>大規模言語モデル</strong>に関する深い専門知識を持っています。また、教育にも強い情熱を持ち、上智大学の非常勤講師および早稲田大学の客員研究員として教育活動に携わっています。",
-    "about.p2":"<a href='https://research.zozo.com/' target='_blank'>ZOZO研究所</a>のディレクターとして、ML R&amp;Dグループを率い、サービス開発や産学連携の研究を推進しています。素敵なメンバーや共同研究者に恵まれ、WWW、ICLR、IJCAI、EMNLP、CVPRなどのトップカンファレンスを含む50件以上の論文を発表し、100件以上のメディアに取り上げられています。",
+    "about.p1":"ビジネス目標を実用的なAIソリューションに変換することを専門とし、<strong>推薦システム</strong>、<strong>説明可能なAI</strong>、<strong>コンピュータビジョン</strong>、<strong>大規模言語モデル</strong>、<strong>ビジネスデータ分析と可視化</strong>に関する深い専門知識を持っています。特に、<strong>AIの意思決定を解釈する説明可能AI</strong>や、<strong>答えが1つに定まらない曖昧な問題をAIによってわかりやすくするための分析</strong>（データ &times; AI &times; 曖昧な問題）に興味を持っています。",
+    "about.p2":"<a href='https://research.zozo.com/' target='_blank'>ZOZO研究所</a>のディレクターとして、ML R&amp;Dグループを率い、サービス開発や産学連携の研究を推進しています。素敵なメンバーや共同研究者に恵まれ、多数の論文を発表し、多数のメディアに取り上げられています。",
+    "about.p3":"教育やメンタリングにも強い情熱を持ち、<a href='https://www.sophia.ac.jp/' target='_blank'>上智大学</a>の非常勤講師および<a href='https://www.waseda.jp/' target='_blank'>早稲田大学</a>の招聘研究員としての活動にも携わっています。",
     "about.interests":"研究分野",
-    "pub.title":"論文一覧","pub.subtitle":"主要論文のみ掲載。","pub.showAll":"すべての論文を表示","pub.showLess":"折りたたむ","pub.scholarLink":"Google Scholarを見る",
+    "pub.title":"論文・学会発表","pub.subtitle":"主要な業績のみ掲載しています。","pub.showAll":"全件を表示","pub.showLess":"折りたたむ","pub.scholarLink":"Google Scholarを見る",
     "pub.filter.all":"すべて","pub.filter.conference":"国際会議","pub.filter.journal":"ジャーナル","pub.filter.workshop":"ワークショップ","pub.filter.preprint":"プレプリント","pub.filter.domestic":"国内",
     "pub.sort":"並び順","pub.sort.year":"新しい順","pub.sort.oldest":"古い順",
+    "pub.search":"論文を検索",
     "news.title":"ニュース",
     "news.items":[
 {news_ja}
     ],
-    "talks.title":"講演等",
-    "talks.invited":"招待講演","talks.conference":"学会発表","talks.workshop":"ワークショップ","talks.domestic":"国内",
+    "talks.title":"講演・登壇等",
+    "talks.search":"講演を検索",
+    "talks.invited":"招待講演","talks.award":"受賞者講演","talks.presentation":"登壇","talks.conference":"学会発表","talks.workshop":"ワークショップ","talks.domestic":"国内",
     "talks.confTitle":"学会発表","talks.confDesc":"世界各地のトップ国際会議での口頭・ポスター発表。",
     "talks.wsDesc":"主要なコンピュータビジョン・機械学習カンファレンスでのワークショップ発表。",
     "talks.domesticDesc":"国内学会での発表。JSAI 2023にて研究賞受賞。",
     "exp.title":"職歴",
-    "exp.zozo.dir":"ディレクター、デプロイメント部","exp.zozo.dir.d":"研究成果を大規模プロダクションシステムにデプロイする部門を統括。",
-    "exp.zozo.sm":"シニアマネージャー / リード研究者","exp.zozo.sm.d":"R&Dチームを率いる。WWW、ICLR、IJCAI、EMNLPなどで論文発表。LINEヤフー最優秀社員賞受賞（27,000名中上位3名）。",
-    "exp.zozo.lead":"リード研究者","exp.zozo.lead.d":"ファッションインテリジェンスシステム、推薦システム、説明可能AIの研究を主導。ZOZOグループ グランプリ受賞（1,700名中上位5名）。",
-    "exp.zozo.rs":"研究者",
-    "exp.sophia":"上智大学","exp.sophia.r":"非常勤講師、理工学部","exp.sophia.d":"データサイエンス・機械学習の講義を担当。学生評価スコア：4.8/5.0。",
-    "exp.waseda.dsi":"早稲田大学","exp.waseda.dsi.r":"招聘研究員、データサイエンス研究所","exp.waseda.dsi.d":"<a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>後藤研究室</a>にて研究指導・メンタリング。4年連続首席指導実績。",
-    "exp.ucsd":"カリフォルニア大学サンディエゴ校","exp.ucsd.r":"客員研究員、コンピュータサイエンス学部","exp.ucsd.d":"<a href='https://cseweb.ucsd.edu//~jmcauley/' target='_blank'>Julian McAuley研究室</a>にて推薦システム・LLMに関する研究。",
-    "exp.dena":"DeNA Co., Ltd.","exp.dena.r":"ソフトウェアデベロッパー","exp.dena.d":"Ruby、Python、Goによるフルスタック開発とクラウドインフラ（AWS/GCP）。",
-    "exp.toreta":"株式会社トレタ","exp.toreta.r":"ソフトウェア開発インターン","exp.toreta.d":"飲食店テックスタートアップでのフルスタック開発インターン。",
-    "exp.pksha":"PKSHA Technology","exp.pksha.r":"機械学習エンジニアリングインターン","exp.pksha.d":"先進AIスタートアップでの機械学習エンジニアリングインターン。",
-    "exp.azest":"AZEST株式会社","exp.azest.r":"データサイエンスインターン","exp.azest.d":"Tableau・Power BIなどを活用したデータ分析・BIインターン。",
+    "exp.zozo.dir":"ディレクター、デプロイメント部","exp.zozo.dir.d":"ZOZOのサービスに特化したAI技術を研究・開発し、プロダクションシステムにデプロイする部門の立ち上げを担当。",
+    "exp.zozo.sm":"マネージャー / リードリサーチサイエンティスト","exp.zozo.sm.d":"10名以上のML研究チームを率いる。WWW、ICLR、IJCAI、EMNLPなどトップ国際会議で論文発表。",
+    "exp.zozo.lead":"リードリサーチサイエンティスト","exp.zozo.lead.d":"ファッションインテリジェンス、推薦システム、説明可能AIの応用ML研究を主導。大学・企業との共同研究を推進。",
+    "exp.zozo.rs":"リサーチサイエンティスト","exp.zozo.rs.d":"研究活動に加え、Vertex AIによるAutoMLパイプラインの構築や、グループ企業間の連携によるデータ利活用推進プロジェクトなど、事業課題に直結するデータサイエンス・MLエンジニアリング業務に従事。",
+    "exp.ucsd":"カリフォルニア大学サンディエゴ校","exp.ucsd.r":"客員研究員、コンピュータサイエンス学部","exp.ucsd.d":"<a href='https://cseweb.ucsd.edu//~jmcauley/' target='_blank'>Julian McAuley研究室</a>にて推薦システム・大規模モデルのファインチューニングなどに関する研究。国際会議で多数の論文を発表。",
+    "exp.sophia":"上智大学","exp.sophia.r":"非常勤講師、理工学部","exp.sophia.d":"データ分析、統計モデリング、機械学習、Pythonプログラミングの講義を担当。学生評価：4.6 → 4.8 → 4.9/5.0。",
+    "exp.waseda.dsi":"早稲田大学","exp.waseda.dsi.r":"招聘研究員、データサイエンス研究所","exp.waseda.dsi.d":"<a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>後藤研究室</a>にて学部生・大学院生の研究指導・メンタリング。",
+    "exp.dena":"DeNA Co., Ltd.","exp.dena.r":"ソフトウェアエンジニア","exp.dena.d":"グローバルモバイルゲームのバックエンド開発（Java, GCP）。数百万ユーザー規模のサービスを担当。",
+    "exp.pksha":"PKSHA Technology","exp.pksha.r":"インターン","exp.pksha.d":"機械学習エンジニアリングインターン。",
+    "exp.startree":"スターツリー株式会社","exp.startree.r":"インターン","exp.startree.d":"PythonやTableauを用いた人事データ分析チームをリード。",
+    "exp.azest":"AZEST株式会社","exp.azest.r":"インターン","exp.azest.d":"TableauやPower BIを用いたデータ分析・BI。",
+    "exp.toreta":"株式会社トレタ","exp.toreta.r":"インターン","exp.toreta.d":"飲食店テックスタートアップでのフルスタック開発インターン。",
     "edu.title":"学歴",
-    "edu.phd":"Ph.D. in Engineering（創造理工学研究科 経営システム工学専攻）","edu.phd.h":["「ZOZO 社会人ドクター制度」による支援受給","指導教員：<a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>後藤正幸教授</a>","研究：推薦システム、説明可能AI、ファッションインテリジェンス"],
-    "edu.ms":"修士（工学）創造理工学研究科 経営システム工学専攻","edu.ms.h":["首席卒業","指導教員：<a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>後藤正幸教授</a>"],
+    "edu.waseda":"早稲田大学","edu.waseda.hs":"早稲田大学高等学院",
+    "edu.phd":"博士（工学）創造理工学研究科 経営システム工学専攻","edu.phd.h":["早期卒業","<a href='https://corp.zozo.com/news/20180914-5649/' target='_blank'>ZOZO 社会人ドクター制度</a>（第一号）","指導教員：<a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>後藤正幸教授</a>","研究テーマ：機械学習に基づく消費インテリジェンスの獲得とビジネス応用"],
+    "edu.ms":"修士（工学）創造理工学研究科 経営システム工学専攻","edu.ms.h":["首席卒業","指導教員：<a href='https://www.it.mgmt.waseda.ac.jp/index.html' target='_blank'>後藤正幸教授</a>","研究テーマ1：ECサイトにおけるアンケートデータを考慮した購買行動分析モデルの提案","研究テーマ2：クレジットとポイントを併用可能な多機能クレジットカードにおける利用履歴データの統合分析モデルの提案","株式会社ZOZO、株式会社小田急電鉄、一般財団法人日本気象協会との共同研究"],
     "edu.bs":"学士（工学）創造理工学部 経営システム工学科",
-    "edu.hs":"高等学院",
+    "edu.hs":"普通科","edu.hs.h":["<a href='https://www.waseda.jp/school/shs/campus/tennis/' target='_blank'>硬式庭球部</a>（現在、OB会幹事見習い）"],
     "teaching.title":"教育活動",
-    "teaching.sophia":"上智大学 — 非常勤講師","teaching.sophia.d":"理工学部にてデータサイエンスと機械学習の講義を担当。",
-    "teaching.sophia.score":"/ 5.0 学生評価平均スコア","teaching.sophia.note":"3年間の講義を通じて、常に高い学生評価を記録。",
-    "teaching.waseda":"早稲田大学 — 客員研究員","teaching.waseda.d":"学部生・大学院生の研究指導とメンタリング。",
-    "teaching.waseda.streak":"4年連続","teaching.waseda.label":"首席卒業生の指導実績","teaching.waseda.note":"研究指導を行った学生が4年連続で首席卒業を達成しています。",
+    "teaching.sophia":"上智大学 — 非常勤講師","teaching.sophia.d":"全学共通科目を担当し、基礎統計とデータ分析、可視化、機械学習手法のビジネスデータ適用、およびそれらに必要なPythonプログラミングをレクチャー。",
+    "teaching.sophia.score":"/ 5.0 学生評価平均スコア","teaching.sophia.note":"学生評価スコア：4.6 → 4.8 → 4.9/5.0（過去3年間の推移）。","teaching.sophia.contact":"授業に関する質問、改善のアドバイス等もお気軽にご連絡ください。",
+    "teaching.waseda":"早稲田大学 — 招聘研究員","teaching.waseda.d":"学部生・大学院生の研究指導とメンタリング。",
+    "teaching.waseda.streak":"4年連続","teaching.waseda.label":"首席卒業生の指導実績","teaching.waseda.note":"メンタリングした学生が4年連続で首席卒業を達成しています。",
     "teaching.studentMsg":"これまでに授業や研究指導、<a href='https://ut-base.info/circles/122' target='_blank'>HAIT</a>メンタリングなどで関わった学生の皆さんへ — キャリアや研究で悩みがあれば、いつでも気軽に連絡してください。時間が経っていても関係ありません。<strong>いつでもお待ちしています。</strong>",
     "awards.title":"受賞歴",
     "awards.items":[
 {awards_ja}
     ],
     "media.title":"メディア掲載","media.subtitle":"研究成果が100件以上のメディアで取り上げられています。主な掲載先は以下の通りです。",
+    "media.search":"メディア掲載を検索",
     "media.more":"その他、主要テックメディア等100件以上に掲載...",
-    "service.title":"学術活動","service.reviewer":"国際会議 査読者 / プログラム委員","service.journal":"ジャーナル査読者",
-    "projects.title":"Non-Research Projects",
-    "projects.tennis":"TaRO's CUP — テニス大会・コミュニティ運営","projects.tennis.d":"テニス大会（TaRO's CUP、第6回以上開催）の主催と活気あるコミュニティの構築。ParadisoやBridgestoneなどのスポンサーと連携し、あらゆるレベルのプレーヤーが参加できるイベントを運営しています。",
-    "projects.nepal":"Nepal Japan Project","projects.nepal.d":"日本とネパール間の国際ボランティアプロジェクト（2015年、2016年）。2016年はプロジェクトリーダーとして異文化交流・コミュニティ開発を推進。",
+    "service.title":"学術活動","service.reviewer":"査読者 / プログラム委員","service.details":"詳細","service.note":"複数年の実績を含む",
+    "projects.title":"その他活動",
+    "projects.tennis":"TaRO's CUP — テニス大会・コミュニティ運営","projects.tennis.d":"テニス大会（TaRO's CUP、第6回以上開催）の主催と活気あるコミュニティの構築。Paradisoやブリヂストンスポーツなどのスポンサーと連携し、あらゆるレベルのプレーヤーが参加できるイベントを運営しています。",
+    "projects.nepal":"Nepal Japan Project","projects.nepal.d":"日本とネパール間の国際プロジェクト（2015年、2016年）。2016年はプロジェクトリーダーとして異文化交流・コミュニティ開発を推進。",
     "projects.wedding":"結婚式リアルタイムクイズアプリ","projects.wedding.d":"友人の結婚式用リアルタイムクイズアプリを開発。WebSocketによる同時接続数100名以上に対応。計3回の結婚式で利用。",
     "projects.apps":"個人アプリ・Web開発","projects.apps.d":"チャットアプリ、テニス大会専用SNS、TaRO&Companyホームページなど。Python、Ruby、Go、Kotlin、Swift、モダンWeb技術を用いたフルスタック開発。",
     "news.showAll":"すべてのニュースを表示","news.showLess":"折りたたむ",
@@ -302,54 +693,233 @@ TRANSLATIONS_JA_TEMPLATE = """  ja: {{
     "awards.showAll":"すべての受賞歴を表示","awards.showLess":"折りたたむ",
     "media.showAll":"すべてのメディア掲載を表示","media.showLess":"折りたたむ",
     "collab.title":"講演・共同研究のご依頼","collab.subtitle":"講演依頼、共同研究、イベント共催のご相談を歓迎しています。",
-    "collab.research":"共同研究","collab.research.d":"推薦システム、説明可能AI、コンピュータビジョン、LLM分野での共同研究者を積極的に募集しています。一緒にAI研究の最前線を切り拓きましょう。",
-    "collab.speaking":"講演依頼","collab.speaking.d":"カンファレンス、ワークショップ、セミナー、企業イベントでの講演依頼を積極的に受け付けています。AI/ML研究、ファッションテック、産学連携などのテーマで講演可能です。",
+    "collab.research":"共同研究","collab.research.d":"AI・機械学習・データマイニング領域での共同研究者を積極的に募集しています。一緒に面白いことをしましょう。",
+    "collab.speaking":"講演依頼","collab.speaking.d":"カンファレンス、ワークショップ、セミナー、イベントでの講演依頼を積極的に受け付けています。AI/ML研究、ファッションテック、産学連携などのテーマで講演可能です。",
     "collab.event":"イベント・学会の共催","collab.event.d":"学会やワークショップ、テック勉強会、業界イベントを一緒に企画・運営してくれる方を募集しています。新しいカンファレンスの立ち上げ、ハッカソン、異業種交流イベントなど、一緒に面白いことをやりましょう！",
+    "collab.mentoring":"メンタリング","collab.mentoring.d":"AI・機械学習の研究やキャリアなどについてメンタリングを希望する学生を歓迎しています。学部生・大学院生の方、お気軽にご連絡ください。",
     "collab.contact":"お気軽にメールまたはLinkedInからご連絡ください。お待ちしております！",
     "collab.email":"お問い合わせ",
     "footer.visitors":"訪問者マップ","footer.update":"最終更新：2026年2月",
   }}"""
 
 
-def main():
-    print("Reading CSV files...")
-    pubs = read_csv("publications.csv")
-    talks = read_csv("talks.csv")
-    media = read_csv("media.csv")
-    awards_en = read_csv("awards_en.csv")
-    awards_ja = read_csv("awards_ja.csv")
-    news_en = read_csv("news_en.csv")
-    news_ja = read_csv("news_ja.csv")
-
-    print(f"  publications: {len(pubs)} entries")
-    print(f"  talks: {len(talks)} entries")
-    print(f"  media: {len(media)} entries")
-    print(f"  awards (EN): {len(awards_en)} entries")
-    print(f"  awards (JA): {len(awards_ja)} entries")
-    print(f"  news (EN): {len(news_en)} entries")
-    print(f"  news (JA): {len(news_ja)} entries")
-
-    print("Building js/data.js...")
-
-    pubs_js = build_publications(pubs)
-    talks_js = build_talks(talks)
-    media_js = build_media(media)
-    awards_en_js = build_awards(awards_en)
-    awards_ja_js = build_awards(awards_ja)
-    news_en_js = build_news(news_en)
-    news_ja_js = build_news(news_ja)
-
-    translations_en = TRANSLATIONS_EN_TEMPLATE.format(
-        news_en=news_en_js, awards_en=awards_en_js
-    )
-    translations_ja = TRANSLATIONS_JA_TEMPLATE.format(
-        news_ja=news_ja_js, awards_ja=awards_ja_js
-    )
+# ── Responsive images ──
+# scripts/build-images.py converts every referenced image into WebP/AVIF variants
+# and lists them in pics/variants/manifest.json. Rows whose image has variants get
+# its intrinsic size (for layout-stable <img width/height>) and a srcset per format.
+
+
+def load_image_variants(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("images", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def image_metadata(entry):
+    variant_dir = os.path.relpath(os.path.dirname(IMAGE_MANIFEST), ROOT_DIR).replace(os.sep, "/")
+    srcset = {
+        fmt: ", ".join(f"{variant_dir}/{name} {width}w" for width, name, _ in variants)
+        for fmt, variants in entry["variants"].items()
+        if variants
+    }
+    return {"width": entry["width"], "height": entry["height"], "srcset": srcset}
+
+
+def attach_images(rows, images):
+    """Yield rows with an `_image` entry for builders when their image has variants."""
+    for row in rows:
+        entry = images.get(row.get("image", "").strip())
+        yield dict(row, _image=image_metadata(entry)) if entry else row
+
+
+# ── Citation snapshot ──
+# scripts/update-citations.js caches what Semantic Scholar and OpenAlex report in
+# data/citations.json, keyed by normTitle(). Counts are merged into publication
+# rows as they stream into the builders: one dict lookup per row, never lower
+# than the citations column of publications.csv.
+
+CITATIONS_FILE = "citations.json"
+CITATIONS_VERSION = 1
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+
+def norm_title(s):
+    """Identical to normTitle() in scripts/update-citations.js."""
+    return NON_ALNUM_RE.sub("", (s or "").lower())[:50]
+
+
+def read_citations(path):
+    """Counts from a citation snapshot; raises OSError or ValueError when it is unusable."""
+    with open(path, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    if not isinstance(snapshot, dict) or snapshot.get("version") != CITATIONS_VERSION:
+        raise ValueError(f"not a version {CITATIONS_VERSION} citation snapshot")
+    counts = snapshot.get("citations", {})
+    if not isinstance(counts, dict):
+        raise ValueError('"citations" is not an object')
+    return counts
+
+
+def load_citations(path):
+    try:
+        return read_citations(path)
+    except (OSError, ValueError):
+        return {}
+
+
+def citation_snapshot_age(path):
+    """(age, ttl) of the snapshot as timedeltas, or None when there is no usable snapshot."""
+    from datetime import datetime, timedelta, timezone
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        fetched = datetime.fromisoformat(snapshot["fetched"].replace("Z", "+00:00"))
+        ttl = timedelta(hours=snapshot["ttlHours"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return datetime.now(timezone.utc) - fetched, ttl
+
+
+def merge_citations(rows, counts):
+    for row in rows:
+        count = counts.get(norm_title(row["title"]))
+        if count is not None and count > int(row["citations"] or 0):
+            row = dict(row, citations=str(count))
+        yield row
+
+
+# ── Row merges ──
+# Inputs besides the section's CSV that are merged into its rows before rendering:
+# section -> (path, loader(path), merge(rows, loaded)). The path's hash is part of
+# the section's cache key, so updating it re-renders only that section.
 
-    output = f"""// ===== Publications Data =====
+def citations_path(args):
+    return args.citations or os.path.join(DATA_DIR, CITATIONS_FILE)
+
+
+def row_merges(args):
+    return {
+        "publications": (citations_path(args), load_citations, merge_citations),
+        "talks": (IMAGE_MANIFEST, load_image_variants, attach_images),
+    }
+
+
+# ── Search index ──
+# A compact inverted index over publications, talks and media, written as its own
+# content-hashed JSON asset that js/search.js fetches the first time it is needed.
+# Terms are lowercase words plus character bigrams for Japanese; postings are
+# delta-encoded document numbers (publications first, then talks, then media).
+
+SEARCH_DIR = os.path.join(ROOT_DIR, "js")
+SEARCH_INDEX_VERSION = 1
+
+# (collection, source CSV, indexed fields), in document-number order
+SEARCH_COLLECTIONS = [
+    ("publications", "publications.csv", ("title", "authors", "venue")),
+    ("talks", "talks.csv", ("title", "titleJa", "desc", "descJa")),
+    ("media", "media.csv", ("source", "title", "titleJa")),
+]
+
+CJK_CHARS = "\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff"
+WORD_RE = re.compile(r"[^\W_]+")
+SCRIPT_RUN_RE = re.compile(f"[{CJK_CHARS}]+|[^{CJK_CHARS}]+")
+CJK_RE = re.compile(f"[{CJK_CHARS}]")
+
+
+def tokenize(text):
+    """Yield search terms for `text`. Must stay in step with tokenize() in js/search.js."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    for word in WORD_RE.findall(text):
+        for run in SCRIPT_RUN_RE.findall(word):
+            if len(run) == 1 or not CJK_RE.match(run):
+                yield run
+            else:
+                for i in range(len(run) - 1):
+                    yield run[i:i + 2]
+
+
+def delta_encode(ids):
+    previous = 0
+    encoded = []
+    for i in ids:
+        encoded.append(i - previous)
+        previous = i
+    return encoded
+
+
+def build_search_index(collections):
+    """Build the index from (collection name, rows, fields) triples."""
+    postings = {}
+    counts = {}
+    doc = 0
+    for name, rows, fields in collections:
+        start = doc
+        for row in rows:
+            terms = set()
+            for field in fields:
+                terms.update(tokenize(row.get(field) or ""))
+            for term in terms:
+                postings.setdefault(term, []).append(doc)
+            doc += 1
+        counts[name] = doc - start
+
+    # UTF-16 order, which is how JS compares strings when js/search.js binary-searches
+    terms = sorted(postings, key=lambda term: term.encode("utf-16-be"))
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "counts": counts,
+        "terms": terms,
+        "postings": [delta_encode(postings[term]) for term in terms],
+    }
+
+
+def write_search_index(collections):
+    """Write js/search-index.<hash>.json, drop older copies, and return the file name."""
+    index = build_search_index(collections)
+    filename = write_hashed(SEARCH_DIR, "search-index", [to_json(index)], ext=".json")
+    for entry in os.listdir(SEARCH_DIR):
+        base = strip_compressed_suffix(entry)
+        if base.startswith("search-index.") and base.endswith(".json") and base != filename:
+            os.unlink(os.path.join(SEARCH_DIR, entry))
+    return filename
+
+
+# ── Sections ──
+# (section name, source CSV, builder per output format). Each section is cached independently.
+
+FORMATS = ("literal", "json", "interned")
+
+SECTIONS = [
+    ("publications", "publications.csv", {
+        "literal": build_publications, "json": build_publications_json, "interned": build_publications_interned,
+    }),
+    ("talks", "talks.csv", {
+        "literal": build_talks, "json": build_talks_json, "interned": build_talks_json,
+    }),
+    ("media", "media.csv", {
+        "literal": build_media, "json": build_media_json, "interned": build_media_json,
+    }),
+    ("awards_en", "awards_en.csv", {
+        "literal": build_awards, "json": build_awards_json, "interned": build_awards_json,
+    }),
+    ("awards_ja", "awards_ja.csv", {
+        "literal": build_awards, "json": build_awards_json, "interned": build_awards_json,
+    }),
+    ("news_en", "news_en.csv", {
+        "literal": build_news, "json": build_news_json, "interned": build_news_json,
+    }),
+    ("news_ja", "news_ja.csv", {
+        "literal": build_news, "json": build_news_json, "interned": build_news_json,
+    }),
+]
+
+OUTPUT_TEMPLATE = """// ===== Publications Data =====
 // Auto-generated from data/publications.csv — do not edit directly.
 // Run: python scripts/build-data.py
-{pubs_js}
+{publications}
 
 // ===== Translations =====
 const TRANSLATIONS = {{
@@ -358,16 +928,1035 @@ const TRANSLATIONS = {{
 }};
 
 // ===== Talks Data =====
-{talks_js}
+{talks}
 
 // ===== Media Data =====
-{media_js}
+{media}
+
+// ===== Search Index =====
+// Inverted index over publications, talks and media; js/search.js fetches it on first use.
+const SEARCH_INDEX_URL = {search_index};
+"""
+
+
+def iter_template(template, fields):
+    """Yield the literal text of a str.format template, expanding each field from `fields`.
+
+    Field values are callables returning an iterable of chunks, so large sections
+    are never interpolated into one string.
+    """
+    for literal, field, _, _ in string.Formatter().parse(template):
+        if literal:
+            yield literal
+        if field is not None:
+            yield from fields[field]()
+
+
+# ── Split output (--split) ──
+# js/data.js becomes a small, revalidated manifest; the data itself lives in
+# content-hashed chunks under js/data/ that can be cached immutably.
+
+BOOTSTRAP_TEMPLATE = """// ===== Data Manifest =====
+// Auto-generated by scripts/build-data.py --split — do not edit directly.
+// js/app.js loads "core" and the active language before mounting and lazy-loads the rest.
+const DATA_MANIFEST = {manifest};
+const TRANSLATIONS = {{}};
+
+// ===== Search Index =====
+const SEARCH_INDEX_URL = {search_index};
 """
 
-    with open(OUTPUT, "w", encoding="utf-8") as f:
-        f.write(output)
+CHUNK_TEMPLATES = {
+    "core": """// ===== Publications Data =====
+// Auto-generated from data/publications.csv — do not edit directly.
+// Run: python scripts/build-data.py --split
+{publications}
+""",
+    "translations-en": """// ===== Translations (EN) =====
+Object.assign(TRANSLATIONS, {{
+{translations_en}
+}});
+""",
+    "translations-ja": """// ===== Translations (JA) =====
+Object.assign(TRANSLATIONS, {{
+{translations_ja}
+}});
+""",
+    "talks": """// ===== Talks Data =====
+{talks}
+""",
+    "media": """// ===== Media Data =====
+{media}
+""",
+}
+
+
+def output_fields(fragment_paths, search_index):
+    """Template fields shared by the monolithic and split outputs."""
+    def section(name):
+        return lambda: iter_file(fragment_paths[name])
+
+    return {
+        "search_index": lambda: [to_json(search_index)],
+        "publications": section("publications"),
+        "translations_en": lambda: iter_template(TRANSLATIONS_EN_TEMPLATE, {
+            "news_en": section("news_en"), "awards_en": section("awards_en"),
+        }),
+        "translations_ja": lambda: iter_template(TRANSLATIONS_JA_TEMPLATE, {
+            "news_ja": section("news_ja"), "awards_ja": section("awards_ja"),
+        }),
+        "talks": section("talks"),
+        "media": section("media"),
+    }
+
+
+def render_output(fragment_paths, search_index):
+    """Yield js/data.js chunk by chunk from the cached section fragments."""
+    return iter_template(OUTPUT_TEMPLATE, output_fields(fragment_paths, search_index))
+
+
+DATA_MANIFEST_RE = re.compile(r"^const DATA_MANIFEST\s*=\s*(.*);$", re.M)
+
+
+def data_manifest(path):
+    """The DATA_MANIFEST (chunk name -> path) defined in `path`; empty for a single bundle."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            match = DATA_MANIFEST_RE.search(f.read())
+    except OSError:
+        return {}
+    return json.loads(match.group(1)) if match else {}
+
+
+def write_split(fragment_paths, search_index, force=False, log=print, minify=False):
+    """Write the hashed chunks and the js/data.js manifest; return (written, chunk map)."""
+    finish = minify_js if minify else iter
+    fields = output_fields(fragment_paths, search_index)
+    previous = data_manifest(OUTPUT).values()
+    chunks = {}
+    for name, template in CHUNK_TEMPLATES.items():
+        filename = write_hashed(SPLIT_DIR, name, finish(iter_template(template, fields)))
+        chunks[name] = f"js/data/{filename}"
+        size = os.path.getsize(os.path.join(SPLIT_DIR, filename))
+        log(f"  {name}: {chunks[name]} ({size} bytes)")
+
+    # Drop chunks from earlier builds, except the previous one's: a page that loaded its
+    # (revalidated, but possibly still cached) js/data.js can request them after a deploy
+    live = {os.path.basename(path) for path in [*chunks.values(), *previous]}
+    for entry in os.listdir(SPLIT_DIR):
+        base = strip_compressed_suffix(entry)
+        if base.endswith(".js") and base not in live:
+            os.unlink(os.path.join(SPLIT_DIR, entry))
+
+    bootstrap = iter_template(BOOTSTRAP_TEMPLATE, {
+        "manifest": lambda: [to_json(chunks)],
+        "search_index": fields["search_index"],
+    })
+    return write_atomic(OUTPUT, finish(bootstrap), skip_unchanged=not force), chunks
+
+
+# ── Pre-rendered HTML (--prerender) ──
+# Static English markup for the news, publications and talks lists, written into
+# index.html between PRERENDER_START and PRERENDER_END. It is visible while the Vue
+# template is still hidden by v-cloak, and js/app.js removes it once the app mounts.
+# The markup mirrors the templates in index.html, minus the interactive controls.
+# A block that is already filled in is refreshed on every build, so it never shows
+# older lists than js/data.js.
+
+INDEX_HTML = os.path.join(ROOT_DIR, "index.html")
+PRERENDER_START = "<!-- prerender:start -->"
+PRERENDER_END = "<!-- prerender:end -->"
+PRERENDER_RE = re.compile(f"{re.escape(PRERENDER_START)}.*?{re.escape(PRERENDER_END)}", re.S)
+
+# Initial list lengths of displayedNews, displayedPubs and displayedTalks in js/app.js
+PRERENDER_LIMITS = {"news": 4, "publications": 5, "talks": 3}
+
+# Same as pubTypeLabel() in js/app.js
+PUB_TYPE_LABELS = {"conference": "Conference", "journal": "Journal", "workshop": "Workshop", "preprint": "Preprint", "domestic": "Domestic"}
+
+# Same as talkType() in js/app.js: talks of these types are labelled with "talks.<type>"
+TALK_TYPE_KEYS = ("invited", "award", "presentation", "conference", "workshop", "domestic")
+
+TRANSLATION_STRING_RE = re.compile(r'"([\w.]+)":"((?:[^"\\]|\\.)*)"')
+TRANSLATIONS_JA_RE = re.compile(r"\bja:\s*\{")
+
+
+def english_strings():
+    """The plain string entries of TRANSLATIONS.en in the js/data.js just written.
+
+    Read back from the output (its translations-en chunk for --split) rather than the
+    template, so the pre-rendered labels are the ones the app will show.
+    """
+    chunks = data_manifest(OUTPUT)
+    path = os.path.join(ROOT_DIR, chunks["translations-en"]) if chunks else OUTPUT
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    text = text[text.index("TRANSLATIONS"):]
+    ja = TRANSLATIONS_JA_RE.search(text)
+    if ja:
+        text = text[:ja.start()]
+    return {key: json.loads(f'"{value}"') for key, value in TRANSLATION_STRING_RE.findall(text)}
+
+
+def talk_type_label(talk_type, t):
+    if talk_type not in TALK_TYPE_KEYS:
+        return talk_type
+    key = f"talks.{talk_type}"
+    if not t.get(key):
+        raise SystemExit(f'TRANSLATIONS.en has no "{key}" label for {talk_type} talks; add it to TRANSLATIONS_EN_TEMPLATE')
+    return t[key]
+
+
+def format_authors_html(authors):
+    """Same markup as formatAuthors() in js/app.js, which index.html inserts with v-html."""
+    return ", ".join(
+        f'<span class="me">{a}</span>' if "Shimizu" in a or "清水良太郎" in a else a
+        for a in authors
+    )
+
+
+def prerender_news(rows, t):
+    yield f'<section class="section"><div class="container">\n<h2 class="section-title">{html.escape(t["news.title"])}</h2>\n<div class="news-list">\n'
+    for row in itertools.islice(rows, PRERENDER_LIMITS["news"]):
+        badge = '<span class="news-badge new">New</span>' if news_record(row)["isNew"] else ""
+        yield f'<div class="news-item"><span class="news-date">{html.escape(row["date"])}</span>{badge}<p>{row["text"]}</p></div>\n'
+    yield "</div>\n</div></section>\n"
+
+
+def prerender_publications(rows, t):
+    records = [publication_record(row) for row in rows]
+    index = build_publication_index([index_entry(r["type"], r["year"], r.get("date"), r["citations"]) for r in records])
+    scholar = "https://scholar.google.co.jp/citations?user=imbW88cAAAAJ"
+    yield (
+        f'<section class="section section-alt"><div class="container">\n<h2 class="section-title">{html.escape(t["pub.title"])}</h2>\n'
+        f'<p class="section-subtitle">{html.escape(t["pub.subtitle"])} <a href="{scholar}" target="_blank">'
+        f'{html.escape(t["pub.scholarLink"])} <i class="fas fa-external-link-alt"></i></a></p>\n<div class="pub-list">\n'
+    )
+    for i in index["order"]["year"][:PRERENDER_LIMITS["publications"]]:
+        pub = records[i]
+        title = html.escape(pub["title"])
+        if pub["links"].get("paper"):
+            title = (f'<a href="{html.escape(pub["links"]["paper"])}" target="_blank" class="pub-title-link">{title} '
+                     '<i class="fas fa-external-link-alt" style="font-size:11px;opacity:0.5"></i></a>')
+        yield (
+            f'<div class="pub-card"><div class="pub-card-header"><h3 class="pub-title">{title}</h3></div>'
+            f'<p class="pub-authors">{format_authors_html(pub["authors"])}</p>'
+            f'<div class="pub-meta"><span class="pub-venue">{html.escape(pub["venue"])}</span>'
+            f'<span class="pub-year">{html.escape(str(pub.get("date") or pub["year"]))}</span>'
+            f'<span class="pub-type-badge {pub["type"]}">{PUB_TYPE_LABELS.get(pub["type"], pub["type"])}</span></div></div>\n'
+        )
+    yield "</div>\n</div></section>\n"
+
+
+def prerender_talks(rows, t):
+    yield f'<section class="section"><div class="container">\n<h2 class="section-title">{html.escape(t["talks.title"])}</h2>\n<div class="talks-list">\n'
+    for row in itertools.islice(rows, PRERENDER_LIMITS["talks"]):
+        talk = talk_record(row)
+        title = html.escape(talk["title"])
+        if talk["link"]:
+            title = f'<a href="{html.escape(talk["link"])}" target="_blank">{title} <i class="fas fa-external-link-alt" style="font-size:12px"></i></a>'
+        picture = ""
+        if talk["image"]:
+            sources = "".join(
+                f'<source type="image/{fmt}" srcset="{html.escape(srcset)}" sizes="(max-width: 768px) 100vw, 180px">'
+                for fmt, srcset in talk.get("srcset", {}).items()
+            )
+            size = f' width="{talk["imageWidth"]}" height="{talk["imageHeight"]}"' if "imageWidth" in talk else ""
+            picture = (f'<picture>{sources}<img src="{html.escape(talk["image"])}" alt="{html.escape(talk["title"])}"{size} '
+                       'class="talk-image" loading="lazy" decoding="async"></picture>')
+        talk_type = talk_type_label(talk["type"], t)
+        yield (
+            f'<div class="talk-item"><div class="talk-meta"><span class="talk-year">{html.escape(talk["year"])}</span>'
+            f'<span class="talk-type {talk["type"]}">{html.escape(talk_type)}</span></div>'
+            f'<div class="talk-body"><div class="talk-text"><h3>{title}</h3><p class="talk-detail">{html.escape(talk["desc"])}</p></div>'
+            f"{picture}</div></div>\n"
+        )
+    yield "</div>\n</div></section>\n"
+
+
+# (section, source CSV, renderer), in page order
+PRERENDER_SECTIONS = [
+    ("news_en", "news_en.csv", prerender_news),
+    ("publications", "publications.csv", prerender_publications),
+    ("talks", "talks.csv", prerender_talks),
+]
+
+
+def prerender_html(sources):
+    """Yield the pre-rendered block from {section: rows} for PRERENDER_SECTIONS."""
+    t = english_strings()
+    yield f'{PRERENDER_START}\n<div id="prerender">\n'
+    for name, _, render in PRERENDER_SECTIONS:
+        yield from render(sources[name], t)
+    yield f"</div>\n{PRERENDER_END}"
+
+
+def has_prerendered_block():
+    """Whether index.html's pre-rendered block has content (from an earlier --prerender)."""
+    with open(INDEX_HTML, "r", encoding="utf-8") as f:
+        match = PRERENDER_RE.search(f.read())
+    return bool(match and match.group()[len(PRERENDER_START):-len(PRERENDER_END)].strip())
+
+
+def write_prerender(block):
+    """Replace the pre-rendered block in index.html; returns whether the file changed."""
+    with open(INDEX_HTML, "r", encoding="utf-8") as f:
+        page = f.read()
+    if not PRERENDER_RE.search(page):
+        raise SystemExit(f"{INDEX_HTML} has no {PRERENDER_START} ... {PRERENDER_END} markers")
+    return write_atomic(INDEX_HTML, [PRERENDER_RE.sub(lambda _: block, page, count=1)], skip_unchanged=True)
+
+
+# ── Service worker (sw.js) ──
+# Written on every build from what was just built: index.html, the same-origin assets
+# it references and the generated data, each with a content-hash revision. A deploy
+# changes sw.js only where a revision changed, and the new worker downloads just those
+# entries. Images over PRECACHE_IMAGE_LIMIT (talk photos, pics/variants/) and
+# third-party scripts, styles and fonts are cached at runtime instead.
+
+SERVICE_WORKER = os.path.join(ROOT_DIR, "sw.js")
+PRECACHE_EXTENSIONS = (".js", ".css", ".json", ".png", ".jpg", ".jpeg", ".webp", ".avif", ".svg", ".ico")
+PRECACHE_IMAGE_LIMIT = 200_000  # bytes
+HTML_ASSET_RE = re.compile(r"""(?:src|href)="([^"#?:]+)"|url\('([^'#?:]+)'\)""")
+
+# sw.js is this template with its `const PRECACHE = {};` line filled in
+SERVICE_WORKER_TEMPLATE = os.path.join(SCRIPT_DIR, "sw.template.js")
+PRECACHE_LINE_RE = re.compile(r"^const PRECACHE = \{\};$", re.M)
+
+
+def precache_paths(outputs):
+    """Site-relative paths to precache: index.html, its same-origin assets and `outputs`."""
+    with open(INDEX_HTML, "r", encoding="utf-8") as f:
+        page = f.read()
+    paths = ["index.html"]
+    for match in HTML_ASSET_RE.finditer(page):
+        rel = match.group(1) or match.group(2)
+        path = os.path.join(ROOT_DIR, rel)
+        if not rel.lower().endswith(PRECACHE_EXTENSIONS) or not os.path.isfile(path):
+            continue
+        if rel.startswith("pics/") and os.path.getsize(path) > PRECACHE_IMAGE_LIMIT:
+            continue
+        paths.append(rel)
+    paths.extend(outputs)
+    return list(dict.fromkeys(paths))
+
+
+SEARCH_INDEX_URL_RE = re.compile(r'^const SEARCH_INDEX_URL\s*=\s*"([^"]+)";$', re.M)
+
+
+def current_outputs():
+    """Site-relative paths of the generated data on disk: js/data.js, its chunks and search index."""
+    with open(OUTPUT, "r", encoding="utf-8") as f:
+        match = SEARCH_INDEX_URL_RE.search(f.read())
+    outputs = [os.path.relpath(OUTPUT, ROOT_DIR).replace(os.sep, "/"), *data_manifest(OUTPUT).values()]
+    if match and os.path.isfile(os.path.join(ROOT_DIR, match.group(1))):
+        outputs.append(match.group(1))
+    return outputs
+
+
+def write_service_worker(paths, file_digest=hash_file):
+    """Write sw.js with a revision per path; returns (written, total precached bytes)."""
+    manifest = {
+        rel: file_digest(os.path.join(ROOT_DIR, rel))[:CHUNK_HASH_LENGTH]
+        for rel in paths
+    }
+    with open(SERVICE_WORKER_TEMPLATE, "r", encoding="utf-8") as f:
+        template = f.read()
+    if not PRECACHE_LINE_RE.search(template):
+        raise SystemExit(f"{SERVICE_WORKER_TEMPLATE} has no `const PRECACHE = {{}};` line")
+    worker = PRECACHE_LINE_RE.sub(lambda _: f"const PRECACHE = {json.dumps(manifest, indent=1)};", template, count=1)
+    written = write_atomic(SERVICE_WORKER, [worker], skip_unchanged=True)
+    return written, sum(os.path.getsize(os.path.join(ROOT_DIR, rel)) for rel in paths)
+
+
+# ── Release output (--release) ──
+# Outputs are minified and get .gz and .br siblings at maximum compression for hosts
+# that serve precompressed files. Each section is measured on its own and checked
+# against SIZE_BUDGETS, so a payload regression fails the build.
+
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# Maximum gzipped bytes per section after minification
+SIZE_BUDGETS = {
+    "publications": 16_000,
+    "talks": 2_500,
+    "media": 2_500,
+    "awards_en": 1_200,
+    "awards_ja": 1_200,
+    "news_en": 1_600,
+    "news_ja": 1_800,
+    "search": 20_000,
+}
+
+# Strings, line comments, whitespace, runs of other code, and any other single character
+JS_TOKEN_RE = re.compile(r""""(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|//[^\n]*|\s+|[^"'/\s]+|.""")
+IDENT_CHARS = frozenset(string.ascii_letters + string.digits + "_$")
+
+
+def strip_compressed_suffix(name):
+    for suffix in COMPRESSED_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def minify_js(chunks):
+    """Strip comments, indentation and optional whitespace from generated JS.
+
+    Only safe for this script's own output: no regex literals, template literals or
+    strings spanning lines. Newlines are kept after `;` so every top-level statement
+    still starts a line (update-citations.js and the tests rely on that), and
+    wherever dropping one could change automatic semicolon insertion.
+    """
+    prev = ""        # last character emitted
+    gap = ""         # whitespace skipped since then: "", " " or "\n"
+    pending = ""     # text after the last newline, which may end mid-token
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is not None:
+            pending += chunk
+            cut = pending.rfind("\n") + 1
+            if not cut:
+                continue
+            text, pending = pending[:cut], pending[cut:]
+        else:
+            text, pending = pending, ""
+
+        out = []
+        for match in JS_TOKEN_RE.finditer(text):
+            token = match.group()
+            if token.startswith("//"):
+                continue
+            if token.isspace():
+                if "\n" in token or gap == "\n":
+                    gap = "\n"
+                elif not gap:
+                    gap = " "
+                continue
+            if gap and prev:
+                first = token[0]
+                if gap == "\n" and (prev == ";" or (prev not in ",{[(:" and first not in "}]),:;")):
+                    out.append("\n")
+                elif prev in IDENT_CHARS and first in IDENT_CHARS:
+                    out.append(" ")
+            gap = ""
+            out.append(token)
+            prev = token[-1]
+        if out:
+            yield "".join(out)
+    if prev:
+        yield "\n"
+
+
+def compressed_sizes(data):
+    """(gzip, brotli) sizes of `data` at maximum compression; brotli is None without the module."""
+    gz = len(gzip.compress(data, compresslevel=9, mtime=0))
+    br = len(brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)) if brotli else None
+    return gz, br
+
+
+def write_precompressed(path):
+    """Write <path>.gz and <path>.br next to a release output.
+
+    Siblings at least as new as the output are kept, so an output that was not
+    rewritten keeps their mtimes too.
+    """
+    siblings = [path + suffix for suffix in COMPRESSED_SUFFIXES if brotli or suffix != ".br"]
+    mtime = os.stat(path).st_mtime_ns
+    if (all(os.path.exists(sibling) and os.stat(sibling).st_mtime_ns >= mtime for sibling in siblings)
+            and (brotli or not os.path.exists(path + ".br"))):
+        return
+    with open(path, "rb") as f:
+        data = f.read()
+    write_bytes_atomic(path + ".gz", gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli:
+        write_bytes_atomic(path + ".br", brotli.compress(data, quality=11, mode=brotli.MODE_TEXT))
+    elif os.path.exists(path + ".br"):
+        # A stale .br would be served in place of the new output
+        os.unlink(path + ".br")
+
+
+def remove_precompressed(path):
+    """Drop siblings left by an earlier --release build; they would shadow the new output."""
+    for suffix in COMPRESSED_SUFFIXES:
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+
+def write_bytes_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, default_file_mode())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def size_report(manifest):
+    """Minified/gzip/brotli bytes per section and for the search index, with budgets."""
+    rows = []
+    for name, _, _ in SECTIONS:
+        path = os.path.join(CACHE_DIR, manifest["sections"][name]["fragment"])
+        rows.append((name, os.path.getsize(path), "".join(minify_js(iter_file(path))).encode("utf-8")))
+    search = os.path.join(SEARCH_DIR, manifest["search"]["file"])
+    with open(search, "rb") as f:
+        data = f.read()
+    rows.append(("search", len(data), data))
+
+    report = []
+    for name, raw, data in rows:
+        gz, br = compressed_sizes(data)
+        report.append({"section": name, "raw": raw, "min": len(data), "gzip": gz, "brotli": br,
+                       "budget": SIZE_BUDGETS.get(name)})
+    return report
+
+
+def print_size_report(report, log=print):
+    log(f"\n{'section':<14} {'raw':>9} {'min':>9} {'gzip':>9} {'brotli':>9} {'budget':>9}")
+    for entry in report:
+        br = "-" if entry["brotli"] is None else entry["brotli"]
+        budget = "-" if entry["budget"] is None else entry["budget"]
+        flag = "  OVER BUDGET" if over_budget(entry) else ""
+        log(f"{entry['section']:<14} {entry['raw']:>9} {entry['min']:>9} {entry['gzip']:>9} {br:>9} {budget:>9}{flag}")
+    if brotli is None:
+        log("(brotli module not installed: pip install brotli for .br output and sizes)")
+
+
+def over_budget(entry):
+    return entry["budget"] is not None and entry["gzip"] > entry["budget"]
+
+
+def count_rows(rows, counter):
+    for row in rows:
+        counter[0] += 1
+        yield row
+
+
+# ── Profiling (--profile) ──
+# Each phase records wall and CPU time and the peak memory allocated while it ran.
+# Lazy iterables (CSV rows, template chunks) are wrapped so the time spent producing
+# them is split out from the builder or writer consuming them.
+
+PROFILE_VERSION = 1
+PROFILE_OUTPUT = os.path.join(ROOT_DIR, "build-profile.json")
+_open_phases = []
+
+
+@contextlib.contextmanager
+def profile_phase(profile, name):
+    """Record one phase in `profile` (a list, or None when not profiling); yields its stats."""
+    stats = {"phase": name}
+    if profile is None:
+        yield stats
+        return
+    # Phases nest (total > section), and resetting the peak for the inner one must not
+    # lose what the outer ones have seen so far
+    current, peak = tracemalloc.get_traced_memory()
+    for outer in _open_phases:
+        outer["_peak"] = max(outer["_peak"], peak)
+    tracemalloc.reset_peak()
+    stats["_peak"] = current
+    _open_phases.append(stats)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield stats
+    finally:
+        stats["wall_ms"] = (time.perf_counter() - wall) * 1000
+        stats["cpu_ms"] = (time.process_time() - cpu) * 1000
+        _open_phases.remove(stats)
+        stats["peak_bytes"] = max(stats.pop("_peak"), tracemalloc.get_traced_memory()[1]) - current
+        profile.append(stats)
+
+
+def timed_iter(iterable, stats, key):
+    """Yield from `iterable`, adding the wall/CPU time spent producing items to stats[key + "_ms"]."""
+    stats.setdefault(f"{key}_wall_ms", 0.0)
+    stats.setdefault(f"{key}_cpu_ms", 0.0)
+    iterator = iter(iterable)
+    while True:
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            stats[f"{key}_wall_ms"] += (time.perf_counter() - wall) * 1000
+            stats[f"{key}_cpu_ms"] += (time.process_time() - cpu) * 1000
+        yield item
+
+
+def print_profile(profile, log=print):
+    log(f"\n{'phase':<29} {'wall ms':>9} {'cpu ms':>9} {'read ms':>9} {'peak KB':>9} {'rows':>8} {'bytes':>10}")
+    for stats in profile:
+        read = stats.get("read_wall_ms", stats.get("template_wall_ms"))
+        phase = stats["phase"] + (" (cached)" if stats.get("cached") else "")
+        log(f"{phase:<29} {stats['wall_ms']:>9.1f} {stats['cpu_ms']:>9.1f} "
+            f"{'' if read is None else f'{read:.1f}':>9} {stats['peak_bytes'] / 1024:>9.1f} "
+            f"{stats.get('rows', ''):>8} {stats.get('output_bytes', ''):>10}")
+    log("(read ms: time spent parsing CSV rows, or filling the template for the output phase)")
+
+
+def write_profile(path, args, profile):
+    report = {
+        "version": PROFILE_VERSION,
+        "python": sys.version.split()[0],
+        "format": args.format,
+        "split": args.split,
+        "force": args.force,
+        "phases": profile,
+    }
+    # abspath: a bare file name has no directory for the temporary file
+    write_atomic(os.path.abspath(path), [json.dumps(report, indent=1), "\n"])
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build js/data.js from data/*.csv")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="ignore the build cache, rebuild every section and rewrite js/data.js",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="literal",
+        help="emit datasets as JS object literals (default), as JSON.parse('...') payloads, "
+        "or as JSON payloads with interned author/venue names",
+    )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help="emit content-hashed chunks under js/data/ and make js/data.js their manifest",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="rebuild whenever data/*.csv or this script changes",
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        nargs="?",
+        const=8000,
+        metavar="PORT",
+        help="with --watch, serve the site (default port 8000) and live-reload open pages",
+    )
+    parser.add_argument(
+        "--release",
+        action="store_true",
+        help="minify the output, write .gz/.br siblings and fail when a section is over its size budget",
+    )
+    parser.add_argument(
+        "--prerender",
+        action="store_true",
+        help="write static English HTML for the news, publications and talks lists into index.html "
+             "(later builds keep it up to date)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        metavar="DIR",
+        help="read the CSVs and citations.json from DIR instead of data/",
+    )
+    parser.add_argument(
+        "--citations",
+        metavar="JSON",
+        help=f"citation snapshot to merge into publications (default: {CITATIONS_FILE} in the data directory when present)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILE_OUTPUT,
+        metavar="JSON",
+        help="time and trace memory per phase and section, print a table and write it as JSON "
+             f"(default: {os.path.relpath(PROFILE_OUTPUT, ROOT_DIR)})",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="FILE",
+        help="also run the build under cProfile and dump the stats to FILE (for pstats/snakeviz)",
+    )
+    parser.add_argument(
+        "--sw-only",
+        action="store_true",
+        help="skip the build and only refresh the revisions in sw.js for the files on disk "
+             "(after editing js/data.js, index.html or other precached files by hand)",
+    )
+    args = parser.parse_args(argv)
+    if args.sw_only and (args.watch or args.split or args.release or args.prerender or args.profile or args.cprofile):
+        parser.error("--sw-only cannot be combined with build options")
+    # A missing or broken default snapshot just means no counts yet; a named one is a mistake
+    if args.citations:
+        try:
+            read_citations(args.citations)
+        except (OSError, ValueError) as e:
+            parser.error(f"--citations {args.citations}: {getattr(e, 'strerror', None) or e}")
+    if args.serve and not args.watch:
+        parser.error("--serve requires --watch")
+    if args.watch and (args.profile or args.cprofile):
+        parser.error("--profile and --cprofile cannot be combined with --watch")
+    return args
+
+
+def build(args, script_hash, manifest, file_digest=hash_file, load_rows=None, log=print, profile=None):
+    """Render every section (reusing cached fragments) and write the output.
+
+    `file_digest(path)` and `load_rows(filename, digest)` let watch mode serve hashes
+    and parsed rows from memory. With --profile, per-phase stats are appended to the
+    `profile` list. Returns (new manifest, written, rebuilt, reused).
+    """
+    # Builders live in this script, so any edit to it invalidates every cached fragment.
+    cached_sections = manifest.get("sections", {}) if manifest.get("script") == script_hash else {}
+
+    fragment_paths = {}
+    sections = {}
+    rebuilt = []
+    reused = []
+    merges = row_merges(args)
+    source_digests = {}
+    for name, filename, builders in SECTIONS:
+        with profile_phase(profile, f"section:{name}") as stats:
+            source_digest = digest = source_digests[name] = file_digest(os.path.join(DATA_DIR, filename))
+            merge = merges.get(name)
+            if merge and os.path.exists(merge[0]):
+                digest = sha256(source_digest + file_digest(merge[0]))
+            cached = cached_sections.get(name)
+            if cached and cached.get("input") == digest and cached.get("format") == args.format:
+                path = os.path.join(CACHE_DIR, cached["fragment"])
+                if os.path.exists(path):
+                    fragment_paths[name] = path
+                    sections[name] = cached
+                    reused.append(name)
+                    stats.update(cached=True, rows=cached["rows"], output_bytes=os.path.getsize(path))
+                    continue
+
+            # Fragments are named by input hash, so a stale manifest never points at a newer fragment.
+            fragment = f"{name}-{args.format}-{digest[:16]}.js"
+            rows = [0]
+            builder = builders[args.format]
+            source = load_rows(filename, source_digest) if load_rows else iter_csv(filename)
+            if profile is not None:
+                source = timed_iter(source, stats, "read")
+            if merge:
+                path, load, merge_rows = merge
+                source = merge_rows(source, load(path))
+            write_atomic(os.path.join(CACHE_DIR, fragment), builder(count_rows(source, rows)))
+            log(f"  {name}: {rows[0]} entries")
+            fragment_paths[name] = os.path.join(CACHE_DIR, fragment)
+            sections[name] = {"input": digest, "format": args.format, "rows": rows[0], "fragment": fragment}
+            rebuilt.append(name)
+            stats.update(cached=False, rows=rows[0], output_bytes=os.path.getsize(fragment_paths[name]))
+
+    # The search index spans several sections, so it is cached on all of their inputs
+    search_inputs = [sections[name]["input"] for name, _, _ in SEARCH_COLLECTIONS]
+    cached_search = manifest.get("search", {}) if manifest.get("script") == script_hash else {}
+    with profile_phase(profile, "search") as stats:
+        if cached_search.get("inputs") == search_inputs and os.path.exists(os.path.join(SEARCH_DIR, cached_search["file"])):
+            search = cached_search
+            stats["cached"] = True
+        else:
+            collections = []
+            for name, filename, fields in SEARCH_COLLECTIONS:
+                source = load_rows(filename, source_digests[name]) if load_rows else iter_csv(filename)
+                if profile is not None:
+                    source = timed_iter(source, stats, "read")
+                collections.append((name, source, fields))
+            search = {"inputs": search_inputs, "file": write_search_index(collections)}
+            stats["cached"] = False
+        size = os.path.getsize(os.path.join(SEARCH_DIR, search["file"]))
+        stats["output_bytes"] = size
+        if not stats["cached"]:
+            log(f"  search index: js/{search['file']} ({size} bytes)")
+    search_url = f"js/{search['file']}"
+
+    with profile_phase(profile, "output") as stats:
+        if args.split:
+            log("Building js/data/ chunks...")
+            written, chunks = write_split(fragment_paths, search_url, force=args.force, log=log, minify=args.release)
+            paths = [OUTPUT] + [os.path.join(ROOT_DIR, path) for path in chunks.values()]
+        else:
+            log("Building js/data.js...")
+            chunks = render_output(fragment_paths, search_url)
+            if profile is not None:
+                chunks = timed_iter(chunks, stats, "template")
+            if args.release:
+                chunks = minify_js(chunks)
+            written = write_atomic(OUTPUT, chunks, skip_unchanged=not args.force)
+            paths = [OUTPUT]
+        stats["output_bytes"] = sum(os.path.getsize(path) for path in paths)
+
+        paths.append(os.path.join(SEARCH_DIR, search["file"]))
+        for path in paths:
+            if args.release:
+                write_precompressed(path)
+            else:
+                remove_precompressed(path)
+    outputs = [os.path.relpath(path, ROOT_DIR).replace(os.sep, "/") for path in paths]
+
+    if args.prerender or has_prerendered_block():
+        with profile_phase(profile, "prerender") as stats:
+            sources = {}
+            for name, filename, _ in PRERENDER_SECTIONS:
+                source = load_rows(filename, source_digests[name]) if load_rows else iter_csv(filename)
+                if name in merges:
+                    path, load, merge_rows = merges[name]
+                    source = merge_rows(source, load(path))
+                sources[name] = source
+            block = "".join(prerender_html(sources))
+            stats["output_bytes"] = len(block.encode("utf-8"))
+            if write_prerender(block):
+                log(f"  pre-rendered HTML: index.html ({stats['output_bytes']} bytes)")
+
+    # After pre-rendering, which can change index.html
+    with profile_phase(profile, "service-worker") as stats:
+        precache = precache_paths(outputs)
+        sw_written, stats["precache_bytes"] = write_service_worker(precache, file_digest)
+        stats["output_bytes"] = os.path.getsize(SERVICE_WORKER)
+        if sw_written:
+            log(f"  service worker: sw.js ({len(precache)} precached files, {stats['precache_bytes']} bytes)")
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "script": script_hash,
+        "sections": sections,
+        "search": search,
+        "outputs": outputs,
+    }
+    with profile_phase(profile, "manifest"):
+        save_manifest(manifest)
+
+        live = {entry["fragment"] for entry in sections.values()} | {os.path.basename(MANIFEST)}
+        for entry in os.listdir(CACHE_DIR):
+            if entry not in live and not entry.startswith("."):
+                os.unlink(os.path.join(CACHE_DIR, entry))
+
+    return manifest, written, rebuilt, reused
+
+
+# ── Watch mode (--watch) ──
+# data/*.csv and this script are polled; parsed rows stay in memory between
+# rebuilds, so a save only re-reads and re-renders the CSV that changed.
+
+WATCH_INTERVAL = 0.05  # seconds between polls
+WATCH_DEBOUNCE = 0.05  # quiet period after the last change before rebuilding
+
+RELOAD_SNIPPET = b"""<script>new EventSource("/__reload").onmessage = () => location.reload();</script>"""
+
+
+def snapshot(paths):
+    """Map each path to (mtime_ns, size), or None when it does not exist."""
+    result = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            result[path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            result[path] = None
+    return result
+
+
+def watch_row_cache():
+    """Digest and row loaders for build() that reuse parsed CSVs held in memory."""
+    entries = {}  # path -> {"stat", "digest", "rows"}
+
+    def file_digest(path):
+        st = snapshot([path])[path]
+        entry = entries.get(path)
+        if entry is None or entry["stat"] != st:
+            entry = entries[path] = {"stat": st, "digest": hash_file(path), "rows": None}
+        return entry["digest"]
+
+    def load_rows(filename, digest):
+        entry = entries[os.path.join(DATA_DIR, filename)]
+        if entry["rows"] is None or entry["digest"] != digest:
+            entry["rows"] = read_csv(filename)
+        return entry["rows"]
+
+    return file_digest, load_rows
+
+
+def start_server(port):
+    """Serve the site from ROOT_DIR and push a reload event to open pages after each build."""
+    import functools
+    import threading
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+    reload_state = {"generation": 0}
+    changed = threading.Condition()
+
+    class Handler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path == "/__reload":
+                return self.stream_reloads()
+            path = self.translate_path(self.path)
+            if os.path.isdir(path):
+                path = os.path.join(path, "index.html")
+            if not path.endswith(".html") or not os.path.isfile(path):
+                return super().do_GET()
+            # Inject the reload listener so index.html itself stays untouched
+            with open(path, "rb") as f:
+                body = f.read().replace(b"</body>", RELOAD_SNIPPET + b"</body>", 1)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def stream_reloads(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            with changed:
+                seen = reload_state["generation"]
+            try:
+                while True:
+                    with changed:
+                        changed.wait_for(lambda: reload_state["generation"] != seen, timeout=15)
+                        current = reload_state["generation"]
+                    # A bare comment keeps idle connections alive
+                    self.wfile.write(b"data: reload\n\n" if current != seen else b": ping\n\n")
+                    self.wfile.flush()
+                    seen = current
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    server = ThreadingHTTPServer(("", port), functools.partial(Handler, directory=ROOT_DIR))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving {ROOT_DIR} at http://localhost:{port}/ (live reload enabled)")
+
+    def notify():
+        with changed:
+            reload_state["generation"] += 1
+            changed.notify_all()
+
+    return notify
+
+
+def watch(args, script_hash):
+    script_path = os.path.abspath(__file__)
+    watched = [script_path, SERVICE_WORKER_TEMPLATE] + [path for path, _, _ in row_merges(args).values()]
+    watched += [os.path.join(DATA_DIR, filename) for _, filename, _ in SECTIONS]
+    file_digest, load_rows = watch_row_cache()
+    notify = start_server(args.serve) if args.serve else None
+
+    manifest = {} if args.force else load_manifest()
+    manifest, _, _, _ = build(args, script_hash, manifest, file_digest, load_rows)
+    # Only the first build honours --force; later ones rewrite data.js only on change
+    args.force = False
+
+    print(f"Watching {DATA_DIR}, {os.path.relpath(script_path, ROOT_DIR)} and "
+          f"{os.path.relpath(SERVICE_WORKER_TEMPLATE, ROOT_DIR)} (Ctrl+C to stop)...")
+    last = snapshot(watched)
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            current = snapshot(watched)
+            if current == last:
+                continue
+            # Debounce: editors often write a file in several steps
+            while True:
+                time.sleep(WATCH_DEBOUNCE)
+                settled = snapshot(watched)
+                if settled == current:
+                    break
+                current = settled
+            changed = [path for path in watched if current[path] != last[path]]
+            changed_files = ", ".join(os.path.relpath(path, ROOT_DIR) for path in changed)
+            last = current
+
+            if script_path in changed:
+                print(f"{os.path.relpath(script_path, ROOT_DIR)} changed, restarting...")
+                os.execv(sys.executable, [sys.executable, script_path] + sys.argv[1:])
+
+            start = time.perf_counter()
+            try:
+                manifest, written, rebuilt, _ = build(
+                    args, script_hash, manifest, file_digest, load_rows, log=lambda *a: None
+                )
+            except Exception as e:
+                # Keep watching: the next save usually fixes a half-edited CSV
+                print(f"[watch] {changed_files}: build failed: {type(e).__name__}: {e}")
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            status = "written" if written else "unchanged"
+            print(f"[watch] {changed_files}: rebuilt {', '.join(rebuilt) or '(none)'} "
+                  f"in {elapsed:.1f} ms ({status})")
+            if written and notify:
+                notify()
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def main(argv=None):
+    global DATA_DIR
+    args = parse_args(argv)
+    if args.data_dir:
+        DATA_DIR = os.path.abspath(args.data_dir)
+
+    if args.sw_only:
+        written, size = write_service_worker(precache_paths(current_outputs()))
+        state = "written" if written else "up to date, not rewritten"
+        print(f"{SERVICE_WORKER} {state} ({size} bytes precached)")
+        return
+
+    script_hash = hash_file(os.path.abspath(__file__))
+
+    if args.watch:
+        watch(args, script_hash)
+        return
+
+    manifest = {} if args.force else load_manifest()
+    profile = [] if args.profile else None
+    profiler = None
+    if args.cprofile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    if profile is not None:
+        tracemalloc.start()
+
+    citations = citations_path(args)
+    age = citation_snapshot_age(citations)
+    if age and age[0] > age[1]:
+        print(f"Warning: {os.path.relpath(citations, ROOT_DIR)} is {age[0].days} days old (TTL {age[1]}), "
+              "run node scripts/update-citations.js --snapshot-only to refresh it")
+
+    print("Reading CSV files...")
+    if profiler:
+        profiler.enable()
+    with profile_phase(profile, "total"):
+        manifest, written, rebuilt, reused = build(args, script_hash, manifest, profile=profile)
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.cprofile)
+    if profile is not None:
+        tracemalloc.stop()
 
-    print(f"Written to {OUTPUT}")
+    print(f"  rebuilt: {', '.join(rebuilt) or '(none)'}")
+    print(f"  reused:  {', '.join(reused) or '(none)'}")
+    if written:
+        print(f"Written to {OUTPUT}")
+    else:
+        print(f"{OUTPUT} is up to date, not rewritten")
+    if profile is not None:
+        print_profile(profile)
+        write_profile(args.profile, args, profile)
+        print(f"Profile written to {args.profile}")
+    if profiler:
+        print(f"cProfile stats written to {args.cprofile}")
+    if args.release:
+        report = size_report(manifest)
+        print_size_report(report)
+        over = [entry["section"] for entry in report if over_budget(entry)]
+        if over:
+            sys.exit(f"Size budget exceeded: {', '.join(over)} (see SIZE_BUDGETS in {os.path.basename(__file__)})")
     print("Done!")
 
 
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Build resized WebP/AVIF variants of the images the site references.
+
+Usage:
+    python scripts/build-images.py            # convert new or changed images only
+    python scripts/build-images.py --force    # ignore the cache and convert everything
+    python scripts/build-images.py --jobs 4   # size of the worker process pool
+
+Images read:
+    data/talks.csv (image column) - Talk photos, rendered at 180px (100% width on mobile)
+    index.html (<img src>)        - Timeline logos and project photos
+
+Variants are written to pics/variants/ as <name>-<width>.webp and .avif, at every
+width in the image's size class that is smaller than the original. The original is
+kept as the fallback for browsers without WebP support.
+
+pics/variants/manifest.json records the source hash of every image, so unchanged
+images are skipped, together with each image's intrinsic size and its variants.
+scripts/build-data.py reads it to add width/height and srcset data to TALKS, so
+run it afterwards. The <img> tags in index.html are wrapped in a <picture> with
+the variants here directly; tags inside the pre-rendered block are left to
+build-data.py.
+
+Requires Pillow (pip install Pillow). AVIF needs Pillow 11.3+ or the
+pillow-avif-plugin package; without it only WebP variants are written.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPT_DIR)
+DATA_DIR = os.path.join(ROOT_DIR, "data")
+INDEX_HTML = os.path.join(ROOT_DIR, "index.html")
+VARIANT_DIR = os.path.join(ROOT_DIR, "pics", "variants")
+MANIFEST = os.path.join(VARIANT_DIR, "manifest.json")
+MANIFEST_VERSION = 1
+
+# Target widths per size class: 1x/2x/3x of the largest rendered size
+WIDTHS = {
+    "logo": (28, 56, 84),          # .timeline-logo is 28px square
+    "photo": (360, 720, 1080),     # .talk-image is 180px, full width (~720px) on mobile
+}
+QUALITY = {"webp": 75, "avif": 50}
+FORMATS = ("avif", "webp")
+
+# sizes attribute per size class for the <img> tags in index.html
+HTML_SIZES = {
+    "logo": "28px",
+    "photo": "(max-width: 768px) 100vw, 444px",  # .project-image fills half of the 960px container
+}
+
+# An <img> of a local JPEG/PNG, with the <picture> and <source>s of an earlier run
+HTML_IMAGE_RE = re.compile(
+    r'(<picture>(?:<source [^>]*>)*)?(<img src="(pics/[^"]+\.(?:jpe?g|png))"[^>]*>)(?(1)</picture>)'
+)
+IMG_SIZE_ATTR_RE = re.compile(r'\s(?:width|height)="\d+"')
+PRERENDER_RE = re.compile(r"<!-- prerender:start -->.*?<!-- prerender:end -->", re.S)
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def size_class(rel):
+    return "logo" if rel.startswith("pics/logos/") else "photo"
+
+
+def split_prerendered(page):
+    """(before, pre-rendered block, after) of index.html; the block is build-data.py's."""
+    match = PRERENDER_RE.search(page)
+    if not match:
+        return page, "", ""
+    return page[:match.start()], match.group(), page[match.end():]
+
+
+def referenced_images():
+    """Site-relative paths of every image used by talks.csv and index.html, in first-seen order."""
+    paths = []
+    with open(os.path.join(DATA_DIR, "talks.csv"), "r", encoding="utf-8") as f:
+        paths.extend(row["image"].strip() for row in csv.DictReader(f))
+    with open(INDEX_HTML, "r", encoding="utf-8") as f:
+        before, _, after = split_prerendered(f.read())
+    paths.extend(match.group(3) for match in HTML_IMAGE_RE.finditer(before + after))
+    return list(dict.fromkeys(path for path in paths if path))
+
+
+def available_formats():
+    from PIL import Image
+
+    try:
+        import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow)
+    except ImportError:
+        pass
+    Image.init()
+    return [fmt for fmt in FORMATS if fmt.upper() in Image.SAVE]
+
+
+def variant_name(rel, width, fmt):
+    stem = os.path.splitext(os.path.relpath(rel, "pics"))[0].replace(os.sep, "-")
+    return f"{stem}-{width}.{fmt}"
+
+
+def render_variants(rel, digest, widths, formats):
+    """Worker: write every variant of one image and return its manifest entry."""
+    from PIL import Image, ImageOps
+
+    with Image.open(os.path.join(ROOT_DIR, rel)) as source:
+        # Phone photos carry their rotation in EXIF, which the variants would lose
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    width, height = image.size
+
+    # Never upscale; an image narrower than every target still gets one re-encoded copy
+    targets = [w for w in widths if w < width] or [width]
+    variants = {fmt: [] for fmt in formats}
+    for target in targets:
+        resized = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))), Image.Resampling.LANCZOS
+        )
+        for fmt in formats:
+            name = variant_name(rel, target, fmt)
+            path = os.path.join(VARIANT_DIR, name)
+            tmp = path + ".tmp"
+            options = {"method": 6} if fmt == "webp" else {"speed": 4}
+            resized.save(tmp, fmt.upper(), quality=QUALITY[fmt], **options)
+            os.replace(tmp, path)
+            variants[fmt].append([target, name, os.path.getsize(path)])
+
+    return {
+        "input": digest,
+        "settings": settings_key(widths, formats),
+        "bytes": os.path.getsize(os.path.join(ROOT_DIR, rel)),
+        "width": width,
+        "height": height,
+        "variants": variants,
+    }
+
+
+def picture_html(match, images):
+    """A <picture> with every variant of the matched <img>, or the bare <img> without variants."""
+    img, rel = match.group(2), match.group(3)
+    entry = images.get(rel)
+    if not entry:
+        return img
+    img = IMG_SIZE_ATTR_RE.sub("", img).replace(
+        f'src="{rel}"', f'src="{rel}" width="{entry["width"]}" height="{entry["height"]}"', 1
+    )
+    variant_dir = os.path.relpath(VARIANT_DIR, ROOT_DIR).replace(os.sep, "/")
+    sources = "".join(
+        f'<source type="image/{fmt}" srcset="{", ".join(f"{variant_dir}/{name} {width}w" for width, name, _ in variants)}" '
+        f'sizes="{HTML_SIZES[size_class(rel)]}">'
+        for fmt, variants in entry["variants"].items()
+        if variants
+    )
+    return f"<picture>{sources}{img}</picture>"
+
+
+def write_html_images(images):
+    """Point the <img> tags in index.html at their variants; returns whether it changed."""
+    with open(INDEX_HTML, "r", encoding="utf-8") as f:
+        page = f.read()
+    before, block, after = split_prerendered(page)
+    updated = "".join((
+        HTML_IMAGE_RE.sub(lambda match: picture_html(match, images), before),
+        block,
+        HTML_IMAGE_RE.sub(lambda match: picture_html(match, images), after),
+    ))
+    if updated == page:
+        return False
+    tmp = INDEX_HTML + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(updated)
+    os.replace(tmp, INDEX_HTML)
+    return True
+
+
+def settings_key(widths, formats):
+    return f"{','.join(map(str, widths))}|{','.join(formats)}|{json.dumps(QUALITY, sort_keys=True)}"
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def save_manifest(images):
+    tmp = MANIFEST + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "images": images}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, MANIFEST)
+
+
+def is_fresh(entry, digest, settings):
+    if not entry or entry.get("input") != digest or entry.get("settings") != settings:
+        return False
+    return all(
+        os.path.exists(os.path.join(VARIANT_DIR, name))
+        for variants in entry["variants"].values()
+        for _, name, _ in variants
+    )
+
+
+def kb(n):
+    return f"{n / 1024:.1f} KB"
+
+
+def report(images):
+    """Print original bytes next to the variant a browser would pick for each format."""
+    print(f"\n{'image':<36} {'original':>11} {'avif (max)':>11} {'webp (max)':>11} {'smallest':>11}")
+    totals = {"original": 0, "avif": 0, "webp": 0, "smallest": 0}
+    for rel, entry in images.items():
+        largest = {fmt: variants[-1][2] for fmt, variants in entry["variants"].items() if variants}
+        smallest = entry["variants"].get("avif") or entry["variants"].get("webp")
+        # Browsers fall back to the original when a format was not generated
+        avif = largest.get("avif", largest.get("webp", entry["bytes"]))
+        webp = largest.get("webp", entry["bytes"])
+        smallest = smallest[0][2] if smallest else entry["bytes"]
+        totals["original"] += entry["bytes"]
+        totals["avif"] += avif
+        totals["webp"] += webp
+        totals["smallest"] += smallest
+        print(f"{rel:<36} {kb(entry['bytes']):>11} {kb(avif):>11} {kb(webp):>11} {kb(smallest):>11}")
+    print(f"{'total':<36} {kb(totals['original']):>11} {kb(totals['avif']):>11} "
+          f"{kb(totals['webp']):>11} {kb(totals['smallest']):>11}")
+    if totals["original"]:
+        saved = 1 - totals["smallest"] / totals["original"]
+        print(f"Smallest variants save {saved:.0%} of the original bytes.")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build WebP/AVIF variants of the site's images")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="ignore pics/variants/manifest.json and convert every image",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (default: one per CPU)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        formats = available_formats()
+    except ImportError:
+        sys.exit("build-images.py requires Pillow: pip install Pillow")
+    if not formats:
+        sys.exit("This Pillow build has neither a WebP nor an AVIF encoder; "
+                 "install one with WebP support (pip install --force-reinstall Pillow)")
+    if "avif" not in formats:
+        print("AVIF encoder not available (needs Pillow 11.3+ or pillow-avif-plugin), writing WebP only")
+
+    os.makedirs(VARIANT_DIR, exist_ok=True)
+    cached = {} if args.force else load_manifest().get("images", {})
+    images = {}
+    pending = {}
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for rel in referenced_images():
+            path = os.path.join(ROOT_DIR, rel)
+            if not os.path.exists(path):
+                print(f"  missing: {rel} (skipped)")
+                continue
+            digest = sha256_file(path)
+            widths = WIDTHS[size_class(rel)]
+            if is_fresh(cached.get(rel), digest, settings_key(widths, formats)):
+                images[rel] = cached[rel]
+                continue
+            pending[rel] = pool.submit(render_variants, rel, digest, widths, formats)
+
+        for rel, future in pending.items():
+            images[rel] = future.result()
+            print(f"  {rel}: {len(images[rel]['variants'][formats[0]])} widths")
+
+    print(f"Converted {len(pending)} images, {len(images) - len(pending)} unchanged")
+
+    live = {name for entry in images.values() for variants in entry["variants"].values() for _, name, _ in variants}
+    live.add(os.path.basename(MANIFEST))
+    for entry in os.listdir(VARIANT_DIR):
+        if entry not in live:
+            os.unlink(os.path.join(VARIANT_DIR, entry))
+
+    save_manifest(images)
+    if write_html_images(images):
+        print("Updated the <img> tags in index.html (run python scripts/build-data.py to refresh sw.js)")
+    report(images)
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+// ===== Service Worker =====
+// Generated from scripts/sw.template.js by scripts/build-data.py — edit the template, not sw.js.
+// Precaches the site under content-hash revisions and serves those entries from the
+// cache. A deploy (or scripts/update-citations.js) changes sw.js only where a revision
+// changed; the browser's update check then installs a worker that downloads just those
+// entries and takes over once open tabs close, so cached files never mix two deploys.
+
+// ===== Precache Manifest =====
+const PRECACHE = {};
+
+const PRECACHE_NAME = "precache-v1";
+const RUNTIME_NAME = "runtime-v1";
+const scope = new URL(self.registration.scope);
+
+function precacheKey(path) {
+  return new URL(`${path}?__rev=${PRECACHE[path]}`, scope).href;
+}
+
+// Manifest path of a request, with index.html for the start page, or null
+function precachePath(url) {
+  if (url.origin !== scope.origin || !url.pathname.startsWith(scope.pathname)) return null;
+  const path = url.pathname.slice(scope.pathname.length) || "index.html";
+  return path in PRECACHE ? path : null;
+}
+
+self.addEventListener("install", event => {
+  event.waitUntil(caches.open(PRECACHE_NAME).then(cache => Promise.all(
+    Object.keys(PRECACHE).map(async path => {
+      const key = precacheKey(path);
+      if (await cache.match(key)) return; // same revision as an earlier deploy
+      const response = await fetch(new URL(path, scope), { cache: "no-cache" });
+      if (!response.ok) throw new Error(`Precache of ${path} failed: HTTP ${response.status}`);
+      await cache.put(key, response);
+    })
+  )));
+});
+
+self.addEventListener("activate", event => {
+  const live = new Set(Object.keys(PRECACHE).map(precacheKey));
+  event.waitUntil((async () => {
+    const names = await caches.keys();
+    await Promise.all(names.filter(name => name !== PRECACHE_NAME && name !== RUNTIME_NAME).map(name => caches.delete(name)));
+    const cache = await caches.open(PRECACHE_NAME);
+    const stale = (await cache.keys()).filter(request => !live.has(request.url));
+    await Promise.all(stale.map(request => cache.delete(request)));
+    await self.clients.claim();
+  })());
+});
+
+// Runtime cache for files outside the manifest: serve what is cached, refresh it in the background
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(RUNTIME_NAME);
+  const cached = await cache.match(event.request);
+  const update = fetch(event.request).then(response => {
+    if (response.ok || response.type === "opaque") {
+      event.waitUntil(cache.put(event.request, response.clone()));
+    }
+    return response;
+  });
+  if (!cached) return update;
+  event.waitUntil(update.catch(() => {}));
+  return cached;
+}
+
+self.addEventListener("fetch", event => {
+  if (event.request.method !== "GET") return;
+  const url = new URL(event.request.url);
+  const path = precachePath(url);
+  if (path) {
+    event.respondWith(caches.match(precacheKey(path), { cacheName: PRECACHE_NAME }).then(cached => cached || fetch(event.request)));
+  } else if (url.origin === scope.origin ? event.request.destination === "image" : ["script", "style", "font"].includes(event.request.destination)) {
+    // Large images, and Vue, Font Awesome and Inter from their CDNs
+    event.respondWith(staleWhileRevalidate(event));
+  }
+});
@@ -1,24 +1,70 @@
 #!/usr/bin/env node
 /**
  * Fetches citation counts from Semantic Scholar and OpenAlex APIs,
- * updates js/data.js with the latest citation data.
- * Run via: node scripts/update-citations.js
+ * caches them in data/citations.json and updates js/data.js with the latest citation data
+ * (for --split builds, its "core" chunk) and the precache revisions in sw.js.
+ * Run via: node scripts/update-citations.js [--snapshot FILE] [--snapshot-only] [--refresh]
+ *
+ *   --snapshot FILE   where to cache the fetched counts (default: data/citations.json)
+ *   --snapshot-only   only refresh the snapshot; scripts/build-data.py merges it into js/data.js
+ *   --refresh         fetch even when the snapshot is younger than its TTL
+ *
+ * Set CITATION_API_FIXTURE to a JSON file of canned responses (keyed by host + path)
+ * to run offline against a local stand-in for both APIs, as tests/run-tests.js does.
  */
 
 const fs = require('fs');
 const path = require('path');
+const vm = require('vm');
+const crypto = require('crypto');
+const zlib = require('zlib');
 
-const DATA_FILE = path.join(__dirname, '..', 'js', 'data.js');
+const ROOT = path.join(__dirname, '..');
+const DATA_FILE = path.join(ROOT, 'js', 'data.js');
+const SERVICE_WORKER_FILE = path.join(ROOT, 'sw.js');
+const SNAPSHOT_FILE = path.join(ROOT, 'data', 'citations.json');
+const DATA_MANIFEST_LINE = /^const DATA_MANIFEST\s*=\s*(.*);$/m;
+const PRECACHE_LINE = /^const PRECACHE = ({[\s\S]*?});$/m;
+const REVISION_LENGTH = 10; // CHUNK_HASH_LENGTH in scripts/build-data.py
+const SNAPSHOT_VERSION = 1;
+const SNAPSHOT_TTL_HOURS = 24;
 const AUTHOR_QUERY = 'Ryotaro+Shimizu+ZOZO';
 const OPENALEX_AUTHOR_SEARCH = 'Ryotaro%20Shimizu';
 const EMAIL = 'roy.taro.shimizu@gmail.com';
 
+// Must stay in step with norm_title() in scripts/build-data.py
 function normTitle(s) {
   if (!s) return '';
   return s.toLowerCase().replace(/[^a-z0-9]/g, '').slice(0, 50);
 }
 
+function parseArgs(argv) {
+  const args = { snapshot: SNAPSHOT_FILE, snapshotOnly: false, refresh: false };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--snapshot') {
+      args.snapshot = path.resolve(argv[++i]);
+    } else if (argv[i] === '--snapshot-only') {
+      args.snapshotOnly = true;
+    } else if (argv[i] === '--refresh') {
+      args.refresh = true;
+    } else {
+      console.error(`Unknown argument: ${argv[i]}`);
+      process.exit(1);
+    }
+  }
+  return args;
+}
+
+const fixture = process.env.CITATION_API_FIXTURE
+  ? JSON.parse(fs.readFileSync(process.env.CITATION_API_FIXTURE, 'utf-8'))
+  : null;
+
 async function fetchJSON(url) {
+  if (fixture) {
+    const { host, pathname } = new URL(url);
+    if (!(`${host}${pathname}` in fixture)) throw new Error(`HTTP 404: ${url}`);
+    return fixture[`${host}${pathname}`];
+  }
   const res = await fetch(url);
   if (!res.ok) throw new Error(`HTTP ${res.status}: ${url}`);
   return res.json();
@@ -58,70 +104,109 @@ async function fetchOpenAlex() {
   return works.results.map(w => ({ title: w.title, citations: w.cited_by_count || 0 }));
 }
 
-async function main() {
-  let papers = [];
+// Highest count per normalized title across both sources
+function mergePapers(citations, papers) {
+  papers.forEach(paper => {
+    const key = normTitle(paper.title);
+    if (!key || paper.citations <= 0) return;
+    citations[key] = Math.max(citations[key] || 0, paper.citations);
+  });
+}
+
+async function fetchSnapshot() {
+  const citations = {};
+  const sources = [];
 
   // Try Semantic Scholar first, then OpenAlex as fallback
   try {
-    papers = await fetchSemanticScholar();
+    mergePapers(citations, await fetchSemanticScholar());
+    sources.push('semanticscholar');
   } catch (e) {
     console.log(`  S2 failed: ${e.message}, trying OpenAlex...`);
-    try {
-      papers = await fetchOpenAlex();
-    } catch (e2) {
-      console.error(`  OpenAlex also failed: ${e2.message}`);
+  }
+
+  // Also merge OpenAlex data for papers S2 might miss
+  try {
+    mergePapers(citations, await fetchOpenAlex());
+    sources.push('openalex');
+  } catch (e) {
+    if (!sources.length) {
+      console.error(`  OpenAlex also failed: ${e.message}`);
       process.exit(1);
     }
+    // OpenAlex merge is optional
   }
 
-  // Also try to merge OpenAlex data for papers S2 might miss
+  return {
+    version: SNAPSHOT_VERSION,
+    fetched: new Date().toISOString(),
+    ttlHours: SNAPSHOT_TTL_HOURS,
+    sources,
+    citations
+  };
+}
+
+function readSnapshot(file) {
   try {
-    const oaPapers = await fetchOpenAlex();
-    oaPapers.forEach(oap => {
-      const existing = papers.find(p => normTitle(p.title) === normTitle(oap.title));
-      if (existing) {
-        existing.citations = Math.max(existing.citations, oap.citations);
-      } else {
-        papers.push(oap);
-      }
-    });
+    const snapshot = JSON.parse(fs.readFileSync(file, 'utf-8'));
+    return snapshot.version === SNAPSHOT_VERSION ? snapshot : null;
   } catch (e) {
-    // OpenAlex merge is optional
+    return null;
   }
+}
+
+function isFresh(snapshot) {
+  return Date.now() - Date.parse(snapshot.fetched) < snapshot.ttlHours * 3600 * 1000;
+}
+
+function writeSnapshot(file, snapshot) {
+  fs.mkdirSync(path.dirname(file), { recursive: true });
+  const tmp = `${file}.tmp`;
+  fs.writeFileSync(tmp, JSON.stringify(snapshot, null, 1) + '\n', 'utf-8');
+  fs.renameSync(tmp, file);
+}
 
-  // Read data.js
-  let content = fs.readFileSync(DATA_FILE, 'utf-8');
+// Replace the JSON value of a `const NAME = {...};` line, keeping the line's own spacing
+// (build-data.py --release minifies it)
+function replaceJSON(content, line, value) {
+  return content.replace(line, (match, json) => match.replace(json, () => JSON.stringify(value)));
+}
+
+function revision(content) {
+  return crypto.createHash('sha256').update(content).digest('hex').slice(0, REVISION_LENGTH);
+}
 
+// Rewrite the citation counts (and the totals derived from them) in the file defining PUBLICATIONS
+function updatePublications(content, citations) {
+  // One pass over the publication entries, each looked up by normalized title
+  // Match pattern: title:"...", ... citations:N
+  // (keys are quoted when data.js is built with --format json)
   let updated = 0;
-  papers.forEach(paper => {
-    if (!paper.title || paper.citations <= 0) return;
-
-    // Find matching publication entry by title and update citation count
-    const normP = normTitle(paper.title);
-    // Match pattern: title:"...", ... citations:N
-    const regex = new RegExp(
-      `(title:"[^"]*"[^}]*citations:)(\\d+)`,
-      'g'
-    );
-
-    let match;
-    while ((match = regex.exec(content)) !== null) {
-      const entryTitle = match[1].match(/title:"([^"]*)"/)?.[1];
-      if (entryTitle && normTitle(entryTitle) === normP) {
-        const oldCit = parseInt(match[2]);
-        const newCit = Math.max(oldCit, paper.citations);
-        if (newCit > oldCit) {
-          content = content.slice(0, match.index) +
-            match[1] + newCit +
-            content.slice(match.index + match[0].length);
-          updated++;
-          console.log(`  Updated: "${entryTitle}" ${oldCit} → ${newCit}`);
-        }
-        break;
-      }
-    }
+  content = content.replace(/(title"?:"[^"]*"[^}]*citations"?:)(\d+)/g, (match, head, count) => {
+    const entryTitle = head.match(/title"?:"([^"]*)"/)?.[1];
+    const oldCit = parseInt(count);
+    const newCit = citations[normTitle(entryTitle)];
+    if (!(newCit > oldCit)) return match;
+    updated++;
+    console.log(`  Updated: "${entryTitle}" ${oldCit} → ${newCit}`);
+    return head + newCit;
   });
 
+  // Keep the citation totals precomputed by build-data.py in step with the new counts
+  const indexLine = /^const PUBLICATION_INDEX\s*=\s*(.*);$/m;
+  const indexMatch = content.match(indexLine);
+  if (indexMatch) {
+    const sandbox = {};
+    vm.runInNewContext(content.replace(/^(const|let)\s+/gm, 'var '), sandbox);
+    const index = JSON.parse(indexMatch[1]);
+    index.citations = { all: 0 };
+    sandbox.PUBLICATIONS.forEach(p => {
+      index.citations[p.type] = (index.citations[p.type] || 0) + p.citations;
+      index.citations.all += p.citations;
+    });
+    content = replaceJSON(content, indexLine, index);
+  }
+
   // Update the comment timestamp
   const today = new Date().toISOString().split('T')[0];
   content = content.replace(
@@ -129,7 +214,81 @@ async function main() {
     `Citation counts via Semantic Scholar API (partial coverage). Last auto-update: ${today}.`
   );
 
-  fs.writeFileSync(DATA_FILE, content, 'utf-8');
+  return { content, updated };
+}
+
+// Updates js/data.js, or for split builds (build-data.py --split) its "core" chunk, which is
+// written under its new content hash and swapped into DATA_MANIFEST. The old chunk is kept
+// for pages that still have the previous js/data.js. Returns the count and the renamed chunks.
+function updateDataFile(citations) {
+  const content = fs.readFileSync(DATA_FILE, 'utf-8');
+  const manifestMatch = content.match(DATA_MANIFEST_LINE);
+  if (!manifestMatch) {
+    const result = updatePublications(content, citations);
+    fs.writeFileSync(DATA_FILE, result.content, 'utf-8');
+    return { updated: result.updated, renamed: {} };
+  }
+
+  const manifest = JSON.parse(manifestMatch[1]);
+  const oldChunk = manifest.core;
+  const oldFile = path.join(ROOT, oldChunk);
+  const result = updatePublications(fs.readFileSync(oldFile, 'utf-8'), citations);
+  const newChunk = oldChunk.replace(/\.[0-9a-f]+\.js$/, `.${revision(result.content)}.js`);
+  if (newChunk === oldChunk) return { updated: result.updated, renamed: {} };
+
+  const newFile = path.join(ROOT, newChunk);
+  fs.writeFileSync(newFile, result.content, 'utf-8');
+  // --release builds serve precompressed siblings; never leave them behind the chunk
+  if (fs.existsSync(`${oldFile}.gz`)) {
+    fs.writeFileSync(`${newFile}.gz`, zlib.gzipSync(result.content, { level: 9 }));
+  }
+  if (fs.existsSync(`${oldFile}.br`)) {
+    fs.writeFileSync(`${newFile}.br`, zlib.brotliCompressSync(result.content, {
+      params: { [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY }
+    }));
+  }
+  manifest.core = newChunk;
+  fs.writeFileSync(DATA_FILE, replaceJSON(content, DATA_MANIFEST_LINE, manifest), 'utf-8');
+  return { updated: result.updated, renamed: { [oldChunk]: newChunk } };
+}
+
+// Keep sw.js's precache manifest (written by build-data.py) in step with js/data.js and
+// any renamed chunk, so returning visitors' service workers precache the new counts
+function updateServiceWorker(renamed) {
+  if (!fs.existsSync(SERVICE_WORKER_FILE)) return;
+  const content = fs.readFileSync(SERVICE_WORKER_FILE, 'utf-8');
+  const match = content.match(PRECACHE_LINE);
+  if (!match) return;
+  const precache = {};
+  Object.entries(JSON.parse(match[1])).forEach(([file, rev]) => {
+    const current = renamed[file] || file;
+    precache[current] = current === 'js/data.js' || file in renamed
+      ? revision(fs.readFileSync(path.join(ROOT, current)))
+      : rev;
+  });
+  fs.writeFileSync(SERVICE_WORKER_FILE, content.replace(PRECACHE_LINE, () => `const PRECACHE = ${JSON.stringify(precache, null, 1)};`), 'utf-8');
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const snapshotName = path.relative(process.cwd(), args.snapshot);
+
+  let snapshot = readSnapshot(args.snapshot);
+  if (snapshot && isFresh(snapshot) && !args.refresh) {
+    console.log(`Using ${snapshotName} fetched ${snapshot.fetched} (TTL ${snapshot.ttlHours}h, --refresh to refetch)`);
+  } else {
+    snapshot = await fetchSnapshot();
+    writeSnapshot(args.snapshot, snapshot);
+    console.log(`Cached ${Object.keys(snapshot.citations).length} citation counts in ${snapshotName}`);
+  }
+
+  if (args.snapshotOnly) {
+    console.log('\nDone. Run python scripts/build-data.py to merge the snapshot into js/data.js.');
+    return;
+  }
+
+  const { updated, renamed } = updateDataFile(snapshot.citations);
+  updateServiceWorker(renamed);
   console.log(`\nDone. Updated ${updated} citation counts.`);
 }
 
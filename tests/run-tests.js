@@ -212,8 +212,7 @@ function testCSSContent() {
 function testJavaScriptContent() {
   log('\n⚙️  Testing JavaScript Content...', 'cyan');
   
-  const dataPath = path.join(__dirname, '..', 'js', 'data.js');
-  const data = fs.readFileSync(dataPath, 'utf-8');
+  const data = readDataSources().join('\n');
   
   // Test data structures
   if (assert(data.includes('TRANSLATIONS'), 'data.js should define TRANSLATIONS')) {
@@ -270,17 +269,271 @@ function testJavaScriptContent() {
   }
 }
 
-function loadDataFile() {
-  const vm = require('vm');
-  const dataPath = path.join(__dirname, '..', 'js', 'data.js');
+function readDataManifest(dataContent) {
+  const match = dataContent.match(/^const DATA_MANIFEST\s*=\s*(.*);$/m);
+  return match ? JSON.parse(match[1]) : null;
+}
+
+// js/data.js plus, for split builds (build-data.py --split), every chunk it lists
+function readDataSources(root = path.join(__dirname, '..')) {
+  const dataPath = path.join(root, 'js', 'data.js');
   const dataContent = fs.readFileSync(dataPath, 'utf-8');
-  // Replace const/let declarations with var so they become sandbox properties
-  const execContent = dataContent.replace(/^(const|let)\s+/gm, 'var ');
-  const sandbox = {};
-  vm.runInNewContext(execContent, sandbox);
+  const manifest = readDataManifest(dataContent) || {};
+  const chunks = Object.values(manifest).map(chunk => fs.readFileSync(path.join(root, chunk), 'utf-8'));
+  return [dataContent, ...chunks];
+}
+
+function evaluateDataFile(root) {
+  const vm = require('vm');
+  const sandbox = vm.createContext({});
+  readDataSources(root).forEach(content => {
+    // Replace const/let declarations with var so they become sandbox properties
+    const execContent = content.replace(/^(const|let)\s+/gm, 'var ');
+    vm.runInContext(execContent, sandbox);
+  });
+  return sandbox;
+}
+
+function loadDataFile(root) {
+  const sandbox = evaluateDataFile(root);
+  // --format interned: expand author/venue references as decodePublications() in js/app.js does
+  const strings = sandbox.PUBLICATION_STRINGS;
+  if (strings) {
+    sandbox.PUBLICATIONS = sandbox.PUBLICATIONS.map(p => ({ ...p, authors: p.authors.map(i => strings.authors[i]), venue: strings.venues[p.venue] }));
+  }
   return sandbox;
 }
 
+// Runs the copy of scripts/build-data.py in a fixture site (see buildFixtureSite) with
+// `args`. Returns null when python3 is not installed and throws when the build fails.
+function runFixtureBuild(root, args) {
+  const { spawnSync } = require('child_process');
+  const build = spawnSync('python3', [path.join(root, 'scripts', 'build-data.py'), ...args], { encoding: 'utf-8' });
+  if (build.error) return null;
+  if (build.status !== 0) {
+    throw new Error(`build-data.py ${args.join(' ')} failed on the fixture data:\n${build.stderr}`);
+  }
+  return build;
+}
+
+// Runs scripts/build-data.py with `args` on tests/fixtures/data in a scratch copy of the
+// site, to cover build options the committed js/data.js does not use. Returns the copy's
+// root (remove it when done), or null when python3 is not installed.
+function buildFixtureSite(args) {
+  const os = require('os');
+  const root = fs.mkdtempSync(path.join(os.tmpdir(), 'site-'));
+  fs.cpSync(path.join(__dirname, 'fixtures', 'data'), path.join(root, 'data'), { recursive: true });
+  fs.mkdirSync(path.join(root, 'js'));
+  ['index.html', 'scripts/build-data.py', 'scripts/sw.template.js', 'scripts/update-citations.js'].forEach(file => {
+    fs.mkdirSync(path.dirname(path.join(root, file)), { recursive: true });
+    fs.copyFileSync(path.join(__dirname, '..', file), path.join(root, file));
+  });
+  try {
+    if (runFixtureBuild(root, args)) return root;
+  } catch (error) {
+    fs.rmSync(root, { recursive: true, force: true });
+    throw error;
+  }
+  fs.rmSync(root, { recursive: true, force: true });
+  return null;
+}
+
+// Mixed English/Japanese input covering NFKC folding (full- and half-width forms, circled
+// digits, ligatures), case mapping, underscores and CJK bigrams
+const TOKENIZER_SAMPLES = [
+  'LLMOverTab: Tabular Data Augmentation with Language Model-Driven Oversampling',
+  'Ｊｏｕｒｎａｌ of Fashion Ｔｅｃｈ ①② Ⅻ ﬁt',
+  'ﾌｧｯｼｮﾝ推薦システム（JSAI 2023）',
+  '早稲田大学×ZOZO研究所、人々',
+  'Café naïve Straße ÉCOLE İstanbul',
+  'snake_case über_alles 123_456',
+  '「カジュアルな装いとは？」AIがファッション助言',
+  'a 本 x1'
+];
+
+function testSearchTokenizer() {
+  log('\n🔎 Testing Search Tokenizer and Index...', 'cyan');
+
+  const { spawnSync } = require('child_process');
+  const SiteSearch = require(path.join(__dirname, '..', 'js', 'search.js'));
+  const tokenize = spawnSync('python3', ['-c', [
+    'import importlib.util, json, sys',
+    'spec = importlib.util.spec_from_file_location("build_data", sys.argv[1])',
+    'module = importlib.util.module_from_spec(spec)',
+    'spec.loader.exec_module(module)',
+    'print(json.dumps([list(module.tokenize(text)) for text in json.load(sys.stdin)]))'
+  ].join('\n'), path.join(__dirname, '..', 'scripts', 'build-data.py')], {
+    input: JSON.stringify(TOKENIZER_SAMPLES),
+    encoding: 'utf-8'
+  });
+  if (tokenize.error) {
+    log('  - python3 not found, skipping', 'yellow');
+    return;
+  }
+  if (!assert(tokenize.status === 0, `build-data.py tokenize() should run: ${tokenize.stderr}`)) {
+    log('  ✗ build-data.py tokenize() failed', 'red');
+    return;
+  }
+
+  // The index is built with Python's tokenize() and queried with js/search.js's
+  const expected = JSON.parse(tokenize.stdout);
+  const mismatches = TOKENIZER_SAMPLES.filter((text, i) => JSON.stringify(SiteSearch.tokenize(text)) !== JSON.stringify(expected[i]));
+  if (assert(mismatches.length === 0, 'build-data.py and js/search.js should tokenize identically')) {
+    log(`  ✓ ${TOKENIZER_SAMPLES.length} samples tokenize identically in Python and JS`, 'green');
+  } else {
+    mismatches.forEach(text => log(`  ✗ Tokenizers disagree on ${JSON.stringify(text)}`, 'red'));
+  }
+
+  const root = buildFixtureSite([]);
+  try {
+    const sandbox = evaluateDataFile(root);
+    const index = SiteSearch.prepare(JSON.parse(fs.readFileSync(path.join(root, sandbox.SEARCH_INDEX_URL), 'utf-8')));
+    // Positions in tests/fixtures/data/{publications,talks,media}.csv
+    const queries = {
+      'tabular': { publications: [0, 1], talks: [], media: [] },
+      'goto isom': { publications: [0, 1], talks: [], media: [] },
+      'journal': { publications: [3], talks: [], media: [] },
+      '推薦': { publications: [4], talks: [2], media: [] },
+      'ファッション': { publications: [4], talks: [0, 1, 2], media: [1] },
+      '日本経済': { publications: [], talks: [], media: [1] },
+      'ＩＣＬＲ 2026': { publications: [], talks: [], media: [0] },
+      'nonexistent': { publications: [], talks: [], media: [] }
+    };
+    Object.entries(queries).forEach(([query, hits]) => {
+      const result = SiteSearch.query(index, query);
+      const found = Object.fromEntries(Object.entries(result).map(([name, docs]) => [name, [...docs].sort((a, b) => a - b)]));
+      if (assert(JSON.stringify(found) === JSON.stringify(hits), `Search for "${query}" should return ${JSON.stringify(hits)}`)) {
+        log(`  ✓ "${query}"`, 'green');
+      } else {
+        log(`  ✗ "${query}" returned ${JSON.stringify(found)}`, 'red');
+      }
+    });
+  } finally {
+    fs.rmSync(root, { recursive: true, force: true });
+  }
+}
+
+function testReleaseBuild() {
+  log('\n🗜️  Testing Minified Release Builds...', 'cyan');
+
+  const datasets = ['PUBLICATIONS', 'PUBLICATION_INDEX', 'TRANSLATIONS', 'TALKS', 'MEDIA'];
+  for (const format of ['literal', 'json', 'interned']) {
+    const plain = buildFixtureSite(['--format', format]);
+    if (!plain) {
+      log('  - python3 not found, skipping', 'yellow');
+      return;
+    }
+    const release = buildFixtureSite(['--format', format, '--release']);
+    try {
+      // minify_js() only drops whitespace and comments, so both builds must define the same data
+      const expected = loadDataFile(plain);
+      const actual = loadDataFile(release);
+      const smaller = fs.statSync(path.join(release, 'js', 'data.js')).size < fs.statSync(path.join(plain, 'js', 'data.js')).size;
+      const differing = datasets.filter(name => expected[name] === undefined || JSON.stringify(actual[name]) !== JSON.stringify(expected[name]));
+      if (assert(differing.length === 0 && smaller, `--release --format ${format} should define the same data as the unminified build`)) {
+        log(`  ✓ --format ${format}: minified output defines the same ${datasets.join(', ')}`, 'green');
+      } else {
+        log(`  ✗ --format ${format}: ${differing.join(', ') || 'js/data.js was not minified'} differ after minification`, 'red');
+      }
+    } finally {
+      fs.rmSync(plain, { recursive: true, force: true });
+      fs.rmSync(release, { recursive: true, force: true });
+    }
+  }
+}
+
+function testUnchangedRebuild() {
+  log('\n♻️  Testing Unchanged Rebuilds...', 'cyan');
+
+  // A rebuild with nothing changed must not touch the outputs, so hosts and
+  // browser caches keep treating them as unchanged
+  const mtimes = (root, files) => files.map(file => fs.statSync(path.join(root, file)).mtimeMs);
+  const plain = buildFixtureSite([]);
+  if (!plain) {
+    log('  - python3 not found, skipping', 'yellow');
+    return;
+  }
+  try {
+    const files = ['js/data.js', 'sw.js', 'index.html'];
+    const before = mtimes(plain, files);
+    const rebuild = runFixtureBuild(plain, []);
+    if (assert(JSON.stringify(mtimes(plain, files)) === JSON.stringify(before) && rebuild.stdout.includes('up to date, not rewritten'),
+      'An unchanged rebuild should leave js/data.js, sw.js and index.html untouched')) {
+      log('  ✓ js/data.js, sw.js and index.html keep their mtimes', 'green');
+    } else {
+      log('  ✗ An unchanged rebuild rewrote its outputs', 'red');
+    }
+  } finally {
+    fs.rmSync(plain, { recursive: true, force: true });
+  }
+
+  const release = buildFixtureSite(['--release']);
+  try {
+    const files = ['js/data.js', 'js/data.js.gz'];
+    const before = mtimes(release, files);
+    runFixtureBuild(release, ['--release']);
+    if (assert(JSON.stringify(mtimes(release, files)) === JSON.stringify(before), 'An unchanged --release rebuild should keep js/data.js and its .gz untouched')) {
+      log('  ✓ --release: js/data.js and js/data.js.gz keep their mtimes', 'green');
+    } else {
+      log('  ✗ --release rewrote unchanged outputs', 'red');
+    }
+  } finally {
+    fs.rmSync(release, { recursive: true, force: true });
+  }
+}
+
+function testInternedStrings() {
+  log('\n🔤 Testing Interned Author/Venue Tables...', 'cyan');
+
+  const sandbox = evaluateDataFile();
+  const strings = sandbox.PUBLICATION_STRINGS;
+  if (!strings) {
+    log('  - js/data.js was not built with --format interned, skipping', 'yellow');
+    return;
+  }
+
+  const pubs = sandbox.PUBLICATIONS;
+  const dangling = pubs.filter(p => !(p.venue in strings.venues) || p.authors.some(i => !(i in strings.authors)));
+  if (assert(dangling.length === 0, 'Every author/venue reference should resolve to a string table entry')) {
+    log(`  ✓ ${strings.authors.length} authors and ${strings.venues.length} venues cover ${pubs.length} publications`, 'green');
+  } else {
+    log(`  ✗ ${dangling.length} publications have dangling references`, 'red');
+  }
+  ['authors', 'venues'].forEach(table => {
+    if (!assert(new Set(strings[table]).size === strings[table].length, `PUBLICATION_STRINGS.${table} should not repeat names`)) {
+      log(`  ✗ PUBLICATION_STRINGS.${table} has duplicates`, 'red');
+    }
+  });
+}
+
+function testDataChunks() {
+  log('\n📦 Testing Split Data Chunks...', 'cyan');
+
+  const crypto = require('crypto');
+  const dataPath = path.join(__dirname, '..', 'js', 'data.js');
+  const manifest = readDataManifest(fs.readFileSync(dataPath, 'utf-8'));
+  if (!manifest) {
+    log('  - js/data.js is a single bundle, skipping', 'yellow');
+    return;
+  }
+
+  ['core', 'translations-en', 'translations-ja', 'talks', 'media'].forEach(name => {
+    const chunk = manifest[name];
+    const chunkPath = chunk && path.join(__dirname, '..', chunk);
+    if (!assert(chunkPath && fs.existsSync(chunkPath), `Data chunk "${name}" should exist`)) {
+      log(`  ✗ Data chunk "${name}" is missing`, 'red');
+      return;
+    }
+    // Chunk names embed a content hash so they can be cached immutably
+    const hash = crypto.createHash('sha256').update(fs.readFileSync(chunkPath)).digest('hex');
+    if (assert(chunk.includes(`.${hash.slice(0, 10)}.`), `Data chunk "${name}" name should match its content hash`)) {
+      log(`  ✓ ${chunk}`, 'green');
+    } else {
+      log(`  ✗ ${chunk} does not match its content hash`, 'red');
+    }
+  });
+}
+
 function testPublicationSorting() {
   log('\n📚 Testing Publication Sorting...', 'cyan');
 
@@ -361,6 +614,323 @@ function testPublicationSorting() {
   }
 }
 
+function testPublicationIndex() {
+  log('\n🗂️  Testing Precomputed Publication Index...', 'cyan');
+
+  const sandbox = loadDataFile();
+  const pubs = sandbox.PUBLICATIONS;
+  const index = sandbox.PUBLICATION_INDEX;
+  if (!index) {
+    log('  - PUBLICATION_INDEX not present (data.js predates build-data.py indexes), skipping', 'yellow');
+    return;
+  }
+
+  // Must match the runtime filter + sort in js/app.js exactly
+  const MONTH_ORDER = {Jan:0,Feb:1,Mar:2,Apr:3,May:4,Jun:5,Jul:6,Aug:7,Sep:8,Oct:9,Nov:10,Dec:11};
+  function sortKey(p) {
+    if (p.date) {
+      const parts = p.date.split(' ');
+      if (parts.length === 2 && MONTH_ORDER[parts[0]] !== undefined) {
+        return p.year * 12 + MONTH_ORDER[parts[0]];
+      }
+    }
+    return p.year * 12;
+  }
+  const positions = pubs.map((p, i) => i);
+  const expected = {
+    year: [...positions].sort((a, b) => sortKey(pubs[b]) - sortKey(pubs[a])),
+    oldest: [...positions].sort((a, b) => sortKey(pubs[a]) - sortKey(pubs[b]))
+  };
+
+  const types = [...new Set(pubs.map(p => p.type))];
+  ['year', 'oldest'].forEach(sort => {
+    const allMatch = JSON.stringify(index.order[sort]) === JSON.stringify(expected[sort]);
+    if (assert(allMatch, `PUBLICATION_INDEX.order.${sort} should match the runtime sort`)) {
+      log(`  ✓ order.${sort} matches runtime sort`, 'green');
+    } else {
+      log(`  ✗ order.${sort} differs from runtime sort`, 'red');
+    }
+    types.forEach(type => {
+      const want = expected[sort].filter(i => pubs[i].type === type);
+      const got = index.byType[type] && index.byType[type][sort];
+      if (!assert(JSON.stringify(got) === JSON.stringify(want), `PUBLICATION_INDEX.byType.${type}.${sort} should match the runtime filter`)) {
+        log(`  ✗ byType.${type}.${sort} differs from runtime filter`, 'red');
+      }
+    });
+  });
+
+  const totalCitations = pubs.reduce((sum, p) => sum + p.citations, 0);
+  if (assert(index.counts.all === pubs.length && index.citations.all === totalCitations, 'PUBLICATION_INDEX counts and citation totals should match PUBLICATIONS')) {
+    log(`  ✓ ${index.counts.all} publications, ${index.citations.all} citations`, 'green');
+  } else {
+    log('  ✗ PUBLICATION_INDEX counts or citation totals are stale', 'red');
+  }
+}
+
+function testPrerenderedLists() {
+  log('\n🖼️  Testing Pre-rendered Lists...', 'cyan');
+
+  const html = fs.readFileSync(path.join(__dirname, '..', 'index.html'), 'utf-8');
+  const match = html.match(/<!-- prerender:start -->([\s\S]*?)<!-- prerender:end -->/);
+  if (!assert(match, 'index.html should keep the markers build-data.py --prerender writes between')) {
+    log('  ✗ prerender markers are missing from index.html', 'red');
+    return;
+  }
+  const block = match[1];
+  if (!block.trim()) {
+    log('  - index.html was not built with --prerender, skipping', 'yellow');
+    return;
+  }
+
+  // The Vue template already uses the section ids; duplicates would break anchors
+  if (assert(!/\sid="(?!prerender")/.test(block), 'Pre-rendered markup should not repeat element ids')) {
+    log('  ✓ No duplicate ids', 'green');
+  } else {
+    log('  ✗ Pre-rendered markup repeats element ids', 'red');
+  }
+
+  // It should show exactly what the app first renders from js/data.js
+  const sandbox = loadDataFile();
+  const unescape = s => s.replace(/&quot;/g, '"').replace(/&#x27;/g, "'").replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&amp;/g, '&');
+  const titles = [...block.matchAll(/<h3 class="pub-title">(?:<a [^>]*>)?(.*?)(?: <i |<\/)/g)].map(m => unescape(m[1]));
+  const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+  const sortKey = p => p.year * 12 + Math.max(0, MONTHS.indexOf((p.date || '').split(' ')[0]));
+  const newest = [...sandbox.PUBLICATIONS].sort((a, b) => sortKey(b) - sortKey(a)).slice(0, 5);
+  const expected = newest.map(p => p.title);
+  if (assert(JSON.stringify(titles) === JSON.stringify(expected), 'Pre-rendered publications should match the newest five in js/data.js')) {
+    log(`  ✓ ${titles.length} publications match js/data.js`, 'green');
+  } else {
+    log(`  ✗ Pre-rendered publications are stale: ${JSON.stringify(titles)}`, 'red');
+  }
+  const counts = { 'news-item': Math.min(4, sandbox.TRANSLATIONS.en['news.items'].length), 'talk-item': Math.min(3, sandbox.TALKS.length) };
+  Object.entries(counts).forEach(([cls, count]) => {
+    const found = (block.match(new RegExp(`class="${cls}"`, 'g')) || []).length;
+    if (!assert(found === count, `Pre-rendered markup should have ${count} .${cls} elements`)) {
+      log(`  ✗ ${found} .${cls} elements, expected ${count}`, 'red');
+    }
+  });
+
+  // Headings and badges should read exactly as the app renders them in English
+  const en = sandbox.TRANSLATIONS.en;
+  const texts = pattern => [...block.matchAll(pattern)].map(m => unescape(m[1]));
+  // talkType() and pubTypeLabel() in js/app.js
+  const talkTypes = { invited: en['talks.invited'], award: en['talks.award'], presentation: en['talks.presentation'], conference: en['talks.conference'], workshop: en['talks.workshop'], domestic: en['talks.domestic'] };
+  const pubTypes = { conference: 'Conference', journal: 'Journal', workshop: 'Workshop', preprint: 'Preprint', domestic: 'Domestic' };
+  const labels = {
+    'Section headings': [texts(/<h2 class="section-title">(.*?)<\/h2>/g), [en['news.title'], en['pub.title'], en['talks.title']]],
+    'Publications subtitle': [texts(/<p class="section-subtitle">([\s\S]*?)<\/p>/g).map(html => html.replace(/<[^>]+>/g, '').trim()), [`${en['pub.subtitle']} ${en['pub.scholarLink']}`]],
+    'Talk type badges': [texts(/<span class="talk-type [^"]*">(.*?)<\/span>/g), sandbox.TALKS.slice(0, 3).map(talk => talkTypes[talk.type] || talk.type)],
+    'Publication type badges': [texts(/<span class="pub-type-badge [^"]*">(.*?)<\/span>/g), newest.map(p => pubTypes[p.type] || p.type)]
+  };
+  Object.entries(labels).forEach(([name, [found, wanted]]) => {
+    if (assert(JSON.stringify(found) === JSON.stringify(wanted), `${name} should match js/data.js`)) {
+      log(`  ✓ ${name}: ${found.join(', ')}`, 'green');
+    } else {
+      log(`  ✗ ${name}: ${JSON.stringify(found)}, expected ${JSON.stringify(wanted)}`, 'red');
+    }
+  });
+}
+
+function testPrerenderRefresh() {
+  log('\n🔁 Testing Pre-rendered Lists Stay Current...', 'cyan');
+
+  const root = buildFixtureSite(['--prerender']);
+  if (!root) {
+    log('  - python3 not found, skipping', 'yellow');
+    return;
+  }
+  try {
+    // A plain build after --prerender must not leave the old lists in index.html
+    const title = 'A Publication Newer Than Every Fixture Row';
+    fs.appendFileSync(path.join(root, 'data', 'publications.csv'), `${title},Ryotaro Shimizu,ICML,2099,Jul 2099,conference,0,\n`);
+    runFixtureBuild(root, []);
+    const html = fs.readFileSync(path.join(root, 'index.html'), 'utf-8');
+    const first = html.match(/<h3 class="pub-title">(?:<a [^>]*>)?(.*?)(?: <i |<\/)/);
+    if (assert(first && first[1] === title, 'A plain build should refresh an existing pre-rendered block')) {
+      log('  ✓ Plain build refreshed the pre-rendered publications', 'green');
+    } else {
+      log(`  ✗ Pre-rendered block still starts with ${first && first[1]}`, 'red');
+    }
+    const stale = stalePrecacheEntries(root, readPrecacheManifest(root));
+    if (!assert(stale.length === 0, 'sw.js should precache the refreshed index.html')) {
+      log(`  ✗ Stale precache entries: ${stale.join(', ')}`, 'red');
+    }
+  } finally {
+    fs.rmSync(root, { recursive: true, force: true });
+  }
+}
+
+function readPrecacheManifest(root) {
+  const match = fs.readFileSync(path.join(root, 'sw.js'), 'utf-8').match(/^const PRECACHE = ({[\s\S]*?});$/m);
+  return match ? JSON.parse(match[1]) : null;
+}
+
+// Precached files that are missing or whose content no longer matches their revision
+function stalePrecacheEntries(root, manifest) {
+  const crypto = require('crypto');
+  return Object.entries(manifest).filter(([file, revision]) => {
+    const filePath = path.join(root, file);
+    return !fs.existsSync(filePath) ||
+      crypto.createHash('sha256').update(fs.readFileSync(filePath)).digest('hex').slice(0, revision.length) !== revision;
+  }).map(([file]) => file);
+}
+
+function testServiceWorker() {
+  log('\n📴 Testing Service Worker Precache Manifest...', 'cyan');
+
+  const root = path.join(__dirname, '..');
+  if (!fs.existsSync(path.join(root, 'sw.js'))) {
+    log('  - sw.js not built yet, skipping', 'yellow');
+    return;
+  }
+  const manifest = readPrecacheManifest(root);
+  if (!assert(manifest, 'sw.js should define a PRECACHE manifest')) {
+    log('  ✗ PRECACHE manifest not found in sw.js', 'red');
+    return;
+  }
+  ['index.html', 'style.css', 'js/app.js', 'js/data.js'].forEach(file => {
+    if (!assert(file in manifest, `sw.js should precache ${file}`)) {
+      log(`  ✗ ${file} is not precached`, 'red');
+    }
+  });
+
+  // A stale revision would keep serving the old file; after editing a precached file by
+  // hand, python scripts/build-data.py --sw-only refreshes the revisions without a rebuild
+  const stale = stalePrecacheEntries(path.join(__dirname, '..'), manifest);
+  if (assert(stale.length === 0, 'sw.js revisions should match the files on disk (run python scripts/build-data.py --sw-only)')) {
+    log(`  ✓ ${Object.keys(manifest).length} precached files match their revisions`, 'green');
+  } else {
+    log(`  ✗ Stale or missing precache entries: ${stale.join(', ')}`, 'red');
+    log('    Run python scripts/build-data.py --sw-only to refresh them', 'yellow');
+  }
+}
+
+function testCitationSnapshot() {
+  log('\n📈 Testing Citation Snapshot (offline API stand-in)...', 'cyan');
+
+  const { spawnSync } = require('child_process');
+  const os = require('os');
+  const script = path.join(__dirname, '..', 'scripts', 'update-citations.js');
+  const dataPath = path.join(__dirname, '..', 'js', 'data.js');
+  const tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'citations-'));
+  const snapshotPath = path.join(tmpDir, 'citations.json');
+  const emptyFixture = path.join(tmpDir, 'empty.json');
+  fs.writeFileSync(emptyFixture, '{}');
+  const dataBefore = fs.readFileSync(dataPath, 'utf-8');
+
+  function run(fixture) {
+    return spawnSync(process.execPath, [script, '--snapshot', snapshotPath, '--snapshot-only'], {
+      env: { ...process.env, CITATION_API_FIXTURE: fixture },
+      encoding: 'utf-8'
+    });
+  }
+
+  try {
+    const first = run(path.join(__dirname, 'fixtures', 'citation-api.json'));
+    if (!assert(first.status === 0, `update-citations.js should succeed against the fixture: ${first.stderr}`)) {
+      log('  ✗ update-citations.js failed against the fixture', 'red');
+      return;
+    }
+    const snapshot = JSON.parse(fs.readFileSync(snapshotPath, 'utf-8'));
+    const expected = {
+      sparseattentionisallyouneedforpretrainingontabular: 11,
+      disentanglinglikesanddislikesinpersonalizedgenerat: 4,
+      llmovertabtabulardataaugmentationwithlanguagemodel: 9
+    };
+    if (assert(JSON.stringify(snapshot.citations) === JSON.stringify(expected),
+      'Snapshot should hold the highest count per normalized title from both APIs')) {
+      log(`  ✓ ${Object.keys(expected).length} counts merged from S2 and OpenAlex by normalized title`, 'green');
+    } else {
+      log(`  ✗ Unexpected snapshot counts: ${JSON.stringify(snapshot.citations)}`, 'red');
+    }
+    if (assert(snapshot.version === 1 && !isNaN(Date.parse(snapshot.fetched)) && snapshot.ttlHours > 0,
+      'Snapshot should record its version, fetch time and TTL')) {
+      log('  ✓ Snapshot records fetch time and TTL', 'green');
+    } else {
+      log('  ✗ Snapshot is missing version, fetch time or TTL', 'red');
+    }
+
+    // Every request would 404 now, so success means the fresh snapshot was reused
+    const second = run(emptyFixture);
+    if (assert(second.status === 0 && second.stdout.includes('Using'), 'A fresh snapshot should be reused without fetching')) {
+      log('  ✓ Fresh snapshot reused without fetching', 'green');
+    } else {
+      log('  ✗ Fresh snapshot was not reused', 'red');
+    }
+
+    if (assert(fs.readFileSync(dataPath, 'utf-8') === dataBefore, '--snapshot-only should not modify js/data.js')) {
+      log('  ✓ --snapshot-only leaves js/data.js untouched', 'green');
+    } else {
+      log('  ✗ --snapshot-only modified js/data.js', 'red');
+    }
+
+    // build-data.py falls back silently only for the default data/citations.json
+    const buildScript = path.join(__dirname, '..', 'scripts', 'build-data.py');
+    const missing = spawnSync('python3', [buildScript, '--citations', path.join(tmpDir, 'missing.json')], { encoding: 'utf-8' });
+    const invalid = spawnSync('python3', [buildScript, '--citations', emptyFixture], { encoding: 'utf-8' });
+    if (missing.error) {
+      log('  - python3 not found, skipping --citations checks', 'yellow');
+    } else if (assert(missing.status !== 0 && invalid.status !== 0 && /--citations/.test(missing.stderr + invalid.stderr),
+      'build-data.py --citations should fail on a missing or invalid snapshot')) {
+      log('  ✓ build-data.py rejects a missing or invalid --citations file', 'green');
+    } else {
+      log('  ✗ build-data.py ignored a missing or invalid --citations file', 'red');
+    }
+  } finally {
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  }
+}
+
+function testSplitCitationUpdate() {
+  log('\n🧩 Testing Citation Updates of Split Builds...', 'cyan');
+
+  const { spawnSync } = require('child_process');
+  const root = buildFixtureSite(['--split']);
+  if (!root) {
+    log('  - python3 not found, skipping', 'yellow');
+    return;
+  }
+  try {
+    const dataPath = path.join(root, 'js', 'data.js');
+    const before = readDataManifest(fs.readFileSync(dataPath, 'utf-8'));
+    const update = spawnSync(process.execPath, [path.join(root, 'scripts', 'update-citations.js'), '--snapshot', path.join(root, 'citations.json')], {
+      env: { ...process.env, CITATION_API_FIXTURE: path.join(__dirname, 'fixtures', 'citation-api.json') },
+      encoding: 'utf-8'
+    });
+    if (!assert(update.status === 0, `update-citations.js should succeed on a split build: ${update.stderr}`)) {
+      log('  ✗ update-citations.js failed on a split build', 'red');
+      return;
+    }
+
+    // The counts land in a new core chunk; the old one stays for pages with the old manifest
+    const after = readDataManifest(fs.readFileSync(dataPath, 'utf-8'));
+    if (assert(after.core !== before.core && fs.existsSync(path.join(root, before.core)),
+      'update-citations.js should write a new core chunk and keep the old one')) {
+      log(`  ✓ ${before.core} -> ${after.core}`, 'green');
+    } else {
+      log('  ✗ DATA_MANIFEST still points at the old core chunk', 'red');
+    }
+    const sandbox = loadDataFile(root);
+    const counts = Object.fromEntries(sandbox.PUBLICATIONS.map(p => [p.title.slice(0, 20), p.citations]));
+    const total = sandbox.PUBLICATIONS.reduce((sum, p) => sum + p.citations, 0);
+    if (assert(counts['Sparse Attention Is '] === 11 && counts['LLMOverTab: Tabular '] === 9 && counts['Disentangling Likes '] === 4 &&
+      sandbox.PUBLICATION_INDEX.citations.all === total, 'The new core chunk should hold the fetched counts and their totals')) {
+      log(`  ✓ Counts and PUBLICATION_INDEX totals updated (${total} citations)`, 'green');
+    } else {
+      log(`  ✗ Unexpected counts: ${JSON.stringify(counts)}`, 'red');
+    }
+    const manifest = readPrecacheManifest(root);
+    const stale = stalePrecacheEntries(root, manifest);
+    if (assert(after.core in manifest && stale.length === 0, 'sw.js should precache the new core chunk under its revision')) {
+      log('  ✓ sw.js precaches the new chunk', 'green');
+    } else {
+      log(`  ✗ Stale or missing precache entries: ${stale.join(', ')}`, 'red');
+    }
+  } finally {
+    fs.rmSync(root, { recursive: true, force: true });
+  }
+}
+
 function testTranslationCompleteness() {
   log('\n🌐 Testing Translation Completeness...', 'cyan');
 
@@ -392,6 +962,15 @@ function testTranslationCompleteness() {
     missingInEn.forEach(k => log(`    ✗ Missing EN translation for: "${k}"`, 'red'));
   }
 
+  // The search boxes in index.html have no hardcoded fallback label
+  const searchKeys = ['pub.search', 'talks.search', 'media.search'];
+  const unlabelled = searchKeys.filter(key => !en[key] || !ja[key]);
+  if (assert(unlabelled.length === 0, 'Every search box should have an EN and JA label')) {
+    log(`  ✓ ${searchKeys.join(', ')} present in both languages`, 'green');
+  } else {
+    unlabelled.forEach(key => log(`    ✗ "${key}" missing in EN or JA`, 'red'));
+  }
+
   // Check critical section titles
   const criticalKeys = ['pub.title', 'pub.subtitle', 'exp.title', 'edu.title', 'awards.title', 'service.title', 'news.title', 'media.title', 'teaching.title', 'talks.title'];
   criticalKeys.forEach(key => {
@@ -561,6 +1140,26 @@ function testImageReferences() {
   if (missingImages > 0) {
     log(`  ⚠ ${missingImages} images are missing`, 'yellow');
   }
+
+  // A <source> pointing at a missing variant breaks the image outright, with no fallback
+  const talks = loadDataFile().TALKS || [];
+  const variants = talks
+    .filter(talk => talk.srcset)
+    .flatMap(talk => Object.values(talk.srcset).flatMap(srcset => srcset.split(', ').map(c => c.split(' ')[0])));
+  const missingVariants = variants.filter(v => !fs.existsSync(path.join(__dirname, '..', v)));
+  if (assert(missingVariants.length === 0, `Talk image variants should exist: ${missingVariants.join(', ')}`)) {
+    log(`  ✓ ${variants.length} talk image variants exist`, 'green');
+  } else {
+    log(`  ✗ ${missingVariants.length} talk image variants are missing`, 'red');
+  }
+  // Same for the <picture> sources scripts/build-images.py writes into index.html
+  const htmlVariants = [...html.matchAll(/\ssrcset="([^"]+)"/g)].flatMap(m => m[1].split(', ').map(c => c.split(' ')[0]));
+  const missingHtmlVariants = htmlVariants.filter(v => !fs.existsSync(path.join(__dirname, '..', v)));
+  if (assert(missingHtmlVariants.length === 0, `index.html image variants should exist: ${missingHtmlVariants.join(', ')}`)) {
+    log(`  ✓ ${htmlVariants.length} index.html image variants exist`, 'green');
+  } else {
+    log(`  ✗ ${missingHtmlVariants.length} index.html image variants are missing`, 'red');
+  }
 }
 
 function testDateSortOrder() {
@@ -842,7 +1441,18 @@ function runAllTests() {
     testContactSectionMobile();
     testNavActionsOverflow();
     testTooltipViewportClamping();
+    testDataChunks();
     testPublicationSorting();
+    testPublicationIndex();
+    testInternedStrings();
+    testSearchTokenizer();
+    testReleaseBuild();
+    testUnchangedRebuild();
+    testPrerenderedLists();
+    testPrerenderRefresh();
+    testServiceWorker();
+    testCitationSnapshot();
+    testSplitCitationUpdate();
     testTranslationCompleteness();
     testDateSortOrder();
   } catch (error) {